@@ -3,7 +3,6 @@ from .lookups import (
     EletTewsak,
     FastStartingDays,
     Wengelawyan,
-    EthiopianCalendarMonths,
 )
 from .helper import (
     add_days,
@@ -13,19 +12,35 @@ from .helper import (
     calculate_event_date,
     calculate_ethiopian_to_gregorian,
     calculate_gregorian_to_ethiopian,
+    ethiopian_to_ordinal,
+    get_event_engine,
+    get_month_and_day,
 )
-from typing import Tuple
+from .convert import gregorian_date_to_ethiopian
+from .cache import CacheInfo, LRUCache
+from .formatting import format_ethiopian_date
+from dataclasses import fields
+from datetime import date
+import operator
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    import numpy
 
 
 class BaherHasab:
-    def __init__(self, given_year: int = 2016) -> None:
+    def __init__(self, given_year: int = 2016, engine: str = "nenewe") -> None:
         """
         Initialize the BaherHasab class with the given current year.
 
         Args:
             given_year (int): The current year in the Ethiopian calendar (its 7 or 8 years less than the
                                     Geogorian calendar depending on the season of the year).
+            engine (str): How the movable events are calculated: 'nenewe' (Metke, Nenewe and the
+                                    FastStartingDays lengths) or 'computus' (the closed-form Julian
+                                    computus of Tensae). Both give the same dates.
         """
+        get_event_engine(engine)
         self._abiy_kemer = 532  # also known as abiy awde
         self._awde_mahtot = 76  # also known as mahkelawi awde
         self._awde_tsehay = 28  # also known as nuhase awde
@@ -33,6 +48,56 @@ class BaherHasab:
         self._old_abketa = 11
         self._amet_alem = 5500
         self._given_year = given_year
+        self._engine = engine
+
+    @classmethod
+    def for_year(cls, given_year: int, engine: str = "nenewe") -> "BaherHasab":
+        """
+        Get a shared, read-only instance for the given year from an LRU cache.
+
+        Every derived value of the returned instance is computed when it is created,
+        so repeated calls for hot years only cost a cache lookup.
+
+        Args:
+            given_year (int): The year in the Ethiopian calendar.
+            engine (str): How the movable events are calculated, see ``__init__``.
+
+        Returns:
+            BaherHasab: The shared instance of the year.
+        """
+        # Checked before the cache, so invalid years are never cached; numpy integers
+        # become ints so they share the cache entry
+        given_year = operator.index(given_year)
+        if not 1 <= given_year <= 9999:
+            raise ValueError("Ethiopian year must be a 4-digit integer")
+        return _year_cache.get(
+            (given_year, engine), lambda: _FrozenBaherHasab(given_year, engine)
+        )
+
+    @staticmethod
+    def set_cache_size(maxsize: int) -> None:
+        """
+        Change the number of years kept by ``for_year``.
+
+        Args:
+            maxsize (int): The number of instances kept in the cache.
+        """
+        _year_cache.resize(maxsize)
+
+    @staticmethod
+    def cache_info() -> CacheInfo:
+        """
+        Get the hit/miss statistics of the ``for_year`` cache.
+
+        Returns:
+            CacheInfo: The hits, misses, maximum size and current size.
+        """
+        return _year_cache.info()
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Empty the ``for_year`` cache and reset its statistics."""
+        _year_cache.clear()
 
     def __str__(self) -> str:
         total_years = self.get_total_years()
@@ -76,6 +141,31 @@ class BaherHasab:
         )
     
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get every value of the summary (``__str__``) as a dictionary.
+
+        Returns:
+            Dict[str, Any]: The year, total years, wember, abketa, metke, nenewe, the date of
+                every event and the awde cycles as {"ith", "passed", "remaining"}.
+        """
+        summary: Dict[str, Any] = {
+            "year": self._given_year,
+            "total_years": self.get_total_years(),
+            "wember": self.get_wember(),
+            "abketa": self.get_abketa(),
+            "metke": self.get_metke(),
+            "nenewe": self.get_nenewe(),
+        }
+        summary.update(self.get_all_events())
+        for name, awde in (
+            ("abiy_kemer", self.get_awde_kemer()),
+            ("awde_mahtot", self.get_awde_mahtot()),
+            ("awde_tsehay", self.get_awde_tsehay()),
+        ):
+            summary[name] = dict(zip(("ith", "passed", "remaining"), awde))
+        return summary
+
     def get_total_years(self) -> int:
         """
         Calculate the total years since the creation of the world according to the Ethiopian calendar.
@@ -154,6 +244,8 @@ class BaherHasab:
             Tuple[int, int]: The nenewe day and Metke month.
         """
         nenewe_day, metke_month = self.get_nenewe_date()
+        # get_nenewe_date gives 0 for the last day of a month
+        nenewe_day = nenewe_day or 30
         metke = self.get_metke()
         first_day = self.get_first_day_of_year()
         day_of_metke = add_days(first_day, metke_month + metke - 1)
@@ -176,6 +268,9 @@ class BaherHasab:
         Returns:
             str: The date of the event.
         """
+        if self._engine != "nenewe":
+            day_of_year = self._get_event_day_of_year(event_name)
+            return format_ethiopian_date(None, *get_month_and_day(day_of_year))
 
         total_years = self.get_total_years()
         metke = self.get_metke()
@@ -196,7 +291,45 @@ class BaherHasab:
         )
 
 
-        return f"{EthiopianCalendarMonths().reverse_mapping[month_of_event]} {day_of_event}"
+        return format_ethiopian_date(None, month_of_event, day_of_event)
+
+    def get_event_gregorian_date(self, event_name: str) -> date:
+        """
+        Calculate the Gregorian date of an event.
+
+        Args:
+            event_name (str): The name of the event.
+
+        Returns:
+            date: The Gregorian date of the event.
+        """
+        return date.fromordinal(
+            ethiopian_to_ordinal(self._given_year, 1, 1)
+            - 1
+            + self._get_event_day_of_year(event_name)
+        )
+
+    def _get_event_day_of_year(self, event_name: str) -> int:
+        anchor = get_event_engine(self._engine)(self.get_total_years())
+        return anchor + getattr(FastStartingDays, event_name)
+
+    def get_all_events(self) -> Dict[str, str]:
+        """
+        Calculate the dates of all the events of ``FastStartingDays`` at once.
+
+        Nenewe is calculated once and every event is placed from it.
+
+        Returns:
+            Dict[str, str]: The date of each event (e.g. 'Megabit 2'), in the order of the year.
+        """
+        anchor = get_event_engine(self._engine)(self.get_total_years())
+        events = {}
+        for event in fields(FastStartingDays):
+            day_of_year = anchor + event.default
+            events[event.name] = format_ethiopian_date(
+                None, *get_month_and_day(day_of_year)
+            )
+        return events
 
     def get_hudade(self) -> str:
         """
@@ -353,36 +486,120 @@ class BaherHasab:
         return ith_awde_tsehay, passed_years, reminded_years
 
     def ethiopian_to_gregorian(
-        self, ethiopian_year: int, ethiopian_month: int, ethiopian_day: int
-    ) -> Tuple[int, int, int]:
+        self,
+        ethiopian_year: int,
+        ethiopian_month: int,
+        ethiopian_day: int,
+        as_date: bool = False,
+    ) -> Union[Tuple[int, int, int], date]:
         """Convert an Ethiopian date to a Gregorian date.
 
         Args:
             ethiopian_year (int): The Ethiopian year.
             ethiopian_month (int): The Ethiopian month.
             ethiopian_day (int): The Ethiopian day.
+            as_date (bool): Return a ``datetime.date`` instead of a tuple.
 
         Returns:
-            Tuple[int, int, int]: The Gregorian year, month, and day.
+            Tuple[int, int, int] | date: The Gregorian year, month, and day.
         """
-
-        return calculate_ethiopian_to_gregorian(
+        gregorian = calculate_ethiopian_to_gregorian(
             ethiopian_year, ethiopian_month, ethiopian_day
         )
+        return date(*gregorian) if as_date else gregorian
 
     def gregorian_to_ethiopian(
-        self, gregorian_year: int, gregorian_month: int, gregorian_day: int
+        self,
+        gregorian_year: Union[int, date, "numpy.datetime64"],
+        gregorian_month: Optional[int] = None,
+        gregorian_day: Optional[int] = None,
     ) -> Tuple[int, int, int]:
         """Convert a Gregorian date to an Ethiopian date.
 
         Args:
-            gregorian_year (int): The Gregorian year.
-            gregorian_month (int): The Gregorian month.
-            gregorian_day (int): The Gregorian day.
+            gregorian_year (int | date | datetime | numpy.datetime64): The Gregorian year,
+                or the whole Gregorian date as a date-like value.
+            gregorian_month (int): The Gregorian month (only with an integer year).
+            gregorian_day (int): The Gregorian day (only with an integer year).
 
         Returns:
             Tuple[int, int, int]: The Ethiopian year, month, and day.
         """
+        if gregorian_month is None and gregorian_day is None:
+            return gregorian_date_to_ethiopian(gregorian_year)
         return calculate_gregorian_to_ethiopian(
             gregorian_year, gregorian_month, gregorian_day
         )
+
+
+class _FrozenBaherHasab(BaherHasab):
+    """A read-only BaherHasab whose derived values are computed once, when created."""
+
+    _PRECOMPUTED = (
+        "get_total_years",
+        "get_wember",
+        "get_abketa",
+        "get_metke",
+        "get_first_day_of_year",
+        "get_nenewe_date",
+        "get_nenewe",
+        "get_wengelawyan",
+        "get_awde_kemer",
+        "get_awde_mahtot",
+        "get_awde_tsehay",
+    )
+
+    def __init__(self, given_year: int = 2016, engine: str = "nenewe") -> None:
+        super().__init__(given_year, engine)
+        # Plain dicts keep the instance picklable, e.g. to send it to worker processes
+        plain = BaherHasab(given_year, engine)
+        self.__dict__["_values"] = {
+            name: getattr(plain, name)() for name in self._PRECOMPUTED
+        }
+        self.__dict__["_event_dates"] = {
+            event.name: plain.get_event_date(event.name)
+            for event in fields(FastStartingDays)
+        }
+        # Computed on first use: the last years have events after 9999-12-31
+        self.__dict__["_gregorian_dates"] = {}
+        self.__dict__["_frozen"] = True
+
+    def get_event_date(self, event_name: str) -> str:
+        """Get the precomputed date of an event, see ``BaherHasab.get_event_date``."""
+        return self._event_dates.get(event_name) or BaherHasab.get_event_date(
+            self, event_name
+        )
+
+    def get_event_gregorian_date(self, event_name: str) -> date:
+        """Get the memoized Gregorian date of an event, see ``BaherHasab.get_event_gregorian_date``."""
+        if event_name not in self._gregorian_dates:
+            self._gregorian_dates[event_name] = BaherHasab.get_event_gregorian_date(
+                self, event_name
+            )
+        return self._gregorian_dates[event_name]
+
+    def __setattr__(self, name, value) -> None:
+        if self.__dict__.get("_frozen"):
+            raise AttributeError("BaherHasab instances from for_year are read-only")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name) -> None:
+        raise AttributeError("BaherHasab instances from for_year are read-only")
+
+
+def _precomputed(name: str):
+    def getter(self):
+        return self._values[name]
+
+    getter.__name__ = name
+    getter.__qualname__ = f"_FrozenBaherHasab.{name}"
+    getter.__doc__ = getattr(BaherHasab, name).__doc__
+    return getter
+
+
+# Each precomputed getter becomes a dictionary lookup
+for _name in _FrozenBaherHasab._PRECOMPUTED:
+    setattr(_FrozenBaherHasab, _name, _precomputed(_name))
+
+
+_year_cache: LRUCache[BaherHasab] = LRUCache(maxsize=128)
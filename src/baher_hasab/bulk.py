@@ -0,0 +1,199 @@
+"""
+Bulk conversions that flag invalid rows instead of raising.
+
+Every row is validated with array operations; invalid rows get the sentinel 0 in the
+result and an error code in ``BulkResult.errors``, so the valid rows convert at full
+speed. Every function accepts ``chunk_size``, ``progress`` and ``cancel`` (see
+``baher_hasab.progress``) for long jobs. Requires numpy.
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from .calendars import ETHIOPIAN, GREGORIAN, get_calendar
+from .helper import import_optional
+from .progress import CancellationToken, ProgressCallback, iter_chunks
+
+VALID = 0
+BAD_YEAR = 1
+BAD_MONTH = 2
+BAD_DAY = 3
+BAD_PAGUMEN_DAY = 4  # also the 13th month of the Coptic calendar
+
+ERROR_NAMES = {
+    BAD_YEAR: "out_of_range",
+    BAD_MONTH: "bad_month",
+    BAD_DAY: "bad_day",
+    BAD_PAGUMEN_DAY: "bad_pagumen_day",
+}
+
+
+@dataclass(frozen=True)
+class BulkResult:
+    """The converted dates of a bulk conversion, with the validity of every row."""
+
+    years: Any  # numpy.ndarray, 0 on invalid rows
+    months: Any
+    days: Any
+    errors: Any  # numpy.ndarray of error codes, VALID (0) on valid rows
+
+    @property
+    def valid(self):
+        """numpy.ndarray: True on the rows that were converted."""
+        return self.errors == VALID
+
+    def summary(self) -> Dict[str, int]:
+        """
+        Count the invalid rows of each error category.
+
+        Returns:
+            Dict[str, int]: The number of rows per category, including 'valid'.
+        """
+        np = import_optional("numpy")
+        counts = np.bincount(self.errors, minlength=len(ERROR_NAMES) + 1)
+        summary = {"valid": int(counts[VALID])}
+        summary.update({name: int(counts[code]) for code, name in ERROR_NAMES.items()})
+        return summary
+
+
+def _flag(errors, condition, code) -> None:
+    # Keep the first error found for each row
+    errors[(errors == VALID) & condition] = code
+
+
+def _convert_chunk(years, months, days, source, target):
+    np = import_optional("numpy")
+    errors = np.zeros(years.shape, dtype=np.int8)
+    _flag(errors, (years < source.min_year) | (years > source.max_year), BAD_YEAR)
+    _flag(errors, (months < 1) | (months > source.months_in_year), BAD_MONTH)
+
+    safe_months = np.where(errors == VALID, months, 1)
+    month_days = source.month_days(years, safe_months)
+    if source.months_in_year == 13:
+        _flag(errors, (days < 1) | (days > 30), BAD_DAY)
+        _flag(errors, (months == 13) & (days > month_days), BAD_PAGUMEN_DAY)
+    else:
+        _flag(errors, (days < 1) | (days > month_days), BAD_DAY)
+
+    valid = errors == VALID
+    ordinals = source.to_ordinal(
+        np.where(valid, years, 1), safe_months, np.where(valid, days, 1)
+    )
+    converted = target.from_ordinal(ordinals)
+    # A valid date can still fall outside the years of the target calendar
+    _flag(
+        errors,
+        valid & ((converted[0] < target.min_year) | (converted[0] > target.max_year)),
+        BAD_YEAR,
+    )
+    valid = errors == VALID
+    years, months, days = (np.where(valid, column, 0) for column in converted)
+    return years, months, days, errors
+
+
+def _convert_bulk(
+    years, months, days, source, target, chunk_size, progress, cancel
+) -> BulkResult:
+    np = import_optional("numpy")
+    years, months, days = np.broadcast_arrays(
+        *(np.asarray(column, dtype=np.int64) for column in (years, months, days))
+    )
+    shape = years.shape
+    columns = [column.ravel() for column in (years, months, days)]
+    result = [np.empty(len(columns[0]), dtype=np.int64) for _ in range(3)]
+    result.append(np.empty(len(columns[0]), dtype=np.int8))
+    for start, stop in iter_chunks(len(columns[0]), chunk_size, progress, cancel):
+        chunk = _convert_chunk(
+            *(column[start:stop] for column in columns), source, target
+        )
+        for output, values in zip(result, chunk):
+            output[start:stop] = values
+    return BulkResult(*(column.reshape(shape) for column in result))
+
+
+def gregorian_to_ethiopian_bulk(
+    years,
+    months,
+    days,
+    chunk_size: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[CancellationToken] = None,
+) -> BulkResult:
+    """
+    Convert arrays of Gregorian dates to Ethiopian dates without raising.
+
+    Args:
+        years (array-like): The Gregorian years.
+        months (array-like): The Gregorian months.
+        days (array-like): The Gregorian days.
+        chunk_size (int, optional): Convert this many rows at a time. Defaults to all at once.
+        progress (Callable[[Progress], None], optional): Called after each chunk.
+        cancel (CancellationToken, optional): Checked before each chunk; raises
+            JobCancelled once cancelled.
+
+    Returns:
+        BulkResult: The Ethiopian years, months and days, and the error of each row.
+    """
+    return _convert_bulk(
+        years, months, days, GREGORIAN, ETHIOPIAN, chunk_size, progress, cancel
+    )
+
+
+def ethiopian_to_gregorian_bulk(
+    years,
+    months,
+    days,
+    chunk_size: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[CancellationToken] = None,
+) -> BulkResult:
+    """
+    Convert arrays of Ethiopian dates to Gregorian dates without raising.
+
+    Args:
+        years (array-like): The Ethiopian years.
+        months (array-like): The Ethiopian months.
+        days (array-like): The Ethiopian days.
+        chunk_size (int, optional): Convert this many rows at a time. Defaults to all at once.
+        progress (Callable[[Progress], None], optional): Called after each chunk.
+        cancel (CancellationToken, optional): Checked before each chunk; raises
+            JobCancelled once cancelled.
+
+    Returns:
+        BulkResult: The Gregorian years, months and days, and the error of each row.
+    """
+    return _convert_bulk(
+        years, months, days, ETHIOPIAN, GREGORIAN, chunk_size, progress, cancel
+    )
+
+
+def convert_bulk(
+    years,
+    months,
+    days,
+    source,
+    target,
+    chunk_size: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[CancellationToken] = None,
+) -> BulkResult:
+    """
+    Convert arrays of dates between any two registered calendars without raising.
+
+    Args:
+        years (array-like): The years in the source calendar.
+        months (array-like): The months in the source calendar.
+        days (array-like): The days in the source calendar.
+        source (str | Calendar): The calendar of the dates.
+        target (str | Calendar): The calendar to convert to.
+        chunk_size (int, optional): Convert this many rows at a time. Defaults to all at once.
+        progress (Callable[[Progress], None], optional): Called after each chunk.
+        cancel (CancellationToken, optional): Checked before each chunk; raises
+            JobCancelled once cancelled.
+
+    Returns:
+        BulkResult: The converted years, months and days, and the error of each row.
+    """
+    source, target = get_calendar(source), get_calendar(target)
+    return _convert_bulk(
+        years, months, days, source, target, chunk_size, progress, cancel
+    )
@@ -0,0 +1,282 @@
+"""
+Ethiopian business days, in the spirit of ``numpy.busday_offset`` and ``busday_count``.
+
+A ``BusinessCalendar`` precomputes the sorted ordinals of every business day of a range
+of Ethiopian years, so offsets and counts are binary searches instead of day-by-day
+loops. The scalar methods use ``bisect``; the ``*_many`` methods do the same with
+``numpy.searchsorted`` on whole arrays.
+"""
+from bisect import bisect_left, bisect_right
+from dataclasses import fields
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .calendars import ETHIOPIAN, GREGORIAN
+from .helper import (
+    AMET_ALEM,
+    get_event_anchor,
+    get_genna_date,
+    get_month_and_day,
+    get_weekday,
+    import_optional,
+)
+from .lookups import FastStartingDays, PublicHolidays
+
+MOVABLE_HOLIDAYS = ("seklet", "tensae")
+ROLLS = ("raise", "forward", "following", "backward", "preceding")
+
+
+@lru_cache(maxsize=1024)
+def get_public_holidays(year: int) -> Dict[str, Tuple[int, int]]:
+    """
+    Get the public holidays of an Ethiopian year that follow from the calendar.
+
+    Genna is Julian December 25 (Tahsas 29, or Tahsas 28 in the year after Pagumen 6),
+    Labour Day is Gregorian May 1 (Miyazia 23 nowadays) and Seklet and Tensae move with
+    Nenewe. Holidays of the Islamic calendar are not
+    included; pass them to ``BusinessCalendar`` as extra holidays.
+
+    Args:
+        year (int): The Ethiopian year.
+
+    Returns:
+        Dict[str, Tuple[int, int]]: The (month, day) of each holiday.
+    """
+    holidays = {
+        holiday.name: getattr(PublicHolidays, holiday.name)
+        for holiday in fields(PublicHolidays)
+    }
+    holidays["genna"] = get_genna_date(year)
+    holidays["labour_day"] = ETHIOPIAN.from_ordinal(GREGORIAN.to_ordinal(year + 8, 5, 1))[1:]
+    anchor = get_event_anchor(AMET_ALEM + year)
+    for event in MOVABLE_HOLIDAYS:
+        day_of_year = anchor + getattr(FastStartingDays, event)
+        holidays[event] = get_month_and_day(day_of_year)
+    return holidays
+
+
+class BusinessCalendar:
+    """The business days of a range of Ethiopian years."""
+
+    def __init__(
+        self,
+        start_year: int = 1900,
+        stop_year: int = 2200,
+        weekmask: str = "1111100",
+        holidays: Optional[Iterable[Tuple[int, int, int]]] = None,
+        public_holidays: bool = True,
+    ) -> None:
+        """
+        Precompute the business days of ``range(start_year, stop_year)``.
+
+        Args:
+            start_year (int): The first Ethiopian year covered.
+            stop_year (int): The Ethiopian year after the last one covered.
+            weekmask (str): Seven '1'/'0' characters for Monday to Sunday, as in numpy;
+                '1' marks a working weekday. Defaults to Monday to Friday.
+            holidays (Iterable[Tuple[int, int, int]], optional): Extra Ethiopian dates
+                (year, month, day) that are not business days.
+            public_holidays (bool): Skip the days of ``get_public_holidays``. Defaults to True.
+        """
+        if not 1 <= start_year < stop_year <= 10000:
+            raise ValueError("Ethiopian years must be between 1 and 9999")
+        if len(weekmask) != 7 or set(weekmask) - {"0", "1"} or "1" not in weekmask:
+            raise ValueError(
+                "weekmask must be seven '0' or '1' characters with at least one '1'"
+            )
+        self.start_year = start_year
+        self.stop_year = stop_year
+        self.weekmask = weekmask
+
+        first = ETHIOPIAN.to_ordinal(start_year, 1, 1)
+        last = ETHIOPIAN.to_ordinal(stop_year, 1, 1)
+        closed = set()
+        if public_holidays:
+            for year in range(start_year, stop_year):
+                for month, day in get_public_holidays(year).values():
+                    closed.add(ETHIOPIAN.to_ordinal(year, month, day))
+        for year, month, day in holidays or ():
+            ETHIOPIAN.validate(year, month, day)
+            closed.add(ETHIOPIAN.to_ordinal(year, month, day))
+
+        working = [weekmask[weekday] == "1" for weekday in range(7)]
+        self._busdays: List[int] = [
+            ordinal
+            for ordinal in range(first, last)
+            if working[get_weekday(ordinal)] and ordinal not in closed
+        ]
+        self._array = None
+
+    def __repr__(self) -> str:
+        return (
+            f"<BusinessCalendar {self.start_year}-{self.stop_year - 1} "
+            f"weekmask={self.weekmask!r}>"
+        )
+
+    def _to_ordinal(self, year: int, month: int, day: int) -> int:
+        ETHIOPIAN.validate(year, month, day)
+        if not self.start_year <= year < self.stop_year:
+            raise ValueError(
+                f"Ethiopian year {year} is outside the calendar "
+                f"({self.start_year}-{self.stop_year - 1})"
+            )
+        return ETHIOPIAN.to_ordinal(year, month, day)
+
+    def is_busday(self, year: int, month: int, day: int) -> bool:
+        """
+        Check if an Ethiopian date is a business day.
+
+        Args:
+            year (int): The Ethiopian year.
+            month (int): The Ethiopian month.
+            day (int): The Ethiopian day.
+
+        Returns:
+            bool: True if the date is a business day.
+        """
+        ordinal = self._to_ordinal(year, month, day)
+        index = bisect_left(self._busdays, ordinal)
+        return index < len(self._busdays) and self._busdays[index] == ordinal
+
+    def busday_offset(
+        self, year: int, month: int, day: int, offset: int, roll: str = "raise"
+    ) -> Tuple[int, int, int]:
+        """
+        Move an Ethiopian date by a number of business days.
+
+        Args:
+            year (int): The Ethiopian year.
+            month (int): The Ethiopian month.
+            day (int): The Ethiopian day.
+            offset (int): The number of business days to move, negative to go back.
+            roll (str): What to do when the date is not a business day: 'raise', or
+                'forward'/'following' and 'backward'/'preceding' to start from the
+                next or previous business day. Defaults to 'raise'.
+
+        Returns:
+            Tuple[int, int, int]: The Ethiopian year, month, and day.
+        """
+        ordinal = self._to_ordinal(year, month, day)
+        index = self._roll(bisect_left(self._busdays, ordinal), ordinal, roll)
+        return ETHIOPIAN.from_ordinal(self._busdays[self._check_index(index + offset)])
+
+    def busday_count(
+        self, begin: Tuple[int, int, int], end: Tuple[int, int, int]
+    ) -> int:
+        """
+        Count the business days from ``begin`` up to, but not including, ``end``.
+
+        Args:
+            begin (Tuple[int, int, int]): The first Ethiopian date (year, month, day).
+            end (Tuple[int, int, int]): The Ethiopian date after the last one counted.
+
+        Returns:
+            int: The number of business days, negative when ``end`` is before ``begin``.
+        """
+        return bisect_left(self._busdays, self._to_ordinal(*end)) - bisect_left(
+            self._busdays, self._to_ordinal(*begin)
+        )
+
+    def _roll(self, index: int, ordinal: int, roll: str) -> int:
+        if roll not in ROLLS:
+            raise ValueError(f"roll must be one of {ROLLS}")
+        if index < len(self._busdays) and self._busdays[index] == ordinal:
+            return index
+        if roll == "raise":
+            raise ValueError("The date is not a business day")
+        if roll in ("backward", "preceding"):
+            return bisect_right(self._busdays, ordinal) - 1
+        return index
+
+    def _check_index(self, index: int) -> int:
+        if not 0 <= index < len(self._busdays):
+            raise ValueError("The result is outside the years of the calendar")
+        return index
+
+    def _get_array(self):
+        if self._array is None:
+            np = import_optional("numpy")
+            self._array = np.asarray(self._busdays, dtype=np.int64)
+        return self._array
+
+    def _to_ordinals(self, years, months, days):
+        np = import_optional("numpy")
+        years = np.asarray(years, dtype=np.int64)
+        months = np.asarray(months, dtype=np.int64)
+        days = np.asarray(days, dtype=np.int64)
+        if np.any((years < self.start_year) | (years >= self.stop_year)):
+            raise ValueError("Some Ethiopian years are outside the calendar")
+        if np.any(
+            (months < 1) | (months > 13) | (days < 1)
+            | (days > ETHIOPIAN.month_days(years, months))
+        ):
+            raise ValueError("Some Ethiopian dates are invalid")
+        return ETHIOPIAN.to_ordinal(years, months, days)
+
+    def is_busday_many(self, years, months, days):
+        """
+        Check arrays of Ethiopian dates (requires numpy).
+
+        Args:
+            years (array-like): The Ethiopian years.
+            months (array-like): The Ethiopian months.
+            days (array-like): The Ethiopian days.
+
+        Returns:
+            numpy.ndarray: True on the business days.
+        """
+        np = import_optional("numpy")
+        busdays = self._get_array()
+        ordinals = self._to_ordinals(years, months, days)
+        index = np.minimum(np.searchsorted(busdays, ordinals), len(busdays) - 1)
+        return busdays[index] == ordinals
+
+    def busday_offset_many(self, years, months, days, offsets, roll: str = "raise"):
+        """
+        Move arrays of Ethiopian dates by numbers of business days (requires numpy).
+
+        Args:
+            years (array-like): The Ethiopian years.
+            months (array-like): The Ethiopian months.
+            days (array-like): The Ethiopian days.
+            offsets (array-like): The numbers of business days to move.
+            roll (str): As in ``busday_offset``. Defaults to 'raise'.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The Ethiopian years,
+                months and days.
+        """
+        np = import_optional("numpy")
+        if roll not in ROLLS:
+            raise ValueError(f"roll must be one of {ROLLS}")
+        busdays = self._get_array()
+        ordinals = self._to_ordinals(years, months, days)
+        index = np.searchsorted(busdays, ordinals)
+        exact = busdays[np.minimum(index, len(busdays) - 1)] == ordinals
+        if roll == "raise" and not np.all(exact):
+            raise ValueError("Some dates are not business days")
+        if roll in ("backward", "preceding"):
+            index = np.where(exact, index, index - 1)
+        index = index + np.asarray(offsets, dtype=np.int64)
+        if np.any((index < 0) | (index >= len(busdays))):
+            raise ValueError("Some results are outside the years of the calendar")
+        return ETHIOPIAN.from_ordinal(busdays[index])
+
+    def busday_count_many(self, begins, ends):
+        """
+        Count business days between arrays of Ethiopian dates (requires numpy).
+
+        Args:
+            begins (Tuple[array-like, array-like, array-like]): The years, months and
+                days of the first dates.
+            ends (Tuple[array-like, array-like, array-like]): The years, months and
+                days of the dates after the last ones counted.
+
+        Returns:
+            numpy.ndarray: The numbers of business days.
+        """
+        np = import_optional("numpy")
+        busdays = self._get_array()
+        return np.searchsorted(busdays, self._to_ordinals(*ends)) - np.searchsorted(
+            busdays, self._to_ordinals(*begins)
+        )
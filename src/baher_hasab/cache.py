@@ -0,0 +1,91 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Generic, Hashable, NamedTuple, TypeVar
+
+T = TypeVar("T")
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of an ``LRUCache``, laid out like ``functools.lru_cache``'s."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(Generic[T]):
+    """A thread-safe least recently used cache with hit/miss statistics."""
+
+    def __init__(self, maxsize: int = 128) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize (int): The number of entries kept before the least recently used is evicted.
+        """
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1")
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, T]" = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """
+        Get the entry of a key, creating it with the factory on a miss.
+
+        Args:
+            key (Hashable): The key of the entry.
+            factory (Callable[[], T]): Creates the entry; called outside the lock.
+
+        Returns:
+            T: The cached entry.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self._misses += 1
+
+        value = factory()
+        with self._lock:
+            # Another thread may have created the entry in the meantime, keep the first one
+            value = self._entries.setdefault(key, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def resize(self, maxsize: int) -> None:
+        """
+        Change the size of the cache, evicting the least recently used entries if needed.
+
+        Args:
+            maxsize (int): The new number of entries kept.
+        """
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1")
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Get the statistics of the cache.
+
+        Returns:
+            CacheInfo: The hits, misses, maximum size and current size.
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._entries))
@@ -0,0 +1,314 @@
+"""
+A shared day-number kernel for the calendars used in church records.
+
+Every calendar maps its dates to and from proleptic Gregorian ordinals (the day numbers
+of ``datetime.date.toordinal``), so any pair of calendars converts directly through a
+single ordinal. The arithmetic only uses ``+ - * // %`` and comparisons, so the same
+methods work on Python ints and element-wise on NumPy integer arrays.
+"""
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple, Union
+
+from .progress import CancellationToken, ProgressCallback, map_chunks
+
+
+class Calendar(ABC):
+    """Base class of the calendar definitions."""
+
+    name: str = ""
+    months_in_year: int = 12
+    min_year: int = 1
+    max_year: int = 9999
+
+    @abstractmethod
+    def to_ordinal(self, year, month, day):
+        """
+        Convert a date of the calendar to a proleptic Gregorian ordinal.
+
+        Args:
+            year (int): The year.
+            month (int): The month.
+            day (int): The day.
+
+        Returns:
+            int: The ordinal.
+        """
+
+    @abstractmethod
+    def from_ordinal(self, ordinal):
+        """
+        Convert a proleptic Gregorian ordinal to a date of the calendar.
+
+        Args:
+            ordinal (int): The ordinal.
+
+        Returns:
+            Tuple[int, int, int]: The year, month, and day.
+        """
+
+    @abstractmethod
+    def month_days(self, year, month):
+        """
+        Get the number of days of a month.
+
+        Args:
+            year (int): The year.
+            month (int): The month.
+
+        Returns:
+            int: The number of days.
+        """
+
+    def validate(self, year: int, month: int, day: int) -> None:
+        """
+        Check a date of the calendar, raising ValueError on the first bad field.
+
+        Args:
+            year (int): The year.
+            month (int): The month.
+            day (int): The day.
+        """
+        title = self.name.capitalize()
+        if not self.min_year <= year <= self.max_year:
+            raise ValueError(f"{title} year must be a 4-digit integer")
+        if not 1 <= month <= self.months_in_year:
+            raise ValueError(
+                f"{title} month must be between 1 and {self.months_in_year}"
+            )
+        max_days = self.month_days(year, month)
+        if not 1 <= day <= max_days:
+            raise ValueError(f"{title} day must be between 1 and {max_days}")
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name!r}>"
+
+
+class AlexandrianCalendar(Calendar):
+    """
+    Twelve months of 30 days and a 13th month of 5 days, 6 in the year before a
+    multiple of 4; used by the Ethiopian and Coptic calendars with different epochs.
+    """
+
+    months_in_year = 13
+
+    def __init__(self, name: str, epoch: int) -> None:
+        """
+        Define the calendar.
+
+        Args:
+            name (str): The name of the calendar.
+            epoch (int): The ordinal of the first day of its year 1.
+        """
+        self.name = name
+        self.epoch = epoch
+
+    def to_ordinal(self, year, month, day):
+        return self.epoch - 1 + 365 * (year - 1) + year // 4 + 30 * (month - 1) + day
+
+    def from_ordinal(self, ordinal):
+        year = (4 * (ordinal - self.epoch) + 1463) // 1461
+        day_of_year = ordinal - self.to_ordinal(year, 1, 1)
+        return year, day_of_year // 30 + 1, day_of_year % 30 + 1
+
+    def month_days(self, year, month):
+        return 30 - (month == 13) * (25 - (year % 4 == 3))
+
+
+class _SolarCalendar(Calendar):
+    """Calendars of 12 months whose February has 28 or 29 days."""
+
+    # Minus the ordinal of March 1 of the year 0
+    _offset = 0
+    _cycle_years = 4
+    _cycle_days = 1461
+    # The days of each month of a common year, indexed by the month
+    _common_month_days = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+    @abstractmethod
+    def is_leap_year(self, year):
+        """Check whether a year has a February 29, element-wise on arrays."""
+
+    def _days_in_cycle_before_year(self, year_of_cycle):
+        return 365 * year_of_cycle + year_of_cycle // 4
+
+    def _year_of_cycle(self, day_of_cycle):
+        return (day_of_cycle - day_of_cycle // 1460) // 365
+
+    def to_ordinal(self, year, month, day):
+        # Count years from March, so the leap day ends the year
+        year = year - (month <= 2)
+        cycle = year // self._cycle_years
+        year_of_cycle = year - cycle * self._cycle_years
+        day_of_year = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+        return (
+            cycle * self._cycle_days
+            + self._days_in_cycle_before_year(year_of_cycle)
+            + day_of_year
+            - self._offset
+        )
+
+    def from_ordinal(self, ordinal):
+        days = ordinal + self._offset
+        cycle = days // self._cycle_days
+        day_of_cycle = days - cycle * self._cycle_days
+        year_of_cycle = self._year_of_cycle(day_of_cycle)
+        day_of_year = day_of_cycle - self._days_in_cycle_before_year(year_of_cycle)
+        month_from_march = (5 * day_of_year + 2) // 153
+        day = day_of_year - (153 * month_from_march + 2) // 5 + 1
+        month = month_from_march + 3 - 12 * (month_from_march >= 10)
+        year = year_of_cycle + cycle * self._cycle_years + (month <= 2)
+        return year, month, day
+
+    def month_days(self, year, month):
+        if isinstance(month, int):
+            common = self._common_month_days[month]
+        else:
+            from .helper import import_optional
+
+            common = import_optional("numpy").take(self._common_month_days, month)
+        return common + (month == 2) * self.is_leap_year(year)
+
+
+class JulianCalendar(_SolarCalendar):
+    """The Julian calendar, a leap year every 4 years."""
+
+    name = "julian"
+    _offset = 307
+
+    def is_leap_year(self, year):
+        return year % 4 == 0
+
+
+class GregorianCalendar(_SolarCalendar):
+    """The proleptic Gregorian calendar of ``datetime.date``."""
+
+    name = "gregorian"
+    _offset = 305
+    _cycle_years = 400
+    _cycle_days = 146097
+
+    def is_leap_year(self, year):
+        return (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+
+    def _days_in_cycle_before_year(self, year_of_cycle):
+        return 365 * year_of_cycle + year_of_cycle // 4 - year_of_cycle // 100
+
+    def _year_of_cycle(self, day_of_cycle):
+        return (
+            day_of_cycle
+            - day_of_cycle // 1460
+            + day_of_cycle // 36524
+            - day_of_cycle // 146096
+        ) // 365
+
+
+ETHIOPIAN = AlexandrianCalendar("ethiopian", epoch=2796)  # Meskerem 1, 1 = 8-08-27
+COPTIC = AlexandrianCalendar("coptic", epoch=103605)  # Thout 1, 1 = 284-08-29 (Julian)
+JULIAN = JulianCalendar()
+GREGORIAN = GregorianCalendar()
+
+CALENDARS: Dict[str, Calendar] = {}
+
+
+def register_calendar(calendar: Calendar) -> None:
+    """
+    Make a calendar available by name to ``convert`` and ``convert_many``.
+
+    Args:
+        calendar (Calendar): The calendar definition.
+    """
+    CALENDARS[calendar.name] = calendar
+
+
+for _calendar in (ETHIOPIAN, COPTIC, JULIAN, GREGORIAN):
+    register_calendar(_calendar)
+
+
+def get_calendar(calendar: Union[str, Calendar]) -> Calendar:
+    """
+    Get a calendar definition.
+
+    Args:
+        calendar (str | Calendar): The name of a registered calendar, or a calendar.
+
+    Returns:
+        Calendar: The calendar definition.
+    """
+    if isinstance(calendar, Calendar):
+        return calendar
+    try:
+        return CALENDARS[calendar]
+    except KeyError:
+        raise ValueError(
+            f"Unknown calendar {calendar!r}, expected one of {sorted(CALENDARS)}"
+        ) from None
+
+
+def convert(
+    year: int,
+    month: int,
+    day: int,
+    source: Union[str, Calendar],
+    target: Union[str, Calendar],
+) -> Tuple[int, int, int]:
+    """
+    Convert a date between two calendars, e.g. ``convert(2016, 1, 1, 'ethiopian', 'coptic')``.
+
+    Args:
+        year (int): The year in the source calendar.
+        month (int): The month in the source calendar.
+        day (int): The day in the source calendar.
+        source (str | Calendar): The calendar of the date.
+        target (str | Calendar): The calendar to convert to.
+
+    Returns:
+        Tuple[int, int, int]: The year, month, and day in the target calendar.
+    """
+    source, target = get_calendar(source), get_calendar(target)
+    source.validate(year, month, day)
+    return target.from_ordinal(source.to_ordinal(year, month, day))
+
+
+def convert_many(
+    years,
+    months,
+    days,
+    source,
+    target,
+    chunk_size: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[CancellationToken] = None,
+):
+    """
+    Convert arrays of dates between two calendars without validating them.
+
+    Use the functions of ``baher_hasab.bulk`` to flag invalid rows first.
+
+    Args:
+        years (array-like): The years in the source calendar.
+        months (array-like): The months in the source calendar.
+        days (array-like): The days in the source calendar.
+        source (str | Calendar): The calendar of the dates.
+        target (str | Calendar): The calendar to convert to.
+        chunk_size (int, optional): Convert this many rows at a time. Defaults to all at once.
+        progress (Callable[[Progress], None], optional): Called after each chunk.
+        cancel (CancellationToken, optional): Checked before each chunk; raises
+            JobCancelled once cancelled.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The years, months and days
+            in the target calendar; requires numpy.
+    """
+    from .helper import import_optional
+
+    np = import_optional("numpy")
+    source, target = get_calendar(source), get_calendar(target)
+    return map_chunks(
+        lambda years, months, days: target.from_ordinal(
+            source.to_ordinal(years, months, days)
+        ),
+        [np.asarray(column, dtype=np.int64) for column in (years, months, days)],
+        chunk_size,
+        progress,
+        cancel,
+    )
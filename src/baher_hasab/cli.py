@@ -0,0 +1,285 @@
+"""
+Command line interface, optionally served by a long-lived daemon on a Unix socket.
+
+Queries use a line protocol, one request per line::
+
+    eth 2024-07-31        ->  OK 2016-11-24
+    greg 2016-11-24       ->  OK 2024-07-31
+    event 2016 tensae     ->  OK Miyazia 27
+    ping                  ->  OK pong
+
+Errors are answered with ``ERR <message>``.
+"""
+import argparse
+from datetime import date
+import os
+import signal
+import socket
+import socketserver
+import sys
+import tempfile
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .baher_hasab import BaherHasab
+from .helper import (
+    LAST_DATED_YEAR,
+    calculate_ethiopian_to_gregorian,
+    calculate_gregorian_to_ethiopian,
+)
+from .tables import EVENT_NAMES
+from .verify import ENGINES, verify_conversions
+
+
+def default_socket_path() -> str:
+    """
+    Get the socket path of the daemon.
+
+    Returns:
+        str: ``$BAHER_HASAB_SOCKET``, else a per-user path in the runtime or temp directory.
+    """
+    if os.environ.get("BAHER_HASAB_SOCKET"):
+        return os.environ["BAHER_HASAB_SOCKET"]
+    directory = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    user = os.getuid() if hasattr(os, "getuid") else os.getpid()
+    return os.path.join(directory, f"baher_hasab-{user}.sock")
+
+
+def _parse_date(text: str) -> Tuple[int, int, int]:
+    parts = text.split("-")
+    if len(parts) != 3:
+        raise ValueError(f"Expected a YYYY-MM-DD date, got {text!r}")
+    year, month, day = (int(part) for part in parts)
+    return year, month, day
+
+
+def handle_query(line: str) -> str:
+    """
+    Answer one query of the line protocol.
+
+    Args:
+        line (str): The query, e.g. 'event 2016 tensae'.
+
+    Returns:
+        str: 'OK <result>' or 'ERR <message>'.
+    """
+    if not line.split():
+        return "ERR empty query"
+    command, *args = line.split()
+    try:
+        if command == "ping" and not args:
+            return "OK pong"
+        if command == "eth" and len(args) == 1:
+            return "OK {:04d}-{:02d}-{:02d}".format(
+                *calculate_gregorian_to_ethiopian(*_parse_date(args[0]))
+            )
+        if command == "greg" and len(args) == 1:
+            return "OK " + date(
+                *calculate_ethiopian_to_gregorian(*_parse_date(args[0]))
+            ).isoformat()
+        if command == "event" and len(args) == 2:
+            year, event = int(args[0]), args[1]
+            if event not in EVENT_NAMES:
+                return f"ERR unknown event: {event}"
+            if not 1 <= year <= 9999:
+                return "ERR Ethiopian year must be a 4-digit integer"
+            return "OK " + BaherHasab.for_year(year).get_event_date(event)
+    except Exception as error:
+        # A failed query must never take down the daemon's connection
+        return f"ERR {error}"
+    return f"ERR unknown query: {line.strip()}"
+
+
+class _QueryHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        for raw_line in self.rfile:
+            line = raw_line.decode("utf-8").strip()
+            if line:
+                self.wfile.write(handle_query(line).encode("utf-8") + b"\n")
+                self.wfile.flush()
+
+
+def create_server(socket_path: str) -> socketserver.ThreadingUnixStreamServer:
+    """
+    Create the daemon's server, bound to a Unix socket but not yet serving.
+
+    Args:
+        socket_path (str): The socket to listen on.
+
+    Returns:
+        socketserver.ThreadingUnixStreamServer: The server.
+    """
+    if os.path.exists(socket_path):
+        if not _is_own(socket_path):
+            raise RuntimeError(f"{socket_path} belongs to another user")
+        client = _connect(socket_path)
+        if client is not None:
+            client.close()
+            raise RuntimeError(f"A daemon is already listening on {socket_path}")
+        os.unlink(socket_path)  # left behind by a daemon that did not shut down cleanly
+
+    server = socketserver.ThreadingUnixStreamServer(socket_path, _QueryHandler)
+    server.daemon_threads = True
+    return server
+
+
+def serve(socket_path: Optional[str] = None) -> None:
+    """
+    Run the daemon until interrupted, answering queries on a Unix socket.
+
+    Args:
+        socket_path (str): The socket to listen on, ``default_socket_path()`` if None.
+    """
+    socket_path = socket_path or default_socket_path()
+    server = create_server(socket_path)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def _is_own(socket_path: str) -> bool:
+    # In a shared directory such as /tmp another user could create the path first and
+    # answer the queries, so only sockets owned by this user are trusted
+    if not hasattr(os, "getuid"):
+        return True
+    try:
+        return os.stat(socket_path).st_uid == os.getuid()
+    except OSError:
+        return False
+
+
+def _connect(socket_path: str) -> Optional[socket.socket]:
+    if not hasattr(socket, "AF_UNIX") or not _is_own(socket_path):
+        return None
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(socket_path)
+    except OSError:
+        client.close()
+        return None
+    return client
+
+
+def query_many(lines: Iterable[str], socket_path: Optional[str] = None) -> Iterator[str]:
+    """
+    Answer queries through the daemon, or in-process when no daemon is running.
+
+    Args:
+        lines (Iterable[str]): The queries, one per item.
+        socket_path (str): The socket of the daemon, ``default_socket_path()`` if None.
+
+    Yields:
+        str: The answer of each query, in order.
+    """
+    client = _connect(socket_path or default_socket_path())
+    if client is None:
+        yield from map(handle_query, lines)
+        return
+    with client, client.makefile("rwb") as stream:
+        for line in lines:
+            if not line.split():
+                yield "ERR empty query"
+                continue
+            try:
+                stream.write(line.strip().encode("utf-8") + b"\n")
+                stream.flush()
+                answer = stream.readline().decode("utf-8").rstrip("\n")
+            except OSError:
+                answer = ""
+            # The daemon went away: answer in-process
+            yield answer or handle_query(line)
+
+
+def query(line: str, socket_path: Optional[str] = None) -> str:
+    """
+    Answer one query through the daemon, or in-process when no daemon is running.
+
+    Args:
+        line (str): The query, e.g. 'eth 2024-07-31'.
+        socket_path (str): The socket of the daemon, ``default_socket_path()`` if None.
+
+    Returns:
+        str: 'OK <result>' or 'ERR <message>'.
+    """
+    return next(query_many([line], socket_path))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the ``baher-hasab`` command.
+
+    Args:
+        argv (List[str]): The arguments, ``sys.argv[1:]`` if None.
+
+    Returns:
+        int: The exit status, 1 if any query failed.
+    """
+    parser = argparse.ArgumentParser(
+        prog="baher-hasab", description="Ethiopian calendar conversions and feasts."
+    )
+    parser.add_argument("--socket", help="socket of the daemon (default: per-user path)")
+    parser.add_argument(
+        "--no-daemon", action="store_true", help="always answer in-process"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("serve", help="run the daemon on the socket")
+    eth = commands.add_parser("eth", help="Gregorian YYYY-MM-DD to Ethiopian")
+    eth.add_argument("date")
+    greg = commands.add_parser("greg", help="Ethiopian YYYY-MM-DD to Gregorian")
+    greg.add_argument("date")
+    event = commands.add_parser("event", help="date of an event in an Ethiopian year")
+    event.add_argument("year")
+    event.add_argument("name")
+    commands.add_parser("batch", help="answer the queries read from stdin, one per line")
+    verify = commands.add_parser(
+        "verify", help="check every day of the conversions against a reference"
+    )
+    verify.add_argument("--start-year", type=int, default=1)
+    verify.add_argument("--stop-year", type=int, default=LAST_DATED_YEAR + 1)
+    verify.add_argument("--engines", nargs="+", choices=sorted(ENGINES))
+    verify.add_argument("--workers", type=int, help="processes (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    if args.command == "verify":
+        report = verify_conversions(
+            args.start_year, args.stop_year, args.engines, args.workers
+        )
+        print(report.format())
+        return 0 if report.ok else 1
+
+    if args.command == "serve":
+        # Let `kill` stop the daemon through the same cleanup as Ctrl-C
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+        try:
+            serve(args.socket)
+        except RuntimeError as error:
+            print(error, file=sys.stderr)
+            return 1
+        return 0
+
+    if args.command == "batch":
+        lines = (line for line in sys.stdin if line.strip())
+    elif args.command == "event":
+        lines = [f"event {args.year} {args.name}"]
+    else:
+        lines = [f"{args.command} {args.date}"]
+    answers = (
+        map(handle_query, lines) if args.no_daemon else query_many(lines, args.socket)
+    )
+
+    status = 0
+    for answer in answers:
+        if answer.startswith("OK "):
+            print(answer[3:])
+        else:
+            print(answer[4:], file=sys.stderr)
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,309 @@
+from datetime import date
+from typing import Optional, Tuple
+
+from .helper import (
+    ETHIOPIAN_EPOCH,
+    UNIX_EPOCH_ORDINAL,
+    ethiopian_to_ordinal,
+    import_optional,
+    ordinal_to_ethiopian,
+)
+from .progress import CancellationToken, ProgressCallback, map_chunks
+
+# The ordinal of 9999-12-31, the last day with a ``datetime.date``
+MAX_ORDINAL = date.max.toordinal()
+
+
+def to_ordinal(value) -> int:
+    """
+    Get the proleptic Gregorian ordinal of a date-like value.
+
+    Args:
+        value (date | datetime | numpy.datetime64): The Gregorian date (the time of
+            day, if any, is ignored); ``NaT`` raises ValueError.
+
+    Returns:
+        int: The ordinal, compatible with ``datetime.date.fromordinal``.
+    """
+    if isinstance(value, date):
+        return value.toordinal()
+    try:
+        np = import_optional("numpy")
+    except ImportError:
+        np = None
+    if np is not None and isinstance(value, np.datetime64):
+        if np.isnat(value):
+            raise ValueError("Expected a date, got NaT")
+        return int(value.astype("datetime64[D]").astype(np.int64)) + UNIX_EPOCH_ORDINAL
+    raise TypeError(
+        f"Expected a datetime.date, datetime.datetime or numpy.datetime64, got {type(value).__name__}"
+    )
+
+
+def to_ordinals(values):
+    """
+    Get the proleptic Gregorian ordinals of an array of dates.
+
+    Args:
+        values (array-like): ``datetime64`` values of any unit, ``datetime.date`` /
+            ``datetime.datetime`` objects or a pandas datetime column.
+
+    Returns:
+        numpy.ndarray: The ordinals as ``int64``; requires numpy.
+    """
+    np = import_optional("numpy")
+    days = np.asarray(values, dtype="datetime64[D]")
+    return days.astype(np.int64) + UNIX_EPOCH_ORDINAL
+
+
+def gregorian_date_to_ethiopian(value) -> Tuple[int, int, int]:
+    """
+    Convert a Gregorian date to an Ethiopian date.
+
+    Args:
+        value (date | datetime | numpy.datetime64): The Gregorian date.
+
+    Returns:
+        Tuple[int, int, int]: The Ethiopian year, month, and day.
+    """
+    ordinal = to_ordinal(value)
+    if ordinal < ETHIOPIAN_EPOCH:
+        raise ValueError(
+            "Gregorian date must be on or after 0008-08-27, the first day of the Ethiopian year 1"
+        )
+    # A datetime64 can lie past 9999-12-31
+    if ordinal > MAX_ORDINAL:
+        raise ValueError("Gregorian year must be a 4-digit integer")
+    return ordinal_to_ethiopian(ordinal)
+
+
+def ethiopian_to_gregorian_date(
+    ethiopian_year: int, ethiopian_month: int, ethiopian_day: int
+) -> date:
+    """
+    Convert an Ethiopian date to a ``datetime.date``.
+
+    Args:
+        ethiopian_year (int): The Ethiopian year.
+        ethiopian_month (int): The Ethiopian month.
+        ethiopian_day (int): The Ethiopian day.
+
+    Returns:
+        date: The Gregorian date.
+    """
+    return date.fromordinal(
+        ethiopian_to_ordinal(ethiopian_year, ethiopian_month, ethiopian_day)
+    )
+
+
+def datetime64_to_ethiopian(
+    values,
+    chunk_size: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[CancellationToken] = None,
+):
+    """
+    Convert an array of Gregorian dates to Ethiopian dates without Python-level loops.
+
+    The values are not validated.
+
+    Args:
+        values (array-like): ``datetime64`` values, date objects or a pandas datetime column.
+        chunk_size (int, optional): Convert this many rows at a time. Defaults to all at once.
+        progress (Callable[[Progress], None], optional): Called after each chunk.
+        cancel (CancellationToken, optional): Checked before each chunk; raises
+            JobCancelled once cancelled.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The Ethiopian years,
+            months and days; requires numpy.
+    """
+    np = import_optional("numpy")
+    return map_chunks(
+        lambda days: ordinal_to_ethiopian(to_ordinals(days)),
+        [np.asarray(values, dtype="datetime64[D]")],
+        chunk_size,
+        progress,
+        cancel,
+    )
+
+
+def ethiopian_to_datetime64(
+    ethiopian_years,
+    ethiopian_months,
+    ethiopian_days,
+    chunk_size: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[CancellationToken] = None,
+):
+    """
+    Convert arrays of Ethiopian years, months and days to ``datetime64[D]``.
+
+    The values are not validated.
+
+    Args:
+        ethiopian_years (array-like): The Ethiopian years.
+        ethiopian_months (array-like): The Ethiopian months.
+        ethiopian_days (array-like): The Ethiopian days.
+        chunk_size (int, optional): Convert this many rows at a time. Defaults to all at once.
+        progress (Callable[[Progress], None], optional): Called after each chunk.
+        cancel (CancellationToken, optional): Checked before each chunk; raises
+            JobCancelled once cancelled.
+
+    Returns:
+        numpy.ndarray: The Gregorian dates as ``datetime64[D]``; requires numpy.
+    """
+    np = import_optional("numpy")
+
+    def convert_chunk(years, months, days):
+        ordinals = ethiopian_to_ordinal(years, months, days)
+        return ((ordinals - UNIX_EPOCH_ORDINAL).astype("datetime64[D]"),)
+
+    columns = (ethiopian_years, ethiopian_months, ethiopian_days)
+    (gregorian,) = map_chunks(
+        convert_chunk,
+        [np.asarray(column, dtype=np.int64) for column in columns],
+        chunk_size,
+        progress,
+        cancel,
+    )
+    return gregorian
+
+
+# East Africa Time, UTC+3
+ETHIOPIAN_UTC_OFFSET = 3 * 3600
+# The Ethiopian clock counts the hours of the day from dawn, 6:00 local time
+ETHIOPIAN_DAY_START = 6 * 3600
+
+
+def _to_epoch_seconds(values):
+    # The seconds since 1970-01-01 UTC and the NaT mask
+    np = import_optional("numpy")
+    values = np.asarray(values)
+    if values.dtype.kind == "M":
+        return values.astype("datetime64[s]").astype(np.int64), np.isnat(values)
+    return values.astype(np.int64), np.zeros(values.shape, dtype=bool)
+
+
+def datetime64_to_ethiopian_time(
+    values,
+    utc_offset=ETHIOPIAN_UTC_OFFSET,
+    chunk_size: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[CancellationToken] = None,
+):
+    """
+    Convert an array of UTC timestamps to Ethiopian dates and Ethiopian clock times.
+
+    The Ethiopian day starts at 6:00 local time, so a timestamp before dawn belongs to
+    the previous Ethiopian date; e.g. 03:30 local is hour 21 of the day before. The
+    traditional 12-hour reading is ``hours % 12`` (0 is 12), by day when ``hours < 12``.
+
+    The values are not validated, except that a ``NaT`` gives 0 in every output, like
+    the invalid rows of ``baher_hasab.bulk``.
+
+    Args:
+        values (array-like): ``datetime64`` values of any unit, or seconds since
+            1970-01-01 00:00 UTC.
+        utc_offset (int | array-like): The local offset from UTC in seconds.
+            Defaults to UTC+3.
+        chunk_size (int, optional): Convert this many rows at a time. Defaults to all at once.
+        progress (Callable[[Progress], None], optional): Called after each chunk.
+        cancel (CancellationToken, optional): Checked before each chunk; raises
+            JobCancelled once cancelled.
+
+    Returns:
+        Tuple[numpy.ndarray, ...]: The Ethiopian years, months, days, hours since dawn
+            (0 to 23), minutes and seconds; requires numpy.
+    """
+    np = import_optional("numpy")
+
+    def convert_chunk(epoch_seconds, nat, offsets):
+        seconds = np.where(nat, 0, epoch_seconds) + offsets - ETHIOPIAN_DAY_START
+        days, time_of_day = seconds // 86400, seconds % 86400
+        years, months, days = ordinal_to_ethiopian(days + UNIX_EPOCH_ORDINAL)
+        columns = (
+            years,
+            months,
+            days,
+            time_of_day // 3600,
+            time_of_day // 60 % 60,
+            time_of_day % 60,
+        )
+        return tuple(np.where(nat, 0, column) for column in columns)
+
+    epoch_seconds, nat = _to_epoch_seconds(values)
+    return map_chunks(
+        convert_chunk,
+        [epoch_seconds, nat, np.asarray(utc_offset, dtype=np.int64)],
+        chunk_size,
+        progress,
+        cancel,
+    )
+
+
+def ethiopian_time_to_datetime64(
+    ethiopian_years,
+    ethiopian_months,
+    ethiopian_days,
+    hours,
+    minutes=0,
+    seconds=0,
+    utc_offset=ETHIOPIAN_UTC_OFFSET,
+    chunk_size: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[CancellationToken] = None,
+):
+    """
+    Convert arrays of Ethiopian dates and Ethiopian clock times to UTC ``datetime64[s]``.
+
+    The inverse of ``datetime64_to_ethiopian_time``; the values are not validated.
+
+    Args:
+        ethiopian_years (array-like): The Ethiopian years.
+        ethiopian_months (array-like): The Ethiopian months.
+        ethiopian_days (array-like): The Ethiopian days.
+        hours (array-like): The hours since dawn, 0 to 23.
+        minutes (array-like): The minutes. Defaults to 0.
+        seconds (array-like): The seconds. Defaults to 0.
+        utc_offset (int | array-like): The local offset from UTC in seconds.
+            Defaults to UTC+3.
+        chunk_size (int, optional): Convert this many rows at a time. Defaults to all at once.
+        progress (Callable[[Progress], None], optional): Called after each chunk.
+        cancel (CancellationToken, optional): Checked before each chunk; raises
+            JobCancelled once cancelled.
+
+    Returns:
+        numpy.ndarray: The UTC timestamps as ``datetime64[s]``; requires numpy.
+    """
+    np = import_optional("numpy")
+
+    def convert_chunk(years, months, days, hours, minutes, seconds, offsets):
+        ordinals = ethiopian_to_ordinal(years, months, days)
+        epoch_seconds = (
+            (ordinals - UNIX_EPOCH_ORDINAL) * 86400
+            + ETHIOPIAN_DAY_START
+            + hours * 3600
+            + minutes * 60
+            + seconds
+            - offsets
+        )
+        return (epoch_seconds.astype("datetime64[s]"),)
+
+    columns = (
+        ethiopian_years,
+        ethiopian_months,
+        ethiopian_days,
+        hours,
+        minutes,
+        seconds,
+        utc_offset,
+    )
+    (timestamps,) = map_chunks(
+        convert_chunk,
+        [np.asarray(column, dtype=np.int64) for column in columns],
+        chunk_size,
+        progress,
+        cancel,
+    )
+    return timestamps
@@ -0,0 +1,102 @@
+from dataclasses import astuple, fields
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from .helper import (
+    AMET_ALEM,
+    ethiopian_to_ordinal,
+    get_event_anchor,
+    get_genna_date,
+    get_weekday,
+)
+from .lookups import FastFreeDays, FastStartingDays, FixedFastingDays
+
+# The fast of the apostles lasts until the day before the feast of Peter and Paul (Hamle 5)
+HAWARYAT_LAST_DAY = (11, 4)
+
+
+def _day_of_year(month: int, day: int) -> int:
+    return (month - 1) * 30 + day
+
+
+@lru_cache(maxsize=1024)
+def get_fasting_seasons(year: int) -> Dict[str, Tuple[int, int]]:
+    """
+    Get the fasting seasons of an Ethiopian year.
+
+    Args:
+        year (int): The Ethiopian year.
+
+    Returns:
+        Dict[str, Tuple[int, int]]: The first and last day of the year (counted from
+            Meskerem 1) of each season.
+    """
+    anchor = get_event_anchor(AMET_ALEM + year)
+    seasons = {
+        "nenewe": (anchor, anchor + 2),
+        "hudade": (
+            anchor + FastStartingDays.hudade,
+            anchor + FastStartingDays.tensae - 1,
+        ),
+        "hawaryat": (
+            anchor + FastStartingDays.hawaryat,
+            _day_of_year(*HAWARYAT_LAST_DAY),
+        ),
+    }
+    for season in fields(FixedFastingDays):
+        first, last = getattr(FixedFastingDays, season.name)
+        seasons[season.name] = (_day_of_year(*first), _day_of_year(*last))
+    first, _ = seasons["tsome_nebiyat"]
+    seasons["tsome_nebiyat"] = (first, _day_of_year(*get_genna_date(year)) - 1)
+    return seasons
+
+
+def get_fast(year: int, month: int, day: int) -> Optional[str]:
+    """
+    Get the fast kept on an Ethiopian date.
+
+    Besides the seasons of ``get_fasting_seasons``, every Wednesday and Friday is a fast
+    day except in the fifty days from Tensae to Piraklitos, on Genna and on Timket.
+
+    Args:
+        year (int): The Ethiopian year.
+        month (int): The Ethiopian month.
+        day (int): The Ethiopian day.
+
+    Returns:
+        Optional[str]: The name of the fast ('wednesday' / 'friday' for the weekly
+            fast), None when the day is not a fast day.
+    """
+    day_of_year = _day_of_year(month, day)
+    for name, (first, last) in get_fasting_seasons(year).items():
+        if first <= day_of_year <= last:
+            return name
+
+    weekday = get_weekday(ethiopian_to_ordinal(year, month, day))
+    if weekday not in (2, 4):
+        return None
+    anchor = get_event_anchor(AMET_ALEM + year)
+    if (
+        anchor + FastStartingDays.tensae
+        <= day_of_year
+        <= anchor + FastStartingDays.piraklitos
+    ):
+        return None
+    if (month, day) in astuple(FastFreeDays()) or (month, day) == get_genna_date(year):
+        return None
+    return "wednesday" if weekday == 2 else "friday"
+
+
+def is_fasting(year: int, month: int, day: int) -> bool:
+    """
+    Check if an Ethiopian date is a fast day.
+
+    Args:
+        year (int): The Ethiopian year.
+        month (int): The Ethiopian month.
+        day (int): The Ethiopian day.
+
+    Returns:
+        bool: True if a fast is kept on the date.
+    """
+    return get_fast(year, month, day) is not None
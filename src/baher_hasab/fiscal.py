@@ -0,0 +1,181 @@
+"""
+Ethiopian fiscal years, quarters, months and weeks for grouping date columns.
+
+Every function works on whole arrays, on the same ordinal path as
+``convert.datetime64_to_ethiopian``, so a group key for millions of rows is a handful
+of array operations. Requires numpy.
+"""
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from .calendars import ETHIOPIAN
+from .convert import to_ordinals
+from .helper import get_weekday, import_optional
+from .progress import CancellationToken, ProgressCallback, map_chunks
+
+PAGUMEN_RULES = ("previous", "own")
+LABELS = ("end", "start")
+PERIODS = ("year", "quarter", "month", "week")
+
+
+@dataclass(frozen=True)
+class FiscalRules:
+    """How Ethiopian dates are grouped into fiscal periods."""
+
+    # The fiscal year starts on day 1 of this month; Hamle for the government fiscal year
+    start_month: int = 11
+    # 'previous' counts Pagumen in the month before it (12 fiscal months), 'own' makes
+    # it a 13th fiscal month; either way it belongs to the quarter of the month before
+    pagumen: str = "previous"
+    # Weeks start on this weekday, Monday is 0
+    week_start: int = 0
+    # Name the fiscal year after the Ethiopian year it 'end's or 'start's in
+    label: str = "end"
+
+    def __post_init__(self) -> None:
+        if not 1 <= self.start_month <= 12:
+            raise ValueError("start_month must be between 1 (Meskerem) and 12 (Nehasse)")
+        if self.pagumen not in PAGUMEN_RULES:
+            raise ValueError(f"pagumen must be one of {PAGUMEN_RULES}")
+        if not 0 <= self.week_start <= 6:
+            raise ValueError("week_start must be between 0 (Monday) and 6 (Sunday)")
+        if self.label not in LABELS:
+            raise ValueError(f"label must be one of {LABELS}")
+
+
+@dataclass(frozen=True)
+class FiscalPeriods:
+    """The fiscal periods of an array of dates."""
+
+    years: Any  # numpy.ndarray
+    quarters: Any  # 1 to 4
+    months: Any  # 1 to 12, or 13 when Pagumen is its own month
+    # 1 to 54, week 1 contains the first day of the fiscal year; a 366-day year that
+    # starts on the last day of a week reaches 54
+    weeks: Any
+
+    def key(self, period: str = "quarter"):
+        """
+        Get a single integer group key per row.
+
+        Args:
+            period (str): 'year', 'quarter' (year * 10 + quarter), 'month'
+                (year * 100 + month) or 'week' (year * 100 + week). Defaults to 'quarter'.
+
+        Returns:
+            numpy.ndarray: The keys as ``int64``, ordered like the periods.
+        """
+        if period == "year":
+            return self.years
+        if period == "quarter":
+            return self.years * 10 + self.quarters
+        if period == "month":
+            return self.years * 100 + self.months
+        if period == "week":
+            return self.years * 100 + self.weeks
+        raise ValueError(f"period must be one of {PERIODS}")
+
+
+def _get_fiscal_periods(ordinals, rules: FiscalRules) -> FiscalPeriods:
+    np = import_optional("numpy")
+    start_month = rules.start_month
+    years, months, _ = ETHIOPIAN.from_ordinal(ordinals)
+    first_years = years - (ordinals < ETHIOPIAN.to_ordinal(years, start_month, 1))
+    first_days = ETHIOPIAN.to_ordinal(first_years, start_month, 1)
+
+    # Months since the start of the fiscal year, Pagumen included
+    position = (months - start_month) % 13
+    pagumen_position = 13 - start_month
+    # Pagumen takes the index of the month before it
+    month_index = position + (position < pagumen_position)
+    if rules.pagumen == "own":
+        fiscal_months = position + 1
+    else:
+        fiscal_months = month_index
+
+    leading_days = (get_weekday(first_days) - rules.week_start) % 7
+    weeks = (ordinals - first_days + leading_days) // 7 + 1
+
+    fiscal_years = first_years
+    if rules.label == "end" and start_month != 1:
+        fiscal_years = first_years + 1
+    return FiscalPeriods(
+        np.asarray(fiscal_years, dtype=np.int64),
+        np.asarray((month_index - 1) // 3 + 1, dtype=np.int64),
+        np.asarray(fiscal_months, dtype=np.int64),
+        np.asarray(weeks, dtype=np.int64),
+    )
+
+
+def _get_fiscal_periods_chunked(
+    ordinals, rules: FiscalRules, chunk_size, progress, cancel
+) -> FiscalPeriods:
+    def get_chunk(ordinals):
+        periods = _get_fiscal_periods(ordinals, rules)
+        return periods.years, periods.quarters, periods.months, periods.weeks
+
+    return FiscalPeriods(*map_chunks(get_chunk, [ordinals], chunk_size, progress, cancel))
+
+
+def get_fiscal_periods(
+    values,
+    rules: FiscalRules = FiscalRules(),
+    chunk_size: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[CancellationToken] = None,
+) -> FiscalPeriods:
+    """
+    Get the Ethiopian fiscal periods of an array of Gregorian dates.
+
+    Args:
+        values (array-like): ``datetime64`` values, date objects or a pandas datetime column.
+        rules (FiscalRules): How the dates are grouped. Defaults to the government fiscal
+            year, starting Hamle 1.
+        chunk_size (int, optional): Group this many rows at a time. Defaults to all at once.
+        progress (Callable[[Progress], None], optional): Called after each chunk.
+        cancel (CancellationToken, optional): Checked before each chunk; raises
+            JobCancelled once cancelled.
+
+    Returns:
+        FiscalPeriods: The fiscal year, quarter, month and week of every date.
+    """
+    return _get_fiscal_periods_chunked(
+        to_ordinals(values), rules, chunk_size, progress, cancel
+    )
+
+
+def get_fiscal_periods_ethiopian(
+    ethiopian_years,
+    ethiopian_months,
+    ethiopian_days,
+    rules: FiscalRules = FiscalRules(),
+    chunk_size: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[CancellationToken] = None,
+) -> FiscalPeriods:
+    """
+    Get the fiscal periods of arrays of Ethiopian years, months and days.
+
+    The values are not validated.
+
+    Args:
+        ethiopian_years (array-like): The Ethiopian years.
+        ethiopian_months (array-like): The Ethiopian months.
+        ethiopian_days (array-like): The Ethiopian days.
+        rules (FiscalRules): How the dates are grouped. Defaults to the government fiscal
+            year, starting Hamle 1.
+        chunk_size (int, optional): Group this many rows at a time. Defaults to all at once.
+        progress (Callable[[Progress], None], optional): Called after each chunk.
+        cancel (CancellationToken, optional): Checked before each chunk; raises
+            JobCancelled once cancelled.
+
+    Returns:
+        FiscalPeriods: The fiscal year, quarter, month and week of every date.
+    """
+    np = import_optional("numpy")
+    ordinals = ETHIOPIAN.to_ordinal(
+        np.asarray(ethiopian_years, dtype=np.int64),
+        np.asarray(ethiopian_months, dtype=np.int64),
+        np.asarray(ethiopian_days, dtype=np.int64),
+    )
+    return _get_fiscal_periods_chunked(ordinals, rules, chunk_size, progress, cancel)
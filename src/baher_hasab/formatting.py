@@ -0,0 +1,349 @@
+from functools import lru_cache
+import re
+from typing import Iterable, List, Optional, Tuple
+
+from .calendars import ETHIOPIAN
+from .lookups import EthiopianCalendarMonths
+
+ENGLISH_MONTHS: Tuple[str, ...] = tuple(
+    EthiopianCalendarMonths().reverse_mapping[month] for month in range(1, 14)
+)
+AMHARIC_MONTHS: Tuple[str, ...] = (
+    "መስከረም",
+    "ጥቅምት",
+    "ኅዳር",
+    "ታኅሣሥ",
+    "ጥር",
+    "የካቲት",
+    "መጋቢት",
+    "ሚያዝያ",
+    "ግንቦት",
+    "ሰኔ",
+    "ሐምሌ",
+    "ነሐሴ",
+    "ጳጉሜን",
+)
+MONTH_NAMES = {"en": ENGLISH_MONTHS, "am": AMHARIC_MONTHS}
+
+_GEEZ_ONES = ("", "፩", "፪", "፫", "፬", "፭", "፮", "፯", "፰", "፱")
+_GEEZ_TENS = ("", "፲", "፳", "፴", "፵", "፶", "፷", "፸", "፹", "፺")
+_GEEZ_HUNDRED = "፻"
+_GEEZ_VALUES = {
+    **{numeral: value for value, numeral in enumerate(_GEEZ_ONES) if numeral},
+    **{numeral: value * 10 for value, numeral in enumerate(_GEEZ_TENS) if numeral},
+}
+
+
+@lru_cache(maxsize=None)
+def to_geez(number: int) -> str:
+    """
+    Write a number between 1 and 9999 in Ge'ez numerals.
+
+    Args:
+        number (int): The number to write.
+
+    Returns:
+        str: The Ge'ez numeral (e.g. 2016 -> '፳፻፲፮').
+    """
+    if not 1 <= number <= 9999:
+        raise ValueError("Ge'ez numerals are supported between 1 and 9999")
+    hundreds, rest = divmod(number, 100)
+    numeral = _GEEZ_TENS[rest // 10] + _GEEZ_ONES[rest % 10]
+    if hundreds:
+        # A single hundred is written without the leading one
+        prefix = _GEEZ_TENS[hundreds // 10] + _GEEZ_ONES[hundreds % 10]
+        numeral = ("" if hundreds == 1 else prefix) + _GEEZ_HUNDRED + numeral
+    return numeral
+
+
+@lru_cache(maxsize=None)
+def from_geez(numeral: str) -> int:
+    """
+    Read a number written in Ge'ez numerals.
+
+    Args:
+        numeral (str): The Ge'ez numeral.
+
+    Returns:
+        int: The number.
+    """
+    hundreds, separator, rest = numeral.partition(_GEEZ_HUNDRED)
+    if not separator:
+        hundreds, rest = "", hundreds
+    try:
+        number = sum(_GEEZ_VALUES[character] for character in rest)
+        if separator:
+            hundreds = sum(_GEEZ_VALUES[character] for character in hundreds)
+            number += 100 * (hundreds or 1)
+    except KeyError as error:
+        raise ValueError(f"Invalid Ge'ez numeral: {numeral!r}") from error
+    if not number:
+        raise ValueError(f"Invalid Ge'ez numeral: {numeral!r}")
+    return number
+
+
+# Directive -> (field, zero padded)
+_DIRECTIVES = {
+    "Y": ("year", False),
+    "m": ("month", True),
+    "d": ("day", True),
+    "e": ("day", False),
+    "B": ("month_name", False),
+}
+_DIRECTIVE_PATTERN = re.compile(r"%(.)")
+
+
+class EthiopianDateFormat:
+    """
+    A precompiled format for writing and reading Ethiopian dates.
+
+    The pattern supports ``%Y`` (year), ``%m`` (zero padded month), ``%d`` (zero padded day),
+    ``%e`` (day), ``%B`` (month name) and ``%%``. The default ``"%B %e"`` writes dates the way
+    ``BaherHasab.get_event_date`` does (e.g. 'Yekatit 14').
+    """
+
+    def __init__(
+        self, pattern: str = "%B %e", language: str = "en", geez: bool = False
+    ) -> None:
+        """
+        Compile the format.
+
+        Args:
+            pattern (str): The format pattern.
+            language (str): The language of the month names, 'en' or 'am'.
+            geez (bool): Write the numbers in Ge'ez numerals instead of Arabic digits.
+        """
+        if language not in MONTH_NAMES:
+            raise ValueError(f"Language must be one of {sorted(MONTH_NAMES)}")
+        self.pattern = pattern
+        self.language = language
+        self.geez = geez
+        self._month_names = MONTH_NAMES[language]
+        self._month_numbers = {
+            name.lower(): month for month, name in enumerate(self._month_names, 1)
+        }
+
+        template_parts: List[str] = []
+        regex_parts: List[str] = []
+        self._fields: List[Tuple[str, bool]] = []
+        position = 0
+        for match in _DIRECTIVE_PATTERN.finditer(pattern):
+            literal = pattern[position : match.start()]
+            template_parts.append(literal.replace("{", "{{").replace("}", "}}"))
+            regex_parts.append(re.escape(literal))
+            position = match.end()
+            directive = match.group(1)
+            if directive == "%":
+                template_parts.append("%")
+                regex_parts.append("%")
+                continue
+            if directive not in _DIRECTIVES:
+                raise ValueError(f"Unknown directive %{directive} in {pattern!r}")
+            field = _DIRECTIVES[directive]
+            template_parts.append(f"{{{len(self._fields)}}}")
+            if field[0] == "month_name":
+                names = sorted(self._month_names, key=len, reverse=True)
+                regex_parts.append(f"({'|'.join(map(re.escape, names))})")
+            elif geez:
+                regex_parts.append("([፩-፼]+)")
+            else:
+                # Fixed widths, so '%Y%m%d' splits '20160614' the right way
+                if field[0] == "year":
+                    regex_parts.append(r"(\d+)")
+                else:
+                    regex_parts.append(r"(\d{2})" if field[1] else r"(\d{1,2})")
+            self._fields.append(field)
+        literal = pattern[position:]
+        template_parts.append(literal.replace("{", "{{").replace("}", "}}"))
+        regex_parts.append(re.escape(literal))
+
+        self._template = "".join(template_parts)
+        self._regex = re.compile("".join(regex_parts), re.IGNORECASE)
+        self._numbers = self._number_table(31, padded=False)
+        self._padded_numbers = self._number_table(31, padded=True)
+
+    def _number_table(self, size: int, padded: bool) -> Tuple[str, ...]:
+        if self.geez:
+            return ("",) + tuple(to_geez(number) for number in range(1, size))
+        return tuple(
+            f"{number:02d}" if padded else str(number) for number in range(size)
+        )
+
+    def _render(self, field: Tuple[str, bool], year: int, month: int, day: int) -> str:
+        name, padded = field
+        if name == "month_name":
+            return self._month_names[month - 1]
+        if name == "year":
+            return to_geez(year) if self.geez else str(year)
+        value = month if name == "month" else day
+        return (self._padded_numbers if padded else self._numbers)[value]
+
+    def format(self, year: Optional[int], month: int, day: int) -> str:
+        """
+        Write an Ethiopian date.
+
+        Args:
+            year (int): The Ethiopian year (may be None when the pattern has no %Y).
+            month (int): The Ethiopian month.
+            day (int): The Ethiopian day.
+
+        Returns:
+            str: The formatted date.
+        """
+        return self._template.format(
+            *(self._render(field, year, month, day) for field in self._fields)
+        )
+
+    def format_many(
+        self,
+        years: Optional[Iterable[int]],
+        months: Iterable[int],
+        days: Iterable[int],
+    ) -> List[str]:
+        """
+        Write many Ethiopian dates, e.g. the columns of an array.
+
+        Args:
+            years (Iterable[int]): The Ethiopian years (may be None when the pattern has no %Y).
+            months (Iterable[int]): The Ethiopian months.
+            days (Iterable[int]): The Ethiopian days.
+
+        Returns:
+            List[str]: The formatted dates.
+        """
+        months = list(map(int, months))
+        days = list(map(int, days))
+        years = [None] * len(months) if years is None else list(map(int, years))
+        columns = []
+        for name, padded in self._fields:
+            if name == "month_name":
+                columns.append([self._month_names[month - 1] for month in months])
+            elif name == "year":
+                render = to_geez if self.geez else str
+                columns.append([render(year) for year in years])
+            else:
+                table = self._padded_numbers if padded else self._numbers
+                values = months if name == "month" else days
+                columns.append([table[value] for value in values])
+        if not columns:
+            return [self._template.format()] * len(months)
+        template = self._template.format
+        return [template(*row) for row in zip(*columns)]
+
+    def parse(self, text: str) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+        """
+        Read an Ethiopian date written with this format.
+
+        Args:
+            text (str): The formatted date.
+
+        Returns:
+            Tuple[int, int, int]: The Ethiopian year, month, and day; fields missing from
+                the pattern are None.
+        """
+        match = self._regex.fullmatch(text.strip())
+        if match is None:
+            raise ValueError(f"{text!r} does not match the format {self.pattern!r}")
+        values = {"year": None, "month": None, "day": None}
+        for (name, _), value in zip(self._fields, match.groups()):
+            if name == "month_name":
+                values["month"] = self._month_numbers[value.lower()]
+            else:
+                values[name] = from_geez(value) if self.geez else int(value)
+        if values["month"] is not None and not 1 <= values["month"] <= 13:
+            raise ValueError("Ethiopian month must be between 1 and 13")
+        if values["day"] is not None:
+            max_days = 30
+            if values["month"] == 13:
+                # Without a year, allow the 6 days of the longer Pagumen
+                max_days = (
+                    6
+                    if values["year"] is None
+                    else ETHIOPIAN.month_days(values["year"], 13)
+                )
+            if not 1 <= values["day"] <= max_days:
+                raise ValueError(f"Ethiopian day must be between 1 and {max_days}")
+        return values["year"], values["month"], values["day"]
+
+    def parse_many(
+        self, texts: Iterable[str]
+    ) -> Tuple[List[Optional[int]], List[Optional[int]], List[Optional[int]]]:
+        """
+        Read many Ethiopian dates written with this format.
+
+        Args:
+            texts (Iterable[str]): The formatted dates.
+
+        Returns:
+            Tuple[List, List, List]: The Ethiopian years, months and days.
+        """
+        parse = lru_cache(maxsize=4096)(self.parse)
+        years, months, days = [], [], []
+        for text in texts:
+            year, month, day = parse(text)
+            years.append(year)
+            months.append(month)
+            days.append(day)
+        return years, months, days
+
+
+@lru_cache(maxsize=64)
+def get_format(
+    pattern: str = "%B %e", language: str = "en", geez: bool = False
+) -> EthiopianDateFormat:
+    """
+    Get a compiled format, reusing the one compiled before for the same arguments.
+
+    Args:
+        pattern (str): The format pattern.
+        language (str): The language of the month names, 'en' or 'am'.
+        geez (bool): Write the numbers in Ge'ez numerals.
+
+    Returns:
+        EthiopianDateFormat: The compiled format.
+    """
+    return EthiopianDateFormat(pattern, language, geez)
+
+
+def format_ethiopian_date(
+    year: Optional[int],
+    month: int,
+    day: int,
+    pattern: str = "%B %e",
+    language: str = "en",
+    geez: bool = False,
+) -> str:
+    """
+    Write an Ethiopian date, e.g. 'Yekatit 14' or 'የካቲት ፲፬'.
+
+    Args:
+        year (int): The Ethiopian year (may be None when the pattern has no %Y).
+        month (int): The Ethiopian month.
+        day (int): The Ethiopian day.
+        pattern (str): The format pattern.
+        language (str): The language of the month names, 'en' or 'am'.
+        geez (bool): Write the numbers in Ge'ez numerals.
+
+    Returns:
+        str: The formatted date.
+    """
+    return get_format(pattern, language, geez).format(year, month, day)
+
+
+def parse_ethiopian_date(
+    text: str, pattern: str = "%B %e", language: str = "en", geez: bool = False
+) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    """
+    Read an Ethiopian date, e.g. 'Yekatit 14' -> (None, 6, 14).
+
+    Args:
+        text (str): The formatted date.
+        pattern (str): The format pattern.
+        language (str): The language of the month names, 'en' or 'am'.
+        geez (bool): The numbers are written in Ge'ez numerals.
+
+    Returns:
+        Tuple[int, int, int]: The Ethiopian year, month, and day; fields missing from the
+            pattern are None.
+    """
+    return get_format(pattern, language, geez).parse(text)
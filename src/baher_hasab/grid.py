@@ -0,0 +1,119 @@
+"""
+Month grids for calendar views.
+
+A grid is a tuple of weeks of seven cells; the cells before day 1 and after the last
+day of the month are None. The event markers of a year are computed once per year and
+every grid is cached, so rendering a month already seen is a dictionary lookup.
+"""
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+
+from .business import get_public_holidays
+from .calendars import ETHIOPIAN
+from .formatting import ENGLISH_MONTHS
+from .helper import (
+    AMET_ALEM,
+    LAST_DATED_YEAR,
+    get_event_anchor,
+    get_month_and_day,
+    get_weekday,
+)
+from .lookups import FastStartingDays
+from .tables import EVENT_NAMES
+
+
+@dataclass(frozen=True)
+class GridDay:
+    """A day of a month grid."""
+
+    day: int
+    weekday: int  # Monday is 0, as in DaysBookmark
+    gregorian: date
+    events: Tuple[str, ...]  # the movable events and public holidays of the day
+
+
+@dataclass(frozen=True)
+class MonthGrid:
+    """The weeks of an Ethiopian month, ready to render."""
+
+    year: int
+    month: int
+    name: str
+    first_weekday: int
+    weeks: Tuple[Tuple[Optional[GridDay], ...], ...]
+
+    @property
+    def days(self) -> Tuple[GridDay, ...]:
+        """Tuple[GridDay, ...]: The days of the month in order."""
+        return tuple(cell for week in self.weeks for cell in week if cell is not None)
+
+
+@lru_cache(maxsize=64)
+def get_year_markers(year: int) -> Mapping[Tuple[int, int], Tuple[str, ...]]:
+    """
+    Get the events and public holidays of an Ethiopian year by date.
+
+    Args:
+        year (int): The Ethiopian year.
+
+    Returns:
+        Mapping[Tuple[int, int], Tuple[str, ...]]: The names on each (month, day) that has
+            any, the movable events first; read-only, as it is cached.
+    """
+    anchor = get_event_anchor(AMET_ALEM + year)
+    markers: Dict[Tuple[int, int], Tuple[str, ...]] = {}
+
+    def add(month_and_day: Tuple[int, int], name: str) -> None:
+        names = markers.get(month_and_day, ())
+        if name not in names:
+            markers[month_and_day] = names + (name,)
+
+    add(get_month_and_day(anchor), "nenewe")
+    for event in EVENT_NAMES:
+        add(get_month_and_day(anchor + getattr(FastStartingDays, event)), event)
+    for holiday, month_and_day in get_public_holidays(year).items():
+        add(month_and_day, holiday)
+    return MappingProxyType(markers)
+
+
+@lru_cache(maxsize=512)
+def get_month_grid(year: int, month: int, first_weekday: int = 0) -> MonthGrid:
+    """
+    Get the grid of an Ethiopian month, including Pagumen's 5 or 6 days, for the years
+    up to ``LAST_DATED_YEAR``.
+
+    Args:
+        year (int): The Ethiopian year.
+        month (int): The Ethiopian month.
+        first_weekday (int): The weekday of the first column, Monday is 0 and
+            Sunday is 6. Defaults to 0.
+
+    Returns:
+        MonthGrid: The weeks of the month.
+    """
+    ETHIOPIAN.validate(year, month, 1)
+    if year > LAST_DATED_YEAR:
+        raise ValueError(
+            f"Ethiopian year must be at most {LAST_DATED_YEAR}, the last year with Gregorian dates"
+        )
+    if not 0 <= first_weekday <= 6:
+        raise ValueError("first_weekday must be between 0 (Monday) and 6 (Sunday)")
+
+    markers = get_year_markers(year)
+    first = ETHIOPIAN.to_ordinal(year, month, 1)
+    leading = (get_weekday(first) - first_weekday) % 7
+    cells = [None] * leading + [
+        GridDay(
+            day,
+            get_weekday(first + day - 1),
+            date.fromordinal(first + day - 1),
+            markers.get((month, day), ()),
+        )
+        for day in range(1, ETHIOPIAN.month_days(year, month) + 1)
+    ]
+    cells += [None] * (-len(cells) % 7)
+    weeks = tuple(tuple(cells[start : start + 7]) for start in range(0, len(cells), 7))
+    return MonthGrid(year, month, ENGLISH_MONTHS[month - 1], first_weekday, weeks)
@@ -1,5 +1,7 @@
 from .lookups import FastStartingDays, MonthForFasting
-from typing import Tuple
+from .calendars import ETHIOPIAN, GREGORIAN, JULIAN, convert
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import importlib
 
 
 def add_days(day: str, num_days: int) -> str:
@@ -67,72 +69,14 @@ def calculate_gregorian_to_ethiopian(
     Returns:
         Tuple[int, int, int]: The Ethiopian year, month, and day.
     """
-    if not 1 <= gregorian_year <= 9999:
-        raise ValueError("Gregorian year must be a 4-digit integer")
-    if not 1 <= gregorian_month <= 12:
-        raise ValueError("Gregorian month must be between 1 and 12")
-
-    # Calculate the number of days in the Gregorian month and year
-    if gregorian_month in [1, 3, 5, 7, 8, 10, 12]:
-        max_days = 31
-    elif gregorian_month == 2:
-        max_days = 28 if is_gregorian_leap_year(gregorian_year) else 29
-    else:
-        max_days = 30
-
-    if not 1 <= gregorian_day <= max_days:
-        raise ValueError(f"Gregorian day must be between 1 and {max_days}")
-
-    # Difference in years between Gregorian and Ethiopian calendars
-    ethio_year_diff = 7
-
-    # New year date in Ethiopian calendar in Gregorian calendar
-    if is_gregorian_leap_year(gregorian_year + 1):
-        new_year_date = (9, 12)  # September 12 in a leap year
-    else:
-        new_year_date = (9, 11)  # September 11 in a common year
-
-    # Calculate Ethiopian year
-    diff_eight = False
-    if (gregorian_month, gregorian_day) >= new_year_date:
-        ethiopian_year = gregorian_year - ethio_year_diff
-    else:
-        ethiopian_year = gregorian_year - ethio_year_diff - 1
-        diff_eight = True
-
-    # Calculate the number of days since the last Ethiopian New Year
-    gregorian_month_days = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-    if is_gregorian_leap_year(gregorian_year):
-        gregorian_month_days[1] = 29
-
-    days_in_gregorian_year = sum(gregorian_month_days)
-    days_since_new_year = (
-        sum(gregorian_month_days[: gregorian_month - 1]) + gregorian_day
+    ethiopian = convert(
+        gregorian_year, gregorian_month, gregorian_day, GREGORIAN, ETHIOPIAN
     )
-    days_since_new_year -= (
-        sum(gregorian_month_days[: new_year_date[0] - 1]) + new_year_date[1]
-    )
-
-    if days_since_new_year < 0:
-        days_since_new_year += days_in_gregorian_year
-
-    # Calculate Ethiopian month and day
-    ethiopian_month = days_since_new_year // 30 + 1
-    # ethiopian_day = days_since_new_year % 30 + 1
-    if diff_eight:
-        ethiopian_day = days_since_new_year % 30
-    else:
-        ethiopian_day = days_since_new_year % 30 + 1
-    if ethiopian_month == 13 and ethiopian_day < 5:
-        ethiopian_day += 1
-
-    if ((ethiopian_year + 1) % 4) == 0 and (gregorian_month, gregorian_day) == (
-        new_year_date[0],
-        new_year_date[1] - 1,
-    ):
-        return ethiopian_year, 13, 6
-
-    return ethiopian_year, ethiopian_month, ethiopian_day
+    if ethiopian[0] < ETHIOPIAN.min_year:
+        raise ValueError(
+            "Gregorian date must be on or after 0008-08-27, the first day of the Ethiopian year 1"
+        )
+    return ethiopian
 
 
 def calculate_ethiopian_to_gregorian(
@@ -148,65 +92,108 @@ def calculate_ethiopian_to_gregorian(
     Returns:
         Tuple[int, int, int]: The Gregorian year, month, and day.
     """
-    if not 1 <= ethiopian_year <= 9999:
-        raise ValueError("Ethiopian year must be a 4-digit integer")
-    if not 1 <= ethiopian_month <= 13:
-        raise ValueError("Ethiopian month must be between 1 and 13")
-    if not 1 <= ethiopian_day <= 30:
-        raise ValueError("Ethiopian day must be between 1 and 30")
-
-    # Calculate the number of days in the Ethiopian month
-    max_days = 30
-    if ethiopian_month == 13:
-        max_days = 6 if (ethiopian_year % 4) == 3 else 5
-
-    if not 1 <= ethiopian_day <= max_days:
-        raise ValueError(f"Ethiopian day must be between 1 and {max_days}")
-
-    # Difference in years between Gregorian and Ethiopian calendars
-    ethio_year_diff = 7
-
-    gregorian_year = ethiopian_year + ethio_year_diff
-
-    # New year date in Ethiopian calendar in Gregorian calendar
-    if is_gregorian_leap_year(gregorian_year + 1):
-        new_year_date = (9, 12)  # September 12 in a leap year
-    else:
-        new_year_date = (9, 11)  # September 11 in a common year
-
-    # Calculate the number of days since the Ethiopian New Year
-    days_since_new_year = (ethiopian_month - 1) * 30 + (ethiopian_day - 1)
-
-    # Calculate the Gregorian date
-    gregorian_month_days = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-    if is_gregorian_leap_year(gregorian_year + 1):
-        gregorian_month_days[1] = 29
-
-    days_in_gregorian_year = sum(gregorian_month_days)
-    new_year_day_of_year = (
-        sum(gregorian_month_days[: new_year_date[0] - 1]) + new_year_date[1]
-    )
+    return convert(ethiopian_year, ethiopian_month, ethiopian_day, ETHIOPIAN, GREGORIAN)
+
+
+# Ordinal (``datetime.date.toordinal``) of Meskerem 1 of the Ethiopian year 1
+ETHIOPIAN_EPOCH = ETHIOPIAN.epoch
+# Ordinal of 1970-01-01, the epoch of NumPy ``datetime64``
+UNIX_EPOCH_ORDINAL = 719163
+# The last Ethiopian year whose days all have a ``datetime.date``: the Julian drift
+# puts Pagumen 5 of 9991 on 9999-11-10
+LAST_DATED_YEAR = 9991
+# Years before Christ, added to the Ethiopian year to get the total years
+AMET_ALEM = 5500
+
+
+def import_optional(module_name: str, extra: Optional[str] = None):
+    """
+    Import an optional dependency, raising an informative error when it is missing.
+
+    Args:
+        module_name (str): The name of the module to import (e.g. 'numpy').
+        extra (str, optional): The package extra that installs it. Defaults to the
+            module name.
+
+    Returns:
+        module: The imported module.
+    """
+    try:
+        return importlib.import_module(module_name)
+    except ImportError as error:
+        raise ImportError(
+            f"This feature requires {module_name}: pip install baher_hasab[{extra or module_name}]"
+        ) from error
+
+
+def ethiopian_to_ordinal(
+    ethiopian_year: int, ethiopian_month: int, ethiopian_day: int
+) -> int:
+    """Convert an Ethiopian date to a proleptic Gregorian ordinal.
+    Works element-wise on NumPy integer arrays as well.
 
-    gregorian_day_of_year = new_year_day_of_year + days_since_new_year
-    if gregorian_year - ethiopian_year == 8:
-        gregorian_day_of_year -= 1
+    Args:
+        ethiopian_year (int): The Ethiopian year.
+        ethiopian_month (int): The Ethiopian month.
+        ethiopian_day (int): The Ethiopian day.
 
-    if gregorian_day_of_year > days_in_gregorian_year:
-        gregorian_day_of_year -= days_in_gregorian_year
-        gregorian_year += 1
+    Returns:
+        int: The ordinal, compatible with ``datetime.date.fromordinal``.
+    """
+    return ETHIOPIAN.to_ordinal(ethiopian_year, ethiopian_month, ethiopian_day)
+
+
+def ordinal_to_ethiopian(ordinal: int) -> Tuple[int, int, int]:
+    """Convert a proleptic Gregorian ordinal to an Ethiopian date.
+    Works element-wise on NumPy integer arrays as well.
+
+    Args:
+        ordinal (int): The ordinal, as returned by ``datetime.date.toordinal``.
+
+    Returns:
+        Tuple[int, int, int]: The Ethiopian year, month, and day.
+    """
+    return ETHIOPIAN.from_ordinal(ordinal)
+
+
+def get_month_and_day(day_of_year: int) -> Tuple[int, int]:
+    """Split an Ethiopian day of the year, 1 for Meskerem 1, into its month and day.
+    Works element-wise on NumPy integer arrays as well.
+
+    Args:
+        day_of_year (int): The day of the year.
+
+    Returns:
+        Tuple[int, int]: The Ethiopian month and day.
+    """
+    return (day_of_year - 1) // 30 + 1, (day_of_year - 1) % 30 + 1
+
+
+def get_weekday(ordinal: int) -> int:
+    """Get the weekday of a proleptic Gregorian ordinal, Monday is 0 as in ``DaysBookmark``.
+    Works element-wise on NumPy integer arrays as well.
+
+    Args:
+        ordinal (int): The ordinal, as returned by ``datetime.date.toordinal``.
+
+    Returns:
+        int: The weekday, 0 (Monday) to 6 (Sunday).
+    """
+    # Ordinal 1 (0001-01-01) is a Monday
+    return (ordinal - 1) % 7
 
-    # Calculate the month and day
-    gregorian_month = 1
-    while gregorian_day_of_year > gregorian_month_days[gregorian_month - 1]:
-        gregorian_day_of_year -= gregorian_month_days[gregorian_month - 1]
-        gregorian_month += 1
 
-    gregorian_day = gregorian_day_of_year
+def get_genna_date(ethiopian_year: int) -> Tuple[int, int]:
+    """Get the date of Genna, Julian December 25: Tahsas 29, or Tahsas 28 in the
+    years that follow a Pagumen 6.
 
-    if ((ethiopian_year + 1) % 4) == 0 and (ethiopian_month, ethiopian_day) == (13, 6):
-        return gregorian_year, 9, 11
+    Args:
+        ethiopian_year (int): The Ethiopian year.
 
-    return gregorian_year, gregorian_month, gregorian_day
+    Returns:
+        Tuple[int, int]: The Ethiopian month and day.
+    """
+    return ETHIOPIAN.from_ordinal(JULIAN.to_ordinal(ethiopian_year + 7, 12, 25))[1:]
 
 
 # @staticmethod
@@ -240,6 +227,122 @@ def calculate_event_date(
     return month_of_event, day_of_event
 
 
+def get_metke_day_of_year(total_years: int) -> int:
+    """
+    Calculate the day of the year (counted from Meskerem 1) on which Metke falls.
+    Works element-wise on NumPy integer arrays as well.
+
+    Args:
+        total_years (int): The total years since the creation of the world.
+
+    Returns:
+        int: The day of the year of Metke.
+    """
+    wember = (total_years - 1) % 19
+    metke = 30 - (wember * 11) % 30
+    metke_month = 30 * (metke <= 13)  # 0 if metke > 13 else 30, also for arrays
+    return metke_month + metke
+
+
+def get_event_anchor(total_years: int) -> int:
+    """
+    Calculate the day of the year the ``FastStartingDays`` lengths are counted from.
+
+    Adding the length of an event to the anchor gives the day of the year of the event,
+    the same value ``calculate_event_date`` splits into a month and a day.
+    Works element-wise on NumPy integer arrays as well.
+
+    Args:
+        total_years (int): The total years since the creation of the world.
+
+    Returns:
+        int: The anchor day of the year.
+    """
+    metke_day_of_year = get_metke_day_of_year(total_years)
+    day_of_week_of_metke = get_day_of_week(
+        get_total_days(total_years) + metke_day_of_year
+    )
+    return metke_day_of_year + calculate_days_to_nenewe(day_of_week_of_metke) - 1
+
+
+def get_computus_event_anchor(total_years: int) -> int:
+    """
+    Calculate the same anchor as ``get_event_anchor`` from Tensae, found with the
+    closed-form Julian computus instead of the Metke and Nenewe chain.
+    Works element-wise on NumPy integer arrays as well.
+
+    Args:
+        total_years (int): The total years since the creation of the world.
+
+    Returns:
+        int: The anchor day of the year.
+    """
+    ethiopian_year = total_years - AMET_ALEM
+    # Tensae of an Ethiopian year falls in the Julian year 8 years later
+    julian_year = ethiopian_year + 8
+    epact = (19 * (julian_year % 19) + 15) % 30
+    weekday_offset = (2 * (julian_year % 4) + 4 * (julian_year % 7) - epact + 34) % 7
+    month = (epact + weekday_offset + 114) // 31
+    day = (epact + weekday_offset + 114) % 31 + 1
+
+    tensae_day_of_year = (
+        JULIAN.to_ordinal(julian_year, month, day)
+        - ETHIOPIAN.to_ordinal(ethiopian_year, 1, 1)
+        + 1
+    )
+    return tensae_day_of_year - FastStartingDays.tensae
+
+
+# Ways of calculating the event anchor, selectable with the ``engine`` arguments
+EVENT_ENGINES: Dict[str, Callable[[int], int]] = {
+    "nenewe": get_event_anchor,
+    "computus": get_computus_event_anchor,
+}
+
+
+def get_event_engine(engine: str) -> Callable[[int], int]:
+    """
+    Get the anchor function of an engine.
+
+    Args:
+        engine (str): The name of the engine, 'nenewe' or 'computus'.
+
+    Returns:
+        Callable[[int], int]: Maps the total years to the event anchor.
+    """
+    try:
+        return EVENT_ENGINES[engine]
+    except KeyError:
+        raise ValueError(
+            f"Unknown engine {engine!r}, expected one of {sorted(EVENT_ENGINES)}"
+        ) from None
+
+
+def cross_check_engines(
+    start_year: int = 1,
+    stop_year: int = 10000,
+    engines: Sequence[str] = ("nenewe", "computus"),
+) -> List[int]:
+    """
+    Compare the event anchors of engines over ``range(start_year, stop_year)``.
+
+    Args:
+        start_year (int): The first Ethiopian year.
+        stop_year (int): The Ethiopian year after the last one.
+        engines (Sequence[str]): The engines to compare.
+
+    Returns:
+        List[int]: The Ethiopian years on which the engines disagree, empty if none.
+    """
+    anchors = [get_event_engine(engine) for engine in engines]
+    mismatches = []
+    for year in range(start_year, stop_year):
+        total_years = AMET_ALEM + year
+        if len({anchor(total_years) for anchor in anchors}) > 1:
+            mismatches.append(year)
+    return mismatches
+
+
 def old_get_event_date(self, event_name: str) -> str:
     """
     Calculate the date of an event based on the nenewe day and the length to the event.
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, asdict, field
-from typing import Dict
+from typing import Dict, Tuple
 
 
 class ReverseMapping:
@@ -104,3 +104,51 @@ class MonthForFasting:
     dehenet: Dict[str, int] = field(
         default_factory=lambda: {"Ginbot": 120, "Sene": 150}
     )  # 9 10
+
+
+@dataclass(frozen=True)
+class FixedFastingDays:
+    """Fasts on fixed Ethiopian dates, as ((first month, first day), (last month, last day))."""
+
+    # Ends the day before Genna, which moves to Tahsas 28 after a Pagumen 6
+    tsome_nebiyat: Tuple[Tuple[int, int], Tuple[int, int]] = ((3, 15), (4, 28))
+    gahad: Tuple[Tuple[int, int], Tuple[int, int]] = ((5, 10), (5, 10))
+    filseta: Tuple[Tuple[int, int], Tuple[int, int]] = ((12, 1), (12, 15))
+
+
+@dataclass(frozen=True)
+class FastFreeDays:
+    """
+    Feasts on which the Wednesday and Friday fast is lifted, as (month, day); Genna also
+    lifts it, see ``helper.get_genna_date``.
+    """
+
+    timket: Tuple[int, int] = (5, 11)
+
+
+@dataclass(frozen=True)
+class PublicHolidays:
+    """Public holidays on fixed Ethiopian dates, as (month, day)."""
+
+    enkutatash: Tuple[int, int] = (1, 1)
+    meskel: Tuple[int, int] = (1, 17)
+    timket: Tuple[int, int] = (5, 11)
+    adwa: Tuple[int, int] = (6, 23)
+    arbegnoch: Tuple[int, int] = (8, 27)
+    derg_downfall: Tuple[int, int] = (9, 20)
+
+
+@dataclass(frozen=True)
+class MonthlyCommemorations:
+    """Saints and feasts commemorated on the same day of every Ethiopian month."""
+
+    abo: int = 5
+    selassie: int = 7
+    mikael: int = 12
+    kidane_mehret: int = 16
+    gabriel: int = 19
+    mariam: int = 21
+    giyorgis: int = 23
+    tekle_haymanot: int = 24
+    medhane_alem: int = 27
+    amanuel: int = 28
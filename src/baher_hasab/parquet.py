@@ -0,0 +1,145 @@
+"""
+Streaming conversion of Parquet / Arrow date columns to Ethiopian dates.
+
+Requires pyarrow (and numpy). Files are processed one row group at a time, so memory
+use is bounded by the size of a row group.
+"""
+from typing import Iterable, Optional, Sequence
+
+from .helper import (
+    AMET_ALEM,
+    UNIX_EPOCH_ORDINAL,
+    get_event_anchor,
+    import_optional,
+    ordinal_to_ethiopian,
+)
+from .lookups import FastStartingDays
+from .progress import CancellationToken, ProgressCallback, ProgressMeter
+from .tables import EVENT_NAMES
+
+
+def _event_lookup(np):
+    # Days after the anchor -> index into EVENT_NAMES, -1 for days without an event
+    lengths = [getattr(FastStartingDays, event) for event in EVENT_NAMES]
+    lookup = np.full(max(lengths) + 1, -1, dtype=np.int8)
+    lookup[lengths] = np.arange(len(lengths))
+    return lookup
+
+
+def convert_arrow(table, columns: Sequence[str], events: bool = False):
+    """
+    Add the Ethiopian date of each named date column to an Arrow table or record batch.
+
+    For every column ``c`` the int columns ``c_eth_year``, ``c_eth_month`` and ``c_eth_day``
+    are appended, plus ``c_event`` (the movable event on that date, null otherwise)
+    when ``events`` is set. The conversion runs on the Arrow buffers with array
+    operations; nulls stay null.
+
+    Args:
+        table (pyarrow.Table | pyarrow.RecordBatch): The data, with date or timestamp columns.
+        columns (Sequence[str]): The names of the columns to convert.
+        events (bool): Also add the event columns.
+
+    Returns:
+        pyarrow.Table | pyarrow.RecordBatch: The data with the added columns.
+    """
+    pa = import_optional("pyarrow")
+    np = import_optional("numpy")
+    names = list(table.schema.names)
+    arrays = list(table.columns)
+    for column in columns:
+        values = table.column(column)
+        if isinstance(values, pa.ChunkedArray):
+            values = values.combine_chunks()
+        days = values.cast(pa.date32()).cast(pa.int32())
+        mask = np.asarray(days.is_null())
+        ordinals = days.fill_null(0).to_numpy().astype(np.int64) + UNIX_EPOCH_ORDINAL
+        years, months, days_of_month = ordinal_to_ethiopian(ordinals)
+
+        names += [f"{column}_eth_year", f"{column}_eth_month", f"{column}_eth_day"]
+        arrays += [
+            pa.array(years.astype(np.int16), mask=mask),
+            pa.array(months.astype(np.int8), mask=mask),
+            pa.array(days_of_month.astype(np.int8), mask=mask),
+        ]
+        if events:
+            lookup = _event_lookup(np)
+            day_of_year = (months - 1) * 30 + days_of_month
+            after_anchor = day_of_year - get_event_anchor(AMET_ALEM + years)
+            in_range = (after_anchor >= 0) & (after_anchor < len(lookup))
+            event_index = np.where(
+                in_range, lookup[np.clip(after_anchor, 0, len(lookup) - 1)], -1
+            )
+            event_mask = mask | (event_index < 0)
+            names.append(f"{column}_event")
+            arrays.append(
+                pa.DictionaryArray.from_arrays(
+                    pa.array(np.maximum(event_index, 0).astype(np.int8), mask=event_mask),
+                    pa.array(EVENT_NAMES),
+                )
+            )
+    if isinstance(table, pa.RecordBatch):
+        return pa.RecordBatch.from_arrays(arrays, names=names)
+    return pa.Table.from_arrays(arrays, names=names)
+
+
+def iter_converted_row_groups(
+    source, columns: Sequence[str], events: bool = False
+) -> Iterable:
+    """
+    Read a Parquet file row group by row group and convert its date columns.
+
+    Args:
+        source (str | file-like): The Parquet file.
+        columns (Sequence[str]): The names of the date columns to convert.
+        events (bool): Also add the event columns.
+
+    Yields:
+        pyarrow.Table: Each converted row group, in order.
+    """
+    pq = import_optional("pyarrow.parquet", "pyarrow")
+    parquet_file = pq.ParquetFile(source)
+    for index in range(parquet_file.num_row_groups):
+        yield convert_arrow(parquet_file.read_row_group(index), columns, events)
+
+
+def convert_parquet(
+    source,
+    destination,
+    columns: Sequence[str],
+    events: bool = False,
+    compression: Optional[str] = "snappy",
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[CancellationToken] = None,
+) -> int:
+    """
+    Convert the date columns of a Parquet file, one row group at a time.
+
+    Each input row group is written as one output row group.
+
+    Args:
+        source (str | file-like): The Parquet file to read.
+        destination (str | file-like): The Parquet file to write.
+        columns (Sequence[str]): The names of the date columns to convert.
+        events (bool): Also add the event columns.
+        compression (str): The compression of the written file.
+        progress (Callable[[Progress], None], optional): Called after each row group.
+        cancel (CancellationToken, optional): Checked before each row group; raises
+            JobCancelled once cancelled, leaving the rows written so far.
+
+    Returns:
+        int: The number of rows written.
+    """
+    pq = import_optional("pyarrow.parquet", "pyarrow")
+    parquet_file = pq.ParquetFile(source)
+    meter = ProgressMeter(parquet_file.metadata.num_rows, progress, cancel)
+    # Converting an empty table gives the schema, so a file without row groups
+    # still produces a destination file
+    schema = convert_arrow(parquet_file.schema_arrow.empty_table(), columns, events).schema
+    with pq.ParquetWriter(destination, schema, compression=compression) as writer:
+        for index in range(parquet_file.num_row_groups):
+            meter.check()
+            table = convert_arrow(parquet_file.read_row_group(index), columns, events)
+            writer.write_table(table)
+            meter.update(table.num_rows)
+    return meter.rows
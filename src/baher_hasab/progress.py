@@ -0,0 +1,169 @@
+"""
+Progress reporting, chunking and cancellation for the bulk functions.
+
+A bulk function given ``chunk_size`` processes that many rows at a time. After each
+chunk it calls ``progress`` with a ``Progress``, and before each chunk it checks
+``cancel``. Cancelling stops the job within one chunk by raising ``JobCancelled``.
+"""
+import threading
+import time
+from typing import Callable, Iterator, NamedTuple, Optional, Sequence, Tuple
+
+
+class JobCancelled(Exception):
+    """Raised by a bulk function whose CancellationToken was cancelled."""
+
+
+class Progress(NamedTuple):
+    """The progress of a bulk job after a chunk."""
+
+    rows: int
+    total: int
+    elapsed: float  # seconds since the job started
+    rows_per_second: float
+
+    @property
+    def fraction(self) -> float:
+        """float: The share of the rows done, from 0 to 1."""
+        return self.rows / self.total if self.total else 1.0
+
+
+ProgressCallback = Callable[[Progress], None]
+
+
+class CancellationToken:
+    """A flag to stop bulk jobs, safe to set from another thread."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """Ask the jobs using this token to stop before their next chunk."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """bool: True once ``cancel`` was called."""
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        """Raise JobCancelled if ``cancel`` was called."""
+        if self._event.is_set():
+            raise JobCancelled("The job was cancelled")
+
+
+class ProgressMeter:
+    """Counts the rows of a job and reports them to a progress callback."""
+
+    def __init__(
+        self,
+        total: int,
+        progress: Optional[ProgressCallback] = None,
+        cancel: Optional[CancellationToken] = None,
+    ) -> None:
+        """
+        Start timing a job.
+
+        Args:
+            total (int): The number of rows of the job.
+            progress (Callable[[Progress], None], optional): Called after each chunk.
+            cancel (CancellationToken, optional): Checked before each chunk.
+        """
+        self.total = total
+        self.rows = 0
+        self._progress = progress
+        self._cancel = cancel
+        self._started = time.perf_counter()
+
+    def check(self) -> None:
+        """Raise JobCancelled if the job was cancelled."""
+        if self._cancel is not None:
+            self._cancel.raise_if_cancelled()
+
+    def update(self, rows: int) -> None:
+        """
+        Count the rows of a finished chunk and report the progress.
+
+        Args:
+            rows (int): The number of rows of the chunk.
+        """
+        self.rows += rows
+        if self._progress is not None:
+            elapsed = time.perf_counter() - self._started
+            rate = self.rows / elapsed if elapsed > 0 else float("inf")
+            self._progress(Progress(self.rows, self.total, elapsed, rate))
+
+
+def iter_chunks(
+    total: int,
+    chunk_size: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[CancellationToken] = None,
+) -> Iterator[Tuple[int, int]]:
+    """
+    Split ``range(total)`` into chunks, reporting the progress of each chunk once the
+    caller has processed it.
+
+    Args:
+        total (int): The number of rows.
+        chunk_size (int, optional): The rows per chunk. Defaults to all the rows in one chunk.
+        progress (Callable[[Progress], None], optional): Called after each chunk.
+        cancel (CancellationToken, optional): Checked before each chunk.
+
+    Yields:
+        Tuple[int, int]: The start and stop of each chunk.
+    """
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    chunk_size = chunk_size or max(total, 1)
+    meter = ProgressMeter(total, progress, cancel)
+    for start in range(0, total, chunk_size):
+        meter.check()
+        stop = min(start + chunk_size, total)
+        yield start, stop
+        meter.update(stop - start)
+
+
+def map_chunks(
+    function: Callable[..., Tuple],
+    columns: Sequence,
+    chunk_size: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[CancellationToken] = None,
+) -> Tuple:
+    """
+    Apply an array function to the rows of broadcast columns one chunk at a time.
+
+    The outputs are allocated once, from the dtypes of the first chunk, and filled
+    chunk by chunk; requires numpy.
+
+    Args:
+        function (Callable[..., Tuple[numpy.ndarray, ...]]): Maps one 1-D chunk of every
+            column to a tuple of 1-D arrays with a value per row.
+        columns (Sequence[array-like]): The inputs, broadcast against each other.
+        chunk_size (int, optional): The rows per chunk. Defaults to all the rows in one chunk.
+        progress (Callable[[Progress], None], optional): Called after each chunk.
+        cancel (CancellationToken, optional): Checked before each chunk.
+
+    Returns:
+        Tuple[numpy.ndarray, ...]: The outputs of ``function`` in the broadcast shape of
+            the columns, as scalars when every column is one.
+    """
+    from .helper import import_optional
+
+    np = import_optional("numpy")
+    columns = np.broadcast_arrays(*(np.asarray(column) for column in columns))
+    shape = columns[0].shape
+    flat = [column.ravel() for column in columns]
+    total = flat[0].size
+    outputs = None
+    for start, stop in iter_chunks(total, chunk_size, progress, cancel):
+        result = function(*(column[start:stop] for column in flat))
+        if outputs is None:
+            outputs = [np.empty(total, dtype=np.asarray(values).dtype) for values in result]
+        for output, values in zip(outputs, result):
+            output[start:stop] = values
+    if outputs is None:
+        # No rows: the function still gives the dtypes of the empty outputs
+        outputs = [np.asarray(values) for values in function(*flat)]
+    return tuple(output.reshape(shape)[()] for output in outputs)
@@ -0,0 +1,183 @@
+"""
+Recurring Ethiopian observances: monthly on a day, annually on a date, or a number of
+days from a movable event.
+
+``Recurrence.occurrences`` expands a rule lazily, one year at a time;
+``Recurrence.expand`` computes every occurrence of a range with array operations.
+"""
+from dataclasses import dataclass
+from typing import Iterator, Optional, Tuple
+
+from .calendars import ETHIOPIAN
+from .helper import AMET_ALEM, get_event_anchor, import_optional
+from .lookups import FastStartingDays
+from .progress import CancellationToken, ProgressCallback, iter_chunks
+from .tables import EVENT_NAMES
+
+FREQUENCIES = ("monthly", "annually", "relative")
+
+EthiopianDate = Tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class Recurrence:
+    """A rule for a recurring observance; build it with ``monthly``, ``annually`` or ``relative``."""
+
+    frequency: str
+    day: int = 0
+    month: Optional[int] = None
+    event: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.frequency == "monthly":
+            if not 1 <= self.day <= 30:
+                raise ValueError("Ethiopian day must be between 1 and 30")
+        elif self.frequency == "annually":
+            # Pagumen 6 only exists in the years before a multiple of 4
+            ETHIOPIAN.validate(3, self.month or 0, self.day)
+        elif self.frequency == "relative":
+            if self.event != "nenewe" and self.event not in EVENT_NAMES:
+                raise ValueError(f"Unknown event {self.event!r}")
+        else:
+            raise ValueError(f"frequency must be one of {FREQUENCIES}")
+
+    @classmethod
+    def monthly(cls, day: int) -> "Recurrence":
+        """
+        Recur on a day of every month; Pagumen is included when it has that day.
+
+        Args:
+            day (int): The Ethiopian day, 1 to 30.
+
+        Returns:
+            Recurrence: The rule.
+        """
+        return cls("monthly", day)
+
+    @classmethod
+    def annually(cls, month: int, day: int) -> "Recurrence":
+        """
+        Recur on an Ethiopian date every year; Pagumen 6 only in the years that have it.
+
+        Args:
+            month (int): The Ethiopian month.
+            day (int): The Ethiopian day.
+
+        Returns:
+            Recurrence: The rule.
+        """
+        return cls("annually", day, month)
+
+    @classmethod
+    def relative(cls, event: str, days: int = 0) -> "Recurrence":
+        """
+        Recur a number of days from a movable event every year.
+
+        Args:
+            event (str): 'nenewe' or one of ``EVENT_NAMES``.
+            days (int): The days after the event, negative for before. Defaults to 0.
+
+        Returns:
+            Recurrence: The rule.
+        """
+        return cls("relative", days, event=event)
+
+    def _year_ordinals(self, year: int) -> Iterator[int]:
+        new_year = ETHIOPIAN.to_ordinal(year, 1, 1) - 1
+        if self.frequency == "monthly":
+            last_month = 13 if self.day <= ETHIOPIAN.month_days(year, 13) else 12
+            for month in range(1, last_month + 1):
+                yield new_year + 30 * (month - 1) + self.day
+        elif self.frequency == "annually":
+            if self.day <= ETHIOPIAN.month_days(year, self.month):
+                yield new_year + 30 * (self.month - 1) + self.day
+        else:
+            yield new_year + get_event_anchor(AMET_ALEM + year) + self._length + self.day
+
+    @property
+    def _length(self) -> int:
+        return getattr(FastStartingDays, self.event, 0)
+
+    def _year_range(self, start: EthiopianDate, stop: EthiopianDate) -> range:
+        ETHIOPIAN.validate(*start)
+        ETHIOPIAN.validate(*stop)
+        # A relative rule can fall outside the year of its event
+        spread = 0 if self.frequency != "relative" else abs(self.day) // 365 + 1
+        return range(max(start[0] - spread, 1), min(stop[0] + spread, 9999) + 1)
+
+    def occurrences(
+        self, start: EthiopianDate, stop: EthiopianDate
+    ) -> Iterator[EthiopianDate]:
+        """
+        Lazily generate the occurrences from ``start`` up to, but not including, ``stop``.
+
+        Args:
+            start (Tuple[int, int, int]): The first Ethiopian date (year, month, day).
+            stop (Tuple[int, int, int]): The Ethiopian date after the range.
+
+        Yields:
+            Tuple[int, int, int]: The Ethiopian year, month, and day of each occurrence,
+                in order.
+        """
+        first = ETHIOPIAN.to_ordinal(*start)
+        last = ETHIOPIAN.to_ordinal(*stop)
+        for year in self._year_range(start, stop):
+            for ordinal in self._year_ordinals(year):
+                if ordinal >= last:
+                    return
+                if ordinal >= first:
+                    yield ETHIOPIAN.from_ordinal(ordinal)
+
+    def _expand_years(self, years):
+        np = import_optional("numpy")
+        new_year = ETHIOPIAN.to_ordinal(years, 1, 1) - 1
+        if self.frequency == "relative":
+            return new_year + get_event_anchor(AMET_ALEM + years) + self._length + self.day
+        months = np.arange(1, 14) if self.frequency == "monthly" else np.array([self.month])
+        ordinals = (new_year[:, None] + 30 * (months - 1) + self.day).ravel()
+        years = np.repeat(years, len(months))
+        months = np.tile(months, len(new_year))
+        return ordinals[self.day <= ETHIOPIAN.month_days(years, months)]
+
+    def expand(
+        self,
+        start: EthiopianDate,
+        stop: EthiopianDate,
+        chunk_size: Optional[int] = None,
+        progress: Optional[ProgressCallback] = None,
+        cancel: Optional[CancellationToken] = None,
+    ):
+        """
+        Compute every occurrence from ``start`` up to, but not including, ``stop`` with
+        array operations, for long ranges.
+
+        Args:
+            start (Tuple[int, int, int]): The first Ethiopian date (year, month, day).
+            stop (Tuple[int, int, int]): The Ethiopian date after the range.
+            chunk_size (int, optional): Expand this many years at a time. Defaults to all
+                at once.
+            progress (Callable[[Progress], None], optional): Called after each chunk, with
+                the years done.
+            cancel (CancellationToken, optional): Checked before each chunk; raises
+                JobCancelled once cancelled.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The Ethiopian years,
+                months and days of the occurrences in order; requires numpy.
+        """
+        np = import_optional("numpy")
+        year_range = self._year_range(start, stop)
+        first = ETHIOPIAN.to_ordinal(*start)
+        last = ETHIOPIAN.to_ordinal(*stop)
+        chunks = [np.empty(0, dtype=np.int64)]
+        for chunk_start, chunk_stop in iter_chunks(
+            len(year_range), chunk_size, progress, cancel
+        ):
+            years = np.arange(
+                year_range.start + chunk_start,
+                year_range.start + chunk_stop,
+                dtype=np.int64,
+            )
+            ordinals = self._expand_years(years)
+            chunks.append(ordinals[(ordinals >= first) & (ordinals < last)])
+        return ETHIOPIAN.from_ordinal(np.concatenate(chunks))
@@ -0,0 +1,123 @@
+"""
+SQL functions for ``sqlite3`` connections.
+
+Dates are exchanged as ISO 'YYYY-MM-DD' text (a trailing time is ignored), Ethiopian dates
+use the same layout. Every function returns NULL for NULL or invalid input instead of
+aborting the query, and is registered as deterministic so it can be used in indexes and
+generated columns.
+"""
+from datetime import date
+from functools import wraps
+import sqlite3
+from typing import Callable, Optional, Tuple
+
+from .fasting import is_fasting
+from .helper import (
+    AMET_ALEM,
+    calculate_ethiopian_to_gregorian,
+    calculate_gregorian_to_ethiopian,
+    ethiopian_to_ordinal,
+    get_event_anchor,
+    get_month_and_day,
+)
+from .lookups import FastStartingDays
+
+
+def _null_on_error(function: Callable) -> Callable:
+    @wraps(function)
+    def wrapper(*args):
+        if any(arg is None for arg in args):
+            return None
+        try:
+            return function(*args)
+        except (ArithmeticError, AttributeError, TypeError, ValueError):
+            return None
+
+    return wrapper
+
+
+def _parse_iso(text: str) -> Tuple[int, int, int]:
+    year, month, day = str(text)[:10].split("-")
+    return int(year), int(month), int(day)
+
+
+def _format_iso(year: int, month: int, day: int) -> str:
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+def _ethiopian_from_gregorian(text: str) -> Tuple[int, int, int]:
+    return calculate_gregorian_to_ethiopian(*_parse_iso(text))
+
+
+def _event_day_of_year(year: int, event_name: str) -> int:
+    if not 1 <= int(year) <= 9999:
+        raise ValueError("Ethiopian year must be a 4-digit integer")
+    anchor = get_event_anchor(AMET_ALEM + int(year))
+    return anchor + getattr(FastStartingDays, event_name)
+
+
+def eth_from_greg(text: str) -> str:
+    """Convert a Gregorian 'YYYY-MM-DD' date to an Ethiopian 'YYYY-MM-DD' date."""
+    return _format_iso(*_ethiopian_from_gregorian(text))
+
+
+def greg_from_eth(*args) -> str:
+    """Convert an Ethiopian date, as 'YYYY-MM-DD' or year, month, day, to a Gregorian date."""
+    parts = _parse_iso(args[0]) if len(args) == 1 else tuple(map(int, args))
+    return _format_iso(*calculate_ethiopian_to_gregorian(*parts))
+
+
+def eth_event(year: int, event_name: str) -> str:
+    """Get the Ethiopian 'YYYY-MM-DD' date of an event of an Ethiopian year."""
+    day_of_year = _event_day_of_year(year, event_name)
+    return _format_iso(int(year), *get_month_and_day(day_of_year))
+
+
+def greg_event(year: int, event_name: str) -> str:
+    """Get the Gregorian 'YYYY-MM-DD' date of an event of an Ethiopian year."""
+    new_year = ethiopian_to_ordinal(int(year), 1, 1) - 1
+    return date.fromordinal(new_year + _event_day_of_year(year, event_name)).isoformat()
+
+
+# SQL name -> (number of arguments, function)
+FUNCTIONS = {
+    "eth_from_greg": (1, eth_from_greg),
+    "eth_year": (1, lambda text: _ethiopian_from_gregorian(text)[0]),
+    "eth_month": (1, lambda text: _ethiopian_from_gregorian(text)[1]),
+    "eth_day": (1, lambda text: _ethiopian_from_gregorian(text)[2]),
+    "greg_from_eth": (3, greg_from_eth),
+    "eth_event": (2, eth_event),
+    "greg_event": (2, greg_event),
+    "is_fasting": (
+        1,
+        lambda text: int(is_fasting(*_ethiopian_from_gregorian(text))),
+    ),
+}
+
+
+def register_functions(
+    connection: sqlite3.Connection, prefix: Optional[str] = None
+) -> None:
+    """
+    Register the Baher Hasab SQL functions on a connection.
+
+    ``greg_from_eth`` is registered with one ('YYYY-MM-DD') and three (year, month, day)
+    arguments.
+
+    Args:
+        connection (sqlite3.Connection): The connection to register the functions on.
+        prefix (str): An optional prefix for the SQL names, e.g. 'bh_'.
+    """
+    functions = [
+        (name, nargs, function) for name, (nargs, function) in FUNCTIONS.items()
+    ]
+    functions.append(("greg_from_eth", 1, greg_from_eth))
+    for name, nargs, function in functions:
+        sql_name = (prefix or "") + name
+        try:
+            connection.create_function(
+                sql_name, nargs, _null_on_error(function), deterministic=True
+            )
+        except (TypeError, sqlite3.NotSupportedError):
+            # Python < 3.8 or SQLite < 3.8.3: usable in queries, but not in indexes
+            connection.create_function(sql_name, nargs, _null_on_error(function))
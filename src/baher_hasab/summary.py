@@ -0,0 +1,315 @@
+from dataclasses import dataclass
+import struct
+import json
+from itertools import islice
+from typing import IO, Any, Dict, Iterator, Iterable, List, Optional, Tuple, Union
+
+from .baher_hasab import BaherHasab
+from .helper import calculate_days_to_nenewe, get_event_anchor, get_month_and_day
+from .formatting import get_format
+from .lookups import DaysBookmark, FastStartingDays
+from .progress import CancellationToken, ProgressCallback, iter_chunks
+from .tables import EVENT_NAMES
+
+# year, total years, wember, abketa, metke, first day, nenewe (month, day),
+# (month, day) of every event, then (ith, passed, remaining) of each awde
+SUMMARY_FORMAT = struct.Struct("<HHBBBBBB" + "BB" * len(EVENT_NAMES) + "HHH" * 3)
+
+
+@dataclass(frozen=True)
+class YearSummary:
+    """Every Baher Hasab value of an Ethiopian year in a fixed, packable layout."""
+
+    year: int
+    total_years: int
+    wember: int
+    abketa: int
+    metke: int
+    first_day: int  # index into DaysBookmark
+    nenewe: Tuple[int, int]  # (month, day)
+    events: Tuple[Tuple[int, int], ...]  # (month, day) in EVENT_NAMES order
+    awde_kemer: Tuple[int, int, int]  # (ith, passed, remaining)
+    awde_mahtot: Tuple[int, int, int]
+    awde_tsehay: Tuple[int, int, int]
+
+    @classmethod
+    def from_baher_hasab(cls, baher_hasab: BaherHasab) -> "YearSummary":
+        """
+        Summarize the year of a BaherHasab instance.
+
+        Args:
+            baher_hasab (BaherHasab): The instance to summarize.
+
+        Returns:
+            YearSummary: The summary of the year.
+        """
+        total_years = baher_hasab.get_total_years()
+        anchor = get_event_anchor(total_years)
+        return cls(
+            baher_hasab._given_year,
+            total_years,
+            baher_hasab.get_wember(),
+            baher_hasab.get_abketa(),
+            baher_hasab.get_metke(),
+            getattr(DaysBookmark, baher_hasab.get_first_day_of_year()),
+            get_month_and_day(anchor),
+            tuple(
+                get_month_and_day(anchor + getattr(FastStartingDays, event))
+                for event in EVENT_NAMES
+            ),
+            baher_hasab.get_awde_kemer(),
+            baher_hasab.get_awde_mahtot(),
+            baher_hasab.get_awde_tsehay(),
+        )
+
+    @classmethod
+    def for_year(cls, given_year: int) -> "YearSummary":
+        """
+        Summarize an Ethiopian year.
+
+        Args:
+            given_year (int): The year in the Ethiopian calendar.
+
+        Returns:
+            YearSummary: The summary of the year.
+        """
+        return cls.from_baher_hasab(BaherHasab(given_year=given_year))
+
+    def get_event(self, event_name: str) -> Tuple[int, int]:
+        """
+        Get the date of an event.
+
+        Args:
+            event_name (str): The name of the event.
+
+        Returns:
+            Tuple[int, int]: The month and day of the event.
+        """
+        return self.events[EVENT_NAMES.index(event_name)]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the summary in the layout of ``BaherHasab.to_dict``.
+
+        Returns:
+            Dict[str, Any]: The values of the year, with the dates written as 'Yekatit 14'.
+        """
+        date_format = get_format()
+        summary: Dict[str, Any] = {
+            "year": self.year,
+            "total_years": self.total_years,
+            "wember": self.wember,
+            "abketa": self.abketa,
+            "metke": self.metke,
+            "nenewe": date_format.format(None, *self.nenewe),
+        }
+        for event, (month, day) in zip(EVENT_NAMES, self.events):
+            summary[event] = date_format.format(None, month, day)
+        for name, awde in (
+            ("abiy_kemer", self.awde_kemer),
+            ("awde_mahtot", self.awde_mahtot),
+            ("awde_tsehay", self.awde_tsehay),
+        ):
+            summary[name] = dict(zip(("ith", "passed", "remaining"), awde))
+        return summary
+
+    def pack(self) -> bytes:
+        """
+        Pack the summary into its fixed-size binary form.
+
+        Returns:
+            bytes: ``SUMMARY_FORMAT.size`` bytes.
+        """
+        return SUMMARY_FORMAT.pack(*self._flatten())
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "YearSummary":
+        """
+        Rebuild a summary from the bytes of ``pack``, without recomputing anything.
+
+        Args:
+            data (bytes): The packed summary.
+
+        Returns:
+            YearSummary: The summary.
+        """
+        return cls._from_flat(SUMMARY_FORMAT.unpack(data))
+
+    def _flatten(self) -> Tuple[int, ...]:
+        return (
+            self.year,
+            self.total_years,
+            self.wember,
+            self.abketa,
+            self.metke,
+            self.first_day,
+            *self.nenewe,
+            *(value for event in self.events for value in event),
+            *self.awde_kemer,
+            *self.awde_mahtot,
+            *self.awde_tsehay,
+        )
+
+    @classmethod
+    def _from_flat(cls, values: Tuple[int, ...]) -> "YearSummary":
+        events_end = 8 + 2 * len(EVENT_NAMES)
+        return cls(
+            *values[:6],
+            tuple(values[6:8]),
+            tuple(
+                tuple(values[index : index + 2]) for index in range(8, events_end, 2)
+            ),
+            tuple(values[events_end : events_end + 3]),
+            tuple(values[events_end + 3 : events_end + 6]),
+            tuple(values[events_end + 6 : events_end + 9]),
+        )
+
+
+def pack_years(summaries: Iterable[YearSummary]) -> bytes:
+    """
+    Pack many summaries back to back into a single buffer.
+
+    Args:
+        summaries (Iterable[YearSummary]): The summaries to pack.
+
+    Returns:
+        bytes: ``SUMMARY_FORMAT.size`` bytes per summary.
+    """
+    summaries = list(summaries)
+    buffer = bytearray(SUMMARY_FORMAT.size * len(summaries))
+    for index, summary in enumerate(summaries):
+        SUMMARY_FORMAT.pack_into(buffer, index * SUMMARY_FORMAT.size, *summary._flatten())
+    return bytes(buffer)
+
+
+def unpack_years(buffer: bytes) -> List[YearSummary]:
+    """
+    Unpack a buffer built by ``pack_years``.
+
+    Args:
+        buffer (bytes): The packed summaries.
+
+    Returns:
+        List[YearSummary]: The summaries, in the order they were packed.
+    """
+    if len(buffer) % SUMMARY_FORMAT.size:
+        raise ValueError(
+            f"Buffer size must be a multiple of {SUMMARY_FORMAT.size} bytes"
+        )
+    return [
+        YearSummary._from_flat(values) for values in SUMMARY_FORMAT.iter_unpack(buffer)
+    ]
+
+
+def iter_years(start_year: int, stop_year: int) -> Iterator[YearSummary]:
+    """
+    Yield the summaries of the Ethiopian years in ``range(start_year, stop_year)``.
+
+    Only the first year is computed from scratch; every following year is carried
+    forward from the previous one (wember +1 mod 19, Meskerem 1 one weekday later or
+    two after a leap year, the awde cycles one year further), so a long scan costs a
+    few integer operations per year.
+
+    Args:
+        start_year (int): The first Ethiopian year.
+        stop_year (int): The Ethiopian year after the last one.
+
+    Yields:
+        YearSummary: The summary of each year, in order.
+    """
+    if start_year >= stop_year:
+        return
+    baher_hasab = BaherHasab(given_year=start_year)
+    summary = YearSummary.from_baher_hasab(baher_hasab)
+    yield summary
+
+    lengths = [getattr(FastStartingDays, event) for event in EVENT_NAMES]
+    cycles = (
+        baher_hasab._abiy_kemer,
+        baher_hasab._awde_mahtot,
+        baher_hasab._awde_tsehay,
+    )
+    total_years = summary.total_years
+    wember, abketa, first_day = summary.wember, summary.abketa, summary.first_day
+    awdes = [summary.awde_kemer[:2], summary.awde_mahtot[:2], summary.awde_tsehay[:2]]
+
+    for year in range(start_year + 1, stop_year):
+        total_years += 1
+        wember = (wember + 1) % baher_hasab._awde_abketa
+        abketa = (abketa + 11) % 30 if wember else 0
+        metke = 30 - abketa
+        first_day = (first_day + (2 if total_years % 4 == 0 else 1)) % 7
+
+        metke_day_of_year = metke if metke > 13 else metke + 30
+        # get_day_of_week of Metke; the total days before Meskerem 1 are first_day - 1 (mod 7)
+        day_of_week_of_metke = (first_day - 1 + metke_day_of_year) % 7 + 1
+        anchor = (
+            metke_day_of_year + calculate_days_to_nenewe(day_of_week_of_metke) - 1
+        )
+
+        awdes = [
+            (ith + 1, 0) if passed + 1 == cycle else (ith, passed + 1)
+            for (ith, passed), cycle in zip(awdes, cycles)
+        ]
+
+        summary = YearSummary(
+            year,
+            total_years,
+            wember,
+            abketa,
+            metke,
+            first_day,
+            get_month_and_day(anchor),
+            tuple(get_month_and_day(anchor + length) for length in lengths),
+            *(
+                (ith, passed, cycle - passed)
+                for (ith, passed), cycle in zip(awdes, cycles)
+            ),
+        )
+        yield summary
+
+
+def export_jsonl(
+    destination: Union[str, IO[str]],
+    start_year: int,
+    stop_year: int,
+    chunk_size: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[CancellationToken] = None,
+) -> int:
+    """
+    Write the summary of each Ethiopian year in ``range(start_year, stop_year)`` as one
+    JSON object per line, in the layout of ``BaherHasab.to_dict``.
+
+    The years are computed incrementally with ``iter_years`` and written as they are
+    produced, so memory use does not grow with the range.
+
+    Args:
+        destination (str | file-like): The path or text file to write to.
+        start_year (int): The first Ethiopian year.
+        stop_year (int): The Ethiopian year after the last one.
+        chunk_size (int, optional): Report progress every this many years. Defaults to
+            the whole range.
+        progress (Callable[[Progress], None], optional): Called after each chunk.
+        cancel (CancellationToken, optional): Checked before each chunk; raises
+            JobCancelled once cancelled.
+
+    Returns:
+        int: The number of years written.
+    """
+    if isinstance(destination, str):
+        with open(destination, "w", encoding="utf-8") as file:
+            return export_jsonl(
+                file, start_year, stop_year, chunk_size, progress, cancel
+            )
+
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    summaries = iter_years(start_year, stop_year)
+    count = 0
+    for start, stop in iter_chunks(
+        max(stop_year - start_year, 0), chunk_size, progress, cancel
+    ):
+        for summary in islice(summaries, stop - start):
+            destination.write(encode(summary.to_dict()) + "\n")
+            count += 1
+    return count
@@ -0,0 +1,278 @@
+from bisect import bisect_left
+from dataclasses import dataclass, fields
+from datetime import date
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from .lookups import FastStartingDays
+from .helper import (
+    AMET_ALEM,
+    LAST_DATED_YEAR,
+    UNIX_EPOCH_ORDINAL,
+    ethiopian_to_ordinal,
+    get_event_anchor,
+    get_event_engine,
+    get_month_and_day,
+    import_optional,
+)
+from .progress import CancellationToken, ProgressCallback, iter_chunks
+
+# The movable events in the order they fall within the year
+EVENT_NAMES: Tuple[str, ...] = tuple(event.name for event in fields(FastStartingDays))
+
+# The events repeat every 19 * 28 years: the 19 years of wember times the 28 years
+# after which Meskerem 1 falls on the same weekday again
+EVENT_CYCLE = 532
+
+
+@dataclass(frozen=True)
+class FeastDate:
+    """A movable event of an Ethiopian year with its Gregorian counterpart."""
+
+    year: int
+    event: str
+    month: int
+    day: int
+    gregorian: date
+
+
+def _check_year_range(start_year: int, stop_year: int, last_year: int = 9999) -> None:
+    if not 1 <= start_year <= stop_year <= last_year + 1:
+        raise ValueError(
+            f"Ethiopian years must be between 1 and {last_year} (start <= stop)"
+        )
+
+
+def get_feast_table(
+    start_year: int,
+    stop_year: int,
+    engine: str = "nenewe",
+    chunk_size: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[CancellationToken] = None,
+) -> List[FeastDate]:
+    """
+    Get every movable event of the Ethiopian years in ``range(start_year, stop_year)``.
+
+    The years go up to ``LAST_DATED_YEAR`` (9991), the last one whose events have a
+    ``datetime.date``. Each year's anchor is computed once and every event is placed on it through
+    ordinals, so no date strings are built or parsed.
+
+    Args:
+        start_year (int): The first Ethiopian year.
+        stop_year (int): The Ethiopian year after the last one.
+        engine (str): How the events are calculated, 'nenewe' or 'computus'.
+        chunk_size (int, optional): Compute this many years at a time. Defaults to all
+            at once.
+        progress (Callable[[Progress], None], optional): Called after each chunk, with the
+            years done.
+        cancel (CancellationToken, optional): Checked before each chunk; raises
+            JobCancelled once cancelled.
+
+    Returns:
+        List[FeastDate]: The events ordered by year and then by date.
+    """
+    _check_year_range(start_year, stop_year, LAST_DATED_YEAR)
+    get_event_anchor = get_event_engine(engine)
+    lengths = [getattr(FastStartingDays, event) for event in EVENT_NAMES]
+    table = []
+    for start, stop in iter_chunks(stop_year - start_year, chunk_size, progress, cancel):
+        for year in range(start_year + start, start_year + stop):
+            anchor = get_event_anchor(AMET_ALEM + year)
+            new_year = ethiopian_to_ordinal(year, 1, 1) - 1
+            for event, length in zip(EVENT_NAMES, lengths):
+                day_of_year = anchor + length
+                table.append(
+                    FeastDate(
+                        year,
+                        event,
+                        *get_month_and_day(day_of_year),
+                        date.fromordinal(new_year + day_of_year),
+                    )
+                )
+    return table
+
+
+def get_feast_array(
+    start_year: int,
+    stop_year: int,
+    engine: str = "nenewe",
+    chunk_size: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[CancellationToken] = None,
+):
+    """
+    Get the feast table of ``range(start_year, stop_year)`` as a NumPy structured array.
+
+    Accepts the same years as ``get_feast_table``, up to ``LAST_DATED_YEAR``.
+
+    The whole table is computed with array operations; requires numpy.
+
+    Args:
+        start_year (int): The first Ethiopian year.
+        stop_year (int): The Ethiopian year after the last one.
+        engine (str): How the events are calculated, 'nenewe' or 'computus'.
+        chunk_size (int, optional): Compute this many years at a time. Defaults to all
+            at once.
+        progress (Callable[[Progress], None], optional): Called after each chunk, with the
+            years done.
+        cancel (CancellationToken, optional): Checked before each chunk; raises
+            JobCancelled once cancelled.
+
+    Returns:
+        numpy.ndarray: Records with the fields year, event, month, day and gregorian
+            (``datetime64[D]``), ordered by year and then by date.
+    """
+    np = import_optional("numpy")
+    _check_year_range(start_year, stop_year, LAST_DATED_YEAR)
+    get_event_anchor = get_event_engine(engine)
+    lengths = np.array([getattr(FastStartingDays, event) for event in EVENT_NAMES])
+    rows = len(EVENT_NAMES)
+
+    table = np.empty(
+        (stop_year - start_year) * rows,
+        dtype=[
+            ("year", "i4"),
+            ("event", f"U{max(map(len, EVENT_NAMES))}"),
+            ("month", "i1"),
+            ("day", "i1"),
+            ("gregorian", "datetime64[D]"),
+        ],
+    )
+    for start, stop in iter_chunks(stop_year - start_year, chunk_size, progress, cancel):
+        years = np.arange(start_year + start, start_year + stop, dtype=np.int64)
+        day_of_year = (get_event_anchor(AMET_ALEM + years)[:, None] + lengths).ravel()
+        new_year = np.repeat(ethiopian_to_ordinal(years, 1, 1) - 1, rows)
+        chunk = table[start * rows : stop * rows]
+        chunk["year"] = np.repeat(years, rows)
+        chunk["event"] = np.tile(EVENT_NAMES, len(years))
+        chunk["month"], chunk["day"] = get_month_and_day(day_of_year)
+        chunk["gregorian"] = (new_year + day_of_year - UNIX_EPOCH_ORDINAL).astype(
+            "datetime64[D]"
+        )
+    return table
+
+
+def get_feast_frame(start_year: int, stop_year: int, engine: str = "nenewe"):
+    """
+    Get the feast table of ``range(start_year, stop_year)`` as a pandas DataFrame.
+
+    Args:
+        start_year (int): The first Ethiopian year.
+        stop_year (int): The Ethiopian year after the last one.
+        engine (str): How the events are calculated, 'nenewe' or 'computus'.
+
+    Returns:
+        pandas.DataFrame: The columns of ``get_feast_array``; requires pandas.
+    """
+    pd = import_optional("pandas")
+    return pd.DataFrame(get_feast_array(start_year, stop_year, engine))
+
+
+@lru_cache(maxsize=None)
+def get_event_index() -> Mapping[Tuple[str, int, int], Tuple[int, ...]]:
+    """
+    Get the Ethiopian years 1 to 9999 in which each event falls on each date.
+
+    Only the first ``EVENT_CYCLE`` years are calculated; the others repeat them.
+
+    Returns:
+        Mapping[Tuple[str, int, int], Tuple[int, ...]]: The sorted years of every
+            (event, month, day), Nenewe included; read-only, as it is cached.
+    """
+    lengths = {"nenewe": 0}
+    lengths.update((event, getattr(FastStartingDays, event)) for event in EVENT_NAMES)
+    cycle: Dict[Tuple[str, int, int], List[int]] = {}
+    for year in range(1, EVENT_CYCLE + 1):
+        anchor = get_event_anchor(AMET_ALEM + year)
+        for event, length in lengths.items():
+            day_of_year = anchor + length
+            key = (event, *get_month_and_day(day_of_year))
+            cycle.setdefault(key, []).append(year)
+    return MappingProxyType(
+        {
+            key: tuple(
+                sorted(
+                    year
+                    for first_year in first_years
+                    for year in range(first_year, 10000, EVENT_CYCLE)
+                )
+            )
+            for key, first_years in cycle.items()
+        }
+    )
+
+
+def find_years(
+    event: str, month: int, day: int, start_year: int = 1, stop_year: int = 10000
+) -> List[int]:
+    """
+    Get the Ethiopian years in ``range(start_year, stop_year)`` in which an event falls
+    on a date, e.g. ``find_years('tensae', 8, 1)``.
+
+    Args:
+        event (str): The name of the event, 'nenewe' or one of ``EVENT_NAMES``.
+        month (int): The Ethiopian month.
+        day (int): The Ethiopian day.
+        start_year (int): The first Ethiopian year. Defaults to 1.
+        stop_year (int): The Ethiopian year after the last one. Defaults to 10000.
+
+    Returns:
+        List[int]: The years in increasing order.
+    """
+    if event != "nenewe" and event not in EVENT_NAMES:
+        raise ValueError(f"Unknown event {event!r}")
+    _check_year_range(start_year, stop_year)
+    years = get_event_index().get((event, month, day), ())
+    return list(
+        years[bisect_left(years, start_year) : bisect_left(years, stop_year)]
+    )
+
+
+def get_all_events_array(
+    years,
+    engine: str = "nenewe",
+    chunk_size: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[CancellationToken] = None,
+):
+    """
+    Get every movable event of an array of Ethiopian years, one record per year.
+
+    The batch counterpart of ``BaherHasab.get_all_events``; requires numpy.
+
+    Args:
+        years (array-like): The Ethiopian years.
+        engine (str): How the events are calculated, 'nenewe' or 'computus'.
+        chunk_size (int, optional): Compute this many years at a time. Defaults to all
+            at once.
+        progress (Callable[[Progress], None], optional): Called after each chunk, with the
+            years done.
+        cancel (CancellationToken, optional): Checked before each chunk; raises
+            JobCancelled once cancelled.
+
+    Returns:
+        numpy.ndarray: Records with the field year and a (month, day) field per event,
+            e.g. ``table["tensae"]["month"]``.
+    """
+    np = import_optional("numpy")
+    years = np.asarray(years, dtype=np.int64)
+    if np.any((years < 1) | (years > 9999)):
+        raise ValueError("Ethiopian years must be between 1 and 9999")
+    get_event_anchor = get_event_engine(engine)
+
+    table = np.empty(
+        years.shape,
+        dtype=[("year", "i4")]
+        + [(event, [("month", "i1"), ("day", "i1")]) for event in EVENT_NAMES],
+    )
+    flat_years, flat_table = years.ravel(), table.reshape(-1)
+    for start, stop in iter_chunks(flat_years.size, chunk_size, progress, cancel):
+        chunk_years, chunk = flat_years[start:stop], flat_table[start:stop]
+        anchor = get_event_anchor(AMET_ALEM + chunk_years)
+        chunk["year"] = chunk_years
+        for event in EVENT_NAMES:
+            day_of_year = anchor + getattr(FastStartingDays, event)
+            chunk[event]["month"], chunk[event]["day"] = get_month_and_day(day_of_year)
+    return table
@@ -0,0 +1,349 @@
+"""
+Exhaustive verification of the Ethiopian date conversions.
+
+Every day of a range of Ethiopian years is generated by a reference that walks the
+calendar one day at a time (30-day months, Pagumen of 5 or 6 days) next to
+``datetime.date``. Each engine converts the whole range in both directions and is
+compared to the reference, and its throughput is measured. The years are split into
+chunks that are verified in parallel, one process per core. Requires numpy.
+"""
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import date
+import os
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .bulk import ethiopian_to_gregorian_bulk, gregorian_to_ethiopian_bulk
+from .calendars import ETHIOPIAN, GREGORIAN
+from .convert import datetime64_to_ethiopian, ethiopian_to_datetime64
+from .helper import (
+    LAST_DATED_YEAR,
+    UNIX_EPOCH_ORDINAL,
+    calculate_ethiopian_to_gregorian,
+    calculate_gregorian_to_ethiopian,
+    import_optional,
+)
+from .progress import CancellationToken, JobCancelled, ProgressCallback, ProgressMeter
+
+# Meskerem 1 of the year 1 is August 27 of the year 8 (proleptic Gregorian)
+REFERENCE_EPOCH = date(8, 8, 27).toordinal()
+# The number of examples kept for each engine and direction
+MAX_EXAMPLES = 5
+
+
+def get_reference_days(start_year: int, stop_year: int):
+    """
+    Get every day of the Ethiopian years in ``range(start_year, stop_year)`` by walking
+    the calendar, without the conversion formulas.
+
+    Args:
+        start_year (int): The first Ethiopian year.
+        stop_year (int): The Ethiopian year after the last one.
+
+    Returns:
+        Tuple[numpy.ndarray, ...]: The ordinals, Ethiopian years, months and days, and
+            Gregorian years, months and days of every day.
+    """
+    np = import_optional("numpy")
+    ordinal = REFERENCE_EPOCH + sum(
+        366 if year % 4 == 3 else 365 for year in range(1, start_year)
+    )
+    rows: List[Tuple[int, ...]] = []
+    for year in range(start_year, stop_year):
+        for month in range(1, 14):
+            month_days = 30 if month < 13 else (6 if year % 4 == 3 else 5)
+            for day in range(1, month_days + 1):
+                gregorian = date.fromordinal(ordinal)
+                rows.append(
+                    (
+                        ordinal,
+                        year,
+                        month,
+                        day,
+                        gregorian.year,
+                        gregorian.month,
+                        gregorian.day,
+                    )
+                )
+                ordinal += 1
+    columns = np.array(rows, dtype=np.int64).reshape(-1, 7)
+    return tuple(columns[:, index] for index in range(7))
+
+
+def _scalar_to_ethiopian(ordinals, gregorian):
+    return zip(*(calculate_gregorian_to_ethiopian(*row) for row in zip(*gregorian)))
+
+
+def _scalar_to_ordinals(ethiopian):
+    return [
+        date(*calculate_ethiopian_to_gregorian(*row)).toordinal()
+        for row in zip(*ethiopian)
+    ]
+
+
+def _kernel_to_ethiopian(ordinals, gregorian):
+    return zip(*map(ETHIOPIAN.from_ordinal, ordinals))
+
+
+def _kernel_to_ordinals(ethiopian):
+    return [ETHIOPIAN.to_ordinal(*row) for row in zip(*ethiopian)]
+
+
+def _vectorized_to_ethiopian(ordinals, gregorian):
+    np = import_optional("numpy")
+    days = (np.asarray(ordinals) - UNIX_EPOCH_ORDINAL).astype("datetime64[D]")
+    return datetime64_to_ethiopian(days)
+
+
+def _vectorized_to_ordinals(ethiopian):
+    np = import_optional("numpy")
+    return ethiopian_to_datetime64(*ethiopian).astype(np.int64) + UNIX_EPOCH_ORDINAL
+
+
+def _bulk_to_ethiopian(ordinals, gregorian):
+    # Rows flagged invalid hold the sentinel 0, so they count as mismatches
+    result = gregorian_to_ethiopian_bulk(*gregorian)
+    return result.years, result.months, result.days
+
+
+def _bulk_to_ordinals(ethiopian):
+    np = import_optional("numpy")
+    result = ethiopian_to_gregorian_bulk(*ethiopian)
+    ordinals = GREGORIAN.to_ordinal(result.years, result.months, result.days)
+    return np.where(result.valid, ordinals, 0)
+
+
+def _get_year_starts():
+    np = import_optional("numpy")
+    lengths = np.where(np.arange(1, LAST_DATED_YEAR + 1) % 4 == 3, 366, 365)
+    return REFERENCE_EPOCH + np.concatenate(([0], np.cumsum(lengths)))
+
+
+def _table_to_ethiopian(ordinals, gregorian):
+    np = import_optional("numpy")
+    starts = _get_year_starts()
+    ordinals = np.asarray(ordinals)
+    years = np.searchsorted(starts, ordinals, side="right")
+    day_of_year = ordinals - starts[years - 1]
+    return years, day_of_year // 30 + 1, day_of_year % 30 + 1
+
+
+def _table_to_ordinals(ethiopian):
+    years, months, days = ethiopian
+    return _get_year_starts()[years - 1] + 30 * (months - 1) + days - 1
+
+
+# name -> (Gregorian to Ethiopian, Ethiopian to ordinal)
+ENGINES: Dict[str, Tuple[Callable, Callable]] = {
+    # The public scalar helpers, with validation
+    "scalar": (_scalar_to_ethiopian, _scalar_to_ordinals),
+    # The calendar kernel on Python ints
+    "kernel": (_kernel_to_ethiopian, _kernel_to_ordinals),
+    # The datetime64 functions of baher_hasab.convert
+    "vectorized": (_vectorized_to_ethiopian, _vectorized_to_ordinals),
+    # The validating bulk functions
+    "bulk": (_bulk_to_ethiopian, _bulk_to_ordinals),
+    # A lookup table of the first day of every year
+    "table": (_table_to_ethiopian, _table_to_ordinals),
+}
+
+
+@dataclass
+class EngineResult:
+    """The verification of one engine."""
+
+    to_ethiopian_mismatches: int = 0
+    to_gregorian_mismatches: int = 0
+    seconds: float = 0.0
+    # ('to_ethiopian' | 'to_gregorian', ordinal, expected, got)
+    examples: List[Tuple[str, int, Tuple[int, ...], Tuple[int, ...]]] = field(
+        default_factory=list
+    )
+
+    @property
+    def mismatches(self) -> int:
+        """int: The mismatches in both directions."""
+        return self.to_ethiopian_mismatches + self.to_gregorian_mismatches
+
+    def merge(self, other: "EngineResult") -> None:
+        """
+        Add the result of another chunk.
+
+        Args:
+            other (EngineResult): The result to add.
+        """
+        self.to_ethiopian_mismatches += other.to_ethiopian_mismatches
+        self.to_gregorian_mismatches += other.to_gregorian_mismatches
+        self.seconds += other.seconds
+        self.examples.extend(other.examples[: MAX_EXAMPLES - len(self.examples)])
+
+
+@dataclass
+class VerificationReport:
+    """The verification of every engine over a range of Ethiopian years."""
+
+    start_year: int
+    stop_year: int
+    days: int = 0
+    engines: Dict[str, EngineResult] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """bool: True if no engine has a mismatch."""
+        return all(result.mismatches == 0 for result in self.engines.values())
+
+    def rows_per_second(self, engine: str) -> float:
+        """
+        Get the throughput of an engine, both directions counted.
+
+        Args:
+            engine (str): The name of the engine.
+
+        Returns:
+            float: The conversions per second of one process.
+        """
+        seconds = self.engines[engine].seconds
+        return 2 * self.days / seconds if seconds else float("inf")
+
+    def format(self) -> str:
+        """
+        Format the report as a table, with the throughput relative to the slowest engine.
+
+        Returns:
+            str: The report.
+        """
+        slowest = min(map(self.rows_per_second, self.engines), default=0.0)
+        lines = [
+            f"Ethiopian years {self.start_year}-{self.stop_year - 1}: {self.days} days",
+            f"{'engine':<12}{'mismatches':>12}{'rows/s':>16}{'relative':>10}",
+        ]
+        for name, result in self.engines.items():
+            rate = self.rows_per_second(name)
+            lines.append(
+                f"{name:<12}{result.mismatches:>12}{rate:>16,.0f}{rate / slowest:>9.1f}x"
+            )
+        for name, result in self.engines.items():
+            for direction, ordinal, expected, got in result.examples:
+                lines.append(
+                    f"{name} {direction} of ordinal {ordinal}: expected {expected}, got {got}"
+                )
+        return "\n".join(lines)
+
+
+def _compare(direction, ordinals, expected, got, result: EngineResult) -> int:
+    np = import_optional("numpy")
+    got = [np.asarray(column, dtype=np.int64) for column in got]
+    wrong = np.zeros(len(ordinals), dtype=bool)
+    for expected_column, got_column in zip(expected, got):
+        wrong |= expected_column != got_column
+    for index in np.flatnonzero(wrong)[: MAX_EXAMPLES - len(result.examples)]:
+        result.examples.append(
+            (
+                direction,
+                int(ordinals[index]),
+                tuple(int(column[index]) for column in expected),
+                tuple(int(column[index]) for column in got),
+            )
+        )
+    return int(wrong.sum())
+
+
+def _verify_chunk(
+    years: Tuple[int, int], engines: Sequence[str]
+) -> Tuple[int, Dict[str, EngineResult]]:
+    ordinals, *columns = get_reference_days(*years)
+    ethiopian, gregorian = tuple(columns[:3]), tuple(columns[3:])
+    results = {}
+    for name in engines:
+        to_ethiopian, to_ordinals = ENGINES[name]
+        result = EngineResult()
+        started = time.perf_counter()
+        converted = tuple(to_ethiopian(ordinals, gregorian))
+        back = to_ordinals(ethiopian)
+        result.seconds = time.perf_counter() - started
+        result.to_ethiopian_mismatches = _compare(
+            "to_ethiopian", ordinals, ethiopian, converted, result
+        )
+        result.to_gregorian_mismatches = _compare(
+            "to_gregorian", ordinals, (ordinals,), (back,), result
+        )
+        results[name] = result
+    return len(ordinals), results
+
+
+def verify_conversions(
+    start_year: int = 1,
+    stop_year: int = LAST_DATED_YEAR + 1,
+    engines: Optional[Sequence[str]] = None,
+    workers: Optional[int] = None,
+    chunk_years: int = 250,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[CancellationToken] = None,
+) -> VerificationReport:
+    """
+    Verify every day of the Ethiopian years in ``range(start_year, stop_year)`` through
+    both conversion directions of each engine.
+
+    Args:
+        start_year (int): The first Ethiopian year. Defaults to 1.
+        stop_year (int): The Ethiopian year after the last one. Defaults to every year
+            whose days are all before 10000-01-01.
+        engines (Sequence[str], optional): The names of the engines of ``ENGINES``.
+            Defaults to all of them.
+        workers (int, optional): The number of processes, 1 to verify in this process.
+            Defaults to the number of CPUs.
+        chunk_years (int): The years verified by each task. Defaults to 250.
+        progress (Callable[[Progress], None], optional): Called after each task, with
+            the years verified.
+        cancel (CancellationToken, optional): Checked before each task and as each one
+            finishes; raises JobCancelled once cancelled.
+
+    Returns:
+        VerificationReport: The mismatches and throughput of every engine.
+    """
+    if not 1 <= start_year <= stop_year <= LAST_DATED_YEAR + 1:
+        raise ValueError(f"Ethiopian years must be between 1 and {LAST_DATED_YEAR}")
+    engines = list(ENGINES) if engines is None else list(engines)
+    unknown = set(engines) - set(ENGINES)
+    if unknown:
+        raise ValueError(f"Unknown engines {sorted(unknown)}, expected {sorted(ENGINES)}")
+
+    chunks = [
+        (year, min(year + chunk_years, stop_year))
+        for year in range(start_year, stop_year, chunk_years)
+    ]
+    workers = workers or os.cpu_count() or 1
+    meter = ProgressMeter(stop_year - start_year, progress, cancel)
+    results = {}
+    if workers == 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            meter.check()
+            results[chunk] = _verify_chunk(chunk, engines)
+            meter.update(chunk[1] - chunk[0])
+    else:
+        with ProcessPoolExecutor(min(workers, len(chunks))) as executor:
+            futures = {
+                executor.submit(_verify_chunk, chunk, engines): chunk for chunk in chunks
+            }
+            try:
+                for future in as_completed(futures):
+                    meter.check()
+                    chunk = futures[future]
+                    results[chunk] = future.result()
+                    meter.update(chunk[1] - chunk[0])
+            except JobCancelled:
+                # Drop the tasks that have not started; the running ones finish
+                for future in futures:
+                    future.cancel()
+                raise
+
+    report = VerificationReport(
+        start_year, stop_year, engines={name: EngineResult() for name in engines}
+    )
+    # Merged in year order, so the examples do not depend on which task finished first
+    for days, chunk_results in (results[chunk] for chunk in chunks):
+        report.days += days
+        for name, result in chunk_results.items():
+            report.engines[name].merge(result)
+    return report
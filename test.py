@@ -1,9 +1,84 @@
 import unittest
 import sys
+import io
+import json
 import os
+import pickle
+import socket
+import sqlite3
+import tempfile
+import threading
+from unittest import mock
 sys.path.append(os.path.abspath(os.path.join('..')))
 from baher_hasab.baher_hasab import BaherHasab
-from baher_hasab.helper import add_days, calculate_ethiopian_to_gregorian, calculate_gregorian_to_ethiopian
+from baher_hasab.helper import add_days, calculate_ethiopian_to_gregorian, calculate_gregorian_to_ethiopian, import_optional
+from baher_hasab.helper import cross_check_engines, ethiopian_to_ordinal, get_computus_event_anchor, get_event_anchor
+from baher_hasab.lookups import EthiopianCalendarMonths, MonthlyCommemorations
+from baher_hasab.cli import create_server, handle_query, query, query_many
+from baher_hasab.convert import (
+    datetime64_to_ethiopian,
+    datetime64_to_ethiopian_time,
+    ethiopian_time_to_datetime64,
+    ethiopian_to_datetime64,
+    ethiopian_to_gregorian_date,
+    gregorian_date_to_ethiopian,
+)
+from baher_hasab.fasting import get_fast, get_fasting_seasons, is_fasting
+from baher_hasab.sqlite import register_functions
+from baher_hasab.parquet import convert_arrow, convert_parquet
+from baher_hasab.calendars import (
+    COPTIC,
+    Calendar,
+    ETHIOPIAN,
+    GREGORIAN,
+    JULIAN,
+    convert,
+    convert_many,
+)
+from baher_hasab.business import BusinessCalendar, get_public_holidays
+from baher_hasab.fiscal import FiscalRules, get_fiscal_periods, get_fiscal_periods_ethiopian
+from baher_hasab.grid import get_month_grid, get_year_markers
+from baher_hasab.verify import ENGINES, get_reference_days, verify_conversions
+from baher_hasab.progress import CancellationToken, JobCancelled, iter_chunks
+from baher_hasab.recurrence import Recurrence
+from baher_hasab.bulk import (
+    BAD_DAY,
+    BAD_MONTH,
+    BAD_PAGUMEN_DAY,
+    BAD_YEAR,
+    VALID,
+    convert_bulk,
+    ethiopian_to_gregorian_bulk,
+    gregorian_to_ethiopian_bulk,
+)
+from baher_hasab.formatting import (
+    format_ethiopian_date,
+    from_geez,
+    get_format,
+    parse_ethiopian_date,
+    to_geez,
+)
+from baher_hasab.summary import (
+    SUMMARY_FORMAT,
+    YearSummary,
+    export_jsonl,
+    iter_years,
+    pack_years,
+    unpack_years,
+)
+from baher_hasab.tables import EVENT_NAMES, find_years, get_all_events_array, get_event_index, get_feast_table, get_feast_array
+from datetime import date, datetime, timedelta
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
 
 
 class TestBaherHasab(unittest.TestCase):
@@ -24,6 +99,13 @@ class TestBaherHasab(unittest.TestCase):
         self.assertEqual(calculate_gregorian_to_ethiopian(2024, 4, 30), (2016, 8, 22))
         self.assertEqual(calculate_gregorian_to_ethiopian(2020, 10, 10), (2013, 1, 30))
         self.assertEqual(calculate_gregorian_to_ethiopian(2021, 9, 10), (2013, 13, 5))
+        # The days the pre-kernel formula got wrong
+        self.assertEqual(calculate_gregorian_to_ethiopian(2023, 1, 1), (2015, 4, 23))
+        self.assertEqual(calculate_gregorian_to_ethiopian(2020, 1, 9), (2012, 4, 30))
+        self.assertEqual(calculate_gregorian_to_ethiopian(8, 8, 27), (1, 1, 1))
+        with self.assertRaises(ValueError):
+            calculate_gregorian_to_ethiopian(5, 1, 1)
+        self.assertTrue(handle_query("eth 0005-01-01").startswith("ERR "))
 
     def test_ethiopian_to_gregorian(self):
         self.assertEqual(calculate_ethiopian_to_gregorian(2016, 11, 24), (2024, 7, 31))
@@ -412,5 +494,1055 @@ class TestBaherHasab(unittest.TestCase):
     #     self.assertEqual(result, expected, "Event date should be 'Tir 2'")
 
 
+class TestFeastTable(unittest.TestCase):
+    def test_get_feast_table_matches_get_event_date(self):
+        table = get_feast_table(1960, 1980)
+        self.assertEqual(len(table), 20 * len(EVENT_NAMES))
+        for row in table:
+            month_name = EthiopianCalendarMonths().reverse_mapping[row.month]
+            self.assertEqual(
+                BaherHasab(given_year=row.year).get_event_date(row.event),
+                f"{month_name} {row.day}",
+            )
+            self.assertEqual(
+                calculate_ethiopian_to_gregorian(row.year, row.month, row.day),
+                (row.gregorian.year, row.gregorian.month, row.gregorian.day),
+            )
+
+    def test_get_feast_table_tensae(self):
+        tensae = [row for row in get_feast_table(2016, 2017) if row.event == "tensae"]
+        self.assertEqual(len(tensae), 1)
+        self.assertEqual((tensae[0].month, tensae[0].day), (8, 27))
+        self.assertEqual(tensae[0].gregorian, date(2024, 5, 5))
+
+    def test_get_feast_table_invalid_range(self):
+        with self.assertRaises(ValueError):
+            get_feast_table(0, 10)
+        self.assertEqual(get_feast_table(9990, 9992)[-1].gregorian.year, 9999)
+        with self.assertRaises(ValueError):
+            get_feast_table(9990, 10000)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_get_feast_array_matches_table(self):
+        array = get_feast_array(1900, 2100)
+        table = get_feast_table(1900, 2100)
+        self.assertEqual(len(array), len(table))
+        for record, row in zip(array, table):
+            self.assertEqual(record["year"], row.year)
+            self.assertEqual(record["event"], row.event)
+            self.assertEqual((record["month"], record["day"]), (row.month, row.day))
+            self.assertEqual(record["gregorian"], numpy.datetime64(row.gregorian))
+        self.assertEqual(len(get_feast_array(9990, 9992)), len(get_feast_table(9990, 9992)))
+        with self.assertRaises(ValueError):
+            get_feast_array(9990, 10000)
+
+
+class TestDateConversion(unittest.TestCase):
+    def test_gregorian_to_ethiopian_matches_scalar_functions(self):
+        day = date(1901, 1, 1)
+        while day < date(2101, 1, 1):
+            ethiopian = calculate_gregorian_to_ethiopian(day.year, day.month, day.day)
+            self.assertEqual(gregorian_date_to_ethiopian(day), ethiopian)
+            self.assertEqual(
+                calculate_ethiopian_to_gregorian(*ethiopian),
+                (day.year, day.month, day.day),
+            )
+            day += timedelta(days=1)
+
+    def test_leap_day(self):
+        self.assertEqual(calculate_gregorian_to_ethiopian(2024, 2, 29), (2016, 6, 21))
+        with self.assertRaises(ValueError):
+            calculate_gregorian_to_ethiopian(2023, 2, 29)
+
+    def test_baher_hasab_date_api(self):
+        bh = BaherHasab(given_year=2016)
+        self.assertEqual(bh.gregorian_to_ethiopian(date(2024, 7, 31)), (2016, 11, 24))
+        self.assertEqual(
+            bh.gregorian_to_ethiopian(datetime(2023, 9, 11, 23, 59)), (2015, 13, 6)
+        )
+        self.assertEqual(bh.ethiopian_to_gregorian(2016, 1, 1, as_date=True), date(2023, 9, 12))
+        self.assertEqual(ethiopian_to_gregorian_date(2016, 13, 5), date(2024, 9, 10))
+        self.assertEqual(bh.get_event_gregorian_date("tensae"), date(2024, 5, 5))
+        for args in ((date(1, 1, 1),), (1, 1, 1), (date(8, 8, 26),)):
+            with self.assertRaises(ValueError):
+                bh.gregorian_to_ethiopian(*args)
+        self.assertEqual(bh.gregorian_to_ethiopian(date(8, 8, 27)), (1, 1, 1))
+        self.assertEqual(bh.gregorian_to_ethiopian(date.max), (9992, 2, 21))
+        with self.assertRaises(TypeError):
+            bh.gregorian_to_ethiopian("2024-07-31")
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_datetime64(self):
+        bh = BaherHasab(given_year=2016)
+        self.assertEqual(bh.gregorian_to_ethiopian(numpy.datetime64("2024-07-31T10:00")), (2016, 11, 24))
+        days = numpy.arange("2023-09-01", "2024-10-01", dtype="datetime64[D]")
+        years, months, days_of_month = datetime64_to_ethiopian(days)
+        for value, year, month, day in zip(days, years, months, days_of_month):
+            self.assertEqual(gregorian_date_to_ethiopian(value), (year, month, day))
+        numpy.testing.assert_array_equal(
+            ethiopian_to_datetime64(years, months, days_of_month), days
+        )
+        with self.assertRaises(ValueError):
+            bh.gregorian_to_ethiopian(numpy.datetime64("NaT"))
+        with self.assertRaises(ValueError):
+            gregorian_date_to_ethiopian(numpy.datetime64("10000-01-01"))
+
+
+class TestForYear(unittest.TestCase):
+    def setUp(self):
+        BaherHasab.cache_clear()
+        BaherHasab.set_cache_size(2)
+
+    def tearDown(self):
+        BaherHasab.cache_clear()
+        BaherHasab.set_cache_size(128)
+
+    def test_for_year_matches_instance(self):
+        for year in (1962, 1967, 1972, 1975, 2016):
+            cached = BaherHasab.for_year(year)
+            fresh = BaherHasab(given_year=year)
+            self.assertEqual(str(cached), str(fresh))
+            self.assertEqual(cached.get_nenewe_date(), fresh.get_nenewe_date())
+            self.assertEqual(cached.get_wengelawyan(), fresh.get_wengelawyan())
+            self.assertEqual(
+                cached.get_event_gregorian_date("hudade"),
+                fresh.get_event_gregorian_date("hudade"),
+            )
+
+    def test_for_year_is_shared_and_read_only(self):
+        bh = BaherHasab.for_year(2016)
+        self.assertIs(BaherHasab.for_year(2016), bh)
+        with self.assertRaises(AttributeError):
+            bh._given_year = 2017
+        with self.assertRaises(AttributeError):
+            bh.get_event_date("not_an_event")
+
+    def test_for_year_pickles(self):
+        bh = BaherHasab.for_year(2016)
+        copy = pickle.loads(pickle.dumps(bh))
+        self.assertEqual(copy.get_nenewe_date(), bh.get_nenewe_date())
+        self.assertEqual(copy.get_event_gregorian_date("tensae"), date(2024, 5, 5))
+        with self.assertRaises(AttributeError):
+            copy._given_year = 2017
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_for_year_numpy_integer(self):
+        self.assertIs(BaherHasab.for_year(numpy.int64(2016)), BaherHasab.for_year(2016))
+        with self.assertRaises(TypeError):
+            BaherHasab.for_year(2016.0)
+
+    def test_cache_info(self):
+        BaherHasab.for_year(2015)
+        BaherHasab.for_year(2016)
+        BaherHasab.for_year(2016)
+        BaherHasab.for_year(2017)
+        info = BaherHasab.cache_info()
+        self.assertEqual((info.hits, info.misses, info.maxsize, info.currsize), (1, 3, 2, 2))
+        BaherHasab.for_year(2015)
+        self.assertEqual(BaherHasab.cache_info().misses, 4)
+
+    def test_for_year_range(self):
+        for year in range(9990, 10000):
+            bh = BaherHasab.for_year(year)
+            self.assertEqual(bh.get_all_events(), BaherHasab(given_year=year).get_all_events())
+        self.assertEqual(BaherHasab.for_year(9991).get_event_gregorian_date("dehenet").year, 9999)
+        with self.assertRaises(ValueError):
+            BaherHasab.for_year(9999).get_event_gregorian_date("hudade")
+        for year in (0, -3, 10000):
+            with self.assertRaises(ValueError):
+                BaherHasab.for_year(year)
+        self.assertEqual(BaherHasab.cache_info().currsize, 2)
+
+
+class TestYearSummary(unittest.TestCase):
+    def test_for_year(self):
+        summary = YearSummary.for_year(2016)
+        bh = BaherHasab(given_year=2016)
+        self.assertEqual(
+            (summary.wember, summary.abketa, summary.metke), (10, 20, 10)
+        )
+        self.assertEqual(summary.first_day, 1)  # Tuesday
+        self.assertEqual(summary.get_event("hudade"), (7, 2))
+        self.assertEqual(summary.get_event("tensae"), (8, 27))
+        self.assertEqual(summary.awde_kemer, bh.get_awde_kemer())
+        self.assertEqual(summary.awde_mahtot, bh.get_awde_mahtot())
+        self.assertEqual(summary.awde_tsehay, bh.get_awde_tsehay())
+
+    def test_pack_round_trip(self):
+        summary = YearSummary.for_year(1975)
+        data = summary.pack()
+        self.assertEqual(len(data), SUMMARY_FORMAT.size)
+        self.assertEqual(YearSummary.unpack(data), summary)
+
+    def test_pack_years(self):
+        summaries = [YearSummary.for_year(year) for year in range(1, 10000, 7)]
+        buffer = pack_years(summaries)
+        self.assertEqual(len(buffer), len(summaries) * SUMMARY_FORMAT.size)
+        self.assertEqual(unpack_years(buffer), summaries)
+        with self.assertRaises(ValueError):
+            unpack_years(buffer[:-1])
+
+    def test_iter_years_matches_for_year(self):
+        summaries = list(iter_years(1, 10000))
+        self.assertEqual(len(summaries), 9999)
+        for summary in summaries[::13] + summaries[1955:1980]:
+            self.assertEqual(summary, YearSummary.for_year(summary.year))
+        self.assertEqual(list(iter_years(2016, 2016)), [])
+
+    def test_to_dict(self):
+        summary = BaherHasab(given_year=2016).to_dict()
+        self.assertEqual(summary["nenewe"], "Yekatit 18")
+        self.assertEqual(summary["hudade"], "Megabit 2")
+        self.assertEqual(summary["abiy_kemer"], {"ith": 15, "passed": 68, "remaining": 464})
+        for year in list(range(1, 10000, 37)) + [1947, 2031]:
+            self.assertEqual(YearSummary.for_year(year).to_dict(), BaherHasab(year).to_dict())
+
+    def test_nenewe_last_day_of_month(self):
+        # Nenewe falls on the 30th of Tir in 1947
+        self.assertEqual(BaherHasab(given_year=1947).get_nenewe(), "Tir 30")
+
+    def test_export_jsonl(self):
+        output = io.StringIO()
+        self.assertEqual(export_jsonl(output, 2010, 2020), 10)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 10)
+        self.assertEqual(json.loads(lines[6]), BaherHasab(2016).to_dict())
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "years.jsonl")
+            self.assertEqual(export_jsonl(path, 1, 101), 100)
+            with open(path, encoding="utf-8") as file:
+                self.assertEqual(sum(1 for _ in file), 100)
+
+
+class TestFormatting(unittest.TestCase):
+    def test_geez_numerals(self):
+        self.assertEqual(to_geez(1), "፩")
+        self.assertEqual(to_geez(14), "፲፬")
+        self.assertEqual(to_geez(100), "፻")
+        self.assertEqual(to_geez(2016), "፳፻፲፮")
+        for number in range(1, 10000):
+            self.assertEqual(from_geez(to_geez(number)), number)
+        with self.assertRaises(ValueError):
+            to_geez(0)
+        with self.assertRaises(ValueError):
+            from_geez("abc")
+
+    def test_matches_get_event_date(self):
+        for year in (1962, 1967, 1972, 1975, 2016):
+            summary = YearSummary.for_year(year)
+            bh = BaherHasab(given_year=year)
+            for event, (month, day) in zip(EVENT_NAMES, summary.events):
+                self.assertEqual(format_ethiopian_date(None, month, day), bh.get_event_date(event))
+                self.assertEqual(parse_ethiopian_date(bh.get_event_date(event)), (None, month, day))
+
+    def test_amharic_and_geez(self):
+        self.assertEqual(format_ethiopian_date(2016, 6, 14, "%e %B %Y", "am", True), "፲፬ የካቲት ፳፻፲፮")
+        self.assertEqual(parse_ethiopian_date("፲፬ የካቲት ፳፻፲፮", "%e %B %Y", "am", True), (2016, 6, 14))
+        self.assertEqual(format_ethiopian_date(2016, 1, 3, "%Y-%m-%d"), "2016-01-03")
+        with self.assertRaises(ValueError):
+            parse_ethiopian_date("Yekatit 31")
+        with self.assertRaises(ValueError):
+            parse_ethiopian_date("February 3")
+
+    def test_parse_fixed_widths_and_pagumen(self):
+        self.assertEqual(parse_ethiopian_date("20160614", "%Y%m%d"), (2016, 6, 14))
+        self.assertEqual(parse_ethiopian_date("2015-13-06", "%Y-%m-%d"), (2015, 13, 6))
+        self.assertEqual(parse_ethiopian_date("Pagumen 6"), (None, 13, 6))
+        for text, pattern in (
+            ("Pagumen 7", "%B %e"),
+            ("Pagumen 30", "%B %e"),
+            ("2016-13-06", "%Y-%m-%d"),  # 2016 has 5 days of Pagumen
+            ("2016-1-6", "%Y-%m-%d"),
+            ("Tir 123", "%B %e"),
+        ):
+            with self.assertRaises(ValueError):
+                parse_ethiopian_date(text, pattern)
+
+    def test_many(self):
+        date_format = get_format("%Y/%m/%d")
+        years, months, days = [2016, 2015, 2017], [1, 13, 6], [1, 6, 30]
+        texts = date_format.format_many(years, months, days)
+        self.assertEqual(texts, ["2016/01/01", "2015/13/06", "2017/06/30"])
+        self.assertEqual(date_format.parse_many(texts), (years, months, days))
+
+
+class TestCli(unittest.TestCase):
+    def test_handle_query(self):
+        self.assertEqual(handle_query("eth 2024-07-31"), "OK 2016-11-24")
+        self.assertEqual(handle_query("greg 2015-13-06"), "OK 2023-09-11")
+        self.assertEqual(handle_query("event 2016 tensae"), "OK Miyazia 27")
+        self.assertEqual(handle_query("ping"), "OK pong")
+        self.assertTrue(handle_query("eth 2023-02-29").startswith("ERR "))
+        self.assertTrue(handle_query("event 2016 nothing").startswith("ERR "))
+        self.assertTrue(handle_query("eth 2023-02").startswith("ERR "))
+        self.assertEqual(handle_query(""), "ERR empty query")
+        for line in ("event 2016 __class__", "event 99999999 tensae", "event 0 tensae", "greg 99999999-01-01"):
+            self.assertTrue(handle_query(line).startswith("ERR "), line)
+
+    def test_query_without_daemon(self):
+        with tempfile.TemporaryDirectory() as directory:
+            socket_path = os.path.join(directory, "missing.sock")
+            self.assertEqual(query("event 2016 hudade", socket_path), "OK Megabit 2")
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix sockets are not available")
+    def test_query_through_daemon(self):
+        with tempfile.TemporaryDirectory() as directory:
+            socket_path = os.path.join(directory, "baher_hasab.sock")
+            server = create_server(socket_path)
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            try:
+                answers = list(query_many(["eth 2023-09-12", "event 1975 erget"], socket_path))
+                self.assertEqual(answers, ["OK 2016-01-01", "OK Sene 9"])
+                with self.assertRaises(RuntimeError):
+                    create_server(socket_path)
+                # A socket of another user is never trusted: the queries run in-process
+                with mock.patch("os.getuid", return_value=os.getuid() + 1):
+                    with mock.patch("baher_hasab.cli.handle_query", return_value="OK local") as local:
+                        self.assertEqual(query("ping", socket_path), "OK local")
+                        local.assert_called_once_with("ping")
+                    with self.assertRaises(RuntimeError):
+                        create_server(socket_path)
+            finally:
+                server.shutdown()
+                server.server_close()
+
+
+class TestFasting(unittest.TestCase):
+    def test_get_fasting_seasons(self):
+        seasons = get_fasting_seasons(2016)
+        first, last = seasons["hudade"]
+        self.assertEqual(last - first + 1, 55)
+        self.assertEqual(seasons["nenewe"], (168, 170))  # Yekatit 18 - 20
+
+    def test_get_fast(self):
+        self.assertEqual(get_fast(2016, 7, 2), "hudade")
+        self.assertEqual(get_fast(2016, 8, 26), "hudade")  # the day before Tensae
+        self.assertIsNone(get_fast(2016, 8, 27))  # Tensae
+        self.assertIsNone(get_fast(2016, 9, 2))  # a Friday of the fifty days
+        self.assertEqual(get_fast(2016, 10, 21), "hawaryat")
+        self.assertEqual(get_fast(2016, 11, 12), "friday")
+        self.assertEqual(get_fast(2016, 12, 10), "filseta")
+        self.assertIsNone(get_fast(2016, 12, 16))
+        self.assertTrue(is_fasting(2016, 5, 10))
+
+    def test_genna_after_pagumen_6(self):
+        # 2015 had a Pagumen 6, so Genna 2016 is Tahsas 28 (2024-01-07)
+        for year in (2012, 2016, 2020):
+            self.assertIsNone(get_fast(year, 4, 28))
+            self.assertEqual(get_fast(year, 4, 27), "tsome_nebiyat")
+        self.assertEqual(get_fasting_seasons(2016)["tsome_nebiyat"][1], 117)
+        # Otherwise Genna is Tahsas 29
+        self.assertEqual(get_fast(2017, 4, 28), "tsome_nebiyat")
+        self.assertIsNone(get_fast(2017, 4, 29))
+
+
+class TestSqlite(unittest.TestCase):
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        register_functions(self.connection)
+
+    def tearDown(self):
+        self.connection.close()
+
+    def query(self, sql, *args):
+        return self.connection.execute(sql, args).fetchone()[0]
+
+    def test_functions(self):
+        self.assertEqual(self.query("SELECT eth_from_greg('2024-07-31')"), "2016-11-24")
+        self.assertEqual(self.query("SELECT eth_month('2023-09-11 08:00:00')"), 13)
+        self.assertEqual(self.query("SELECT greg_from_eth(2016, 1, 1)"), "2023-09-12")
+        self.assertEqual(self.query("SELECT greg_from_eth('2015-13-06')"), "2023-09-11")
+        self.assertEqual(self.query("SELECT eth_event(2016, 'tensae')"), "2016-08-27")
+        self.assertEqual(self.query("SELECT greg_event(2016, 'tensae')"), "2024-05-05")
+        self.assertEqual(self.query("SELECT is_fasting('2024-03-20')"), 1)
+        self.assertEqual(self.query("SELECT is_fasting('2024-05-08')"), 0)
+
+    def test_invalid_input_is_null(self):
+        self.assertIsNone(self.query("SELECT eth_from_greg('2023-02-29')"))
+        self.assertIsNone(self.query("SELECT eth_from_greg(NULL)"))
+        self.assertIsNone(self.query("SELECT eth_event(2016, 'nothing')"))
+        for year in (0, -5, 20000, 1000000000000):
+            self.assertIsNone(self.query("SELECT eth_event(?, 'tensae')", year))
+            self.assertIsNone(self.query("SELECT greg_event(?, 'tensae')", year))
+        self.assertIsNone(self.query("SELECT eth_from_greg('0005-01-01')"))
+        self.assertEqual(self.query("SELECT eth_from_greg('0008-08-27')"), "0001-01-01")
+
+    @unittest.skipIf(sqlite3.sqlite_version_info < (3, 31), "needs generated columns")
+    def test_index_and_generated_column(self):
+        self.connection.execute(
+            "CREATE TABLE payments (paid TEXT, "
+            "paid_eth TEXT GENERATED ALWAYS AS (eth_from_greg(paid)) VIRTUAL)"
+        )
+        self.connection.execute("CREATE INDEX payments_year ON payments (eth_year(paid))")
+        self.connection.executemany(
+            "INSERT INTO payments (paid) VALUES (?)",
+            [("2024-01-01",), ("2024-09-11",), ("bad",)],
+        )
+        rows = self.connection.execute(
+            "SELECT paid_eth FROM payments WHERE eth_year(paid) = 2016"
+        ).fetchall()
+        self.assertEqual(rows, [("2016-04-22",)])
+
+
+@unittest.skipIf(pyarrow is None or numpy is None, "pyarrow is not installed")
+class TestParquet(unittest.TestCase):
+    def setUp(self):
+        days = numpy.arange("2023-09-01", "2024-09-30", dtype="datetime64[D]")
+        self.table = pyarrow.table(
+            {
+                "paid": pyarrow.array(days).cast(pyarrow.date32()),
+                "logged": pyarrow.array(days.astype("datetime64[s]")),
+            }
+        )
+
+    def test_no_row_groups(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "empty.parquet")
+            destination = os.path.join(directory, "out.parquet")
+            pyarrow.parquet.ParquetWriter(source, self.table.schema).close()
+            self.assertEqual(pyarrow.parquet.ParquetFile(source).num_row_groups, 0)
+            self.assertEqual(convert_parquet(source, destination, ["paid"], events=True), 0)
+            schema = pyarrow.parquet.read_schema(destination)
+            self.assertEqual(
+                schema.names,
+                ["paid", "logged", "paid_eth_year", "paid_eth_month", "paid_eth_day", "paid_event"],
+            )
+
+    def test_missing_extra_message(self):
+        with self.assertRaisesRegex(ImportError, r"baher_hasab\[pyarrow\]"):
+            import_optional("pyarrow.missing_module", "pyarrow")
+
+    def test_convert_arrow(self):
+        converted = convert_arrow(self.table, ["paid", "logged"], events=True)
+        for row in converted.to_pylist():
+            self.assertEqual(
+                (row["paid_eth_year"], row["paid_eth_month"], row["paid_eth_day"]),
+                gregorian_date_to_ethiopian(row["paid"]),
+            )
+            self.assertEqual(row["paid_eth_day"], row["logged_eth_day"])
+        events = {
+            row["paid"]: row["paid_event"]
+            for row in converted.to_pylist()
+            if row["paid_event"] is not None
+        }
+        self.assertEqual(len(events), len(EVENT_NAMES))
+        self.assertEqual(events[date(2024, 5, 5)], "tensae")
+
+    def test_convert_arrow_nulls(self):
+        table = pyarrow.table({"paid": pyarrow.array([date(2024, 5, 5), None])})
+        converted = convert_arrow(table, ["paid"], events=True).to_pylist()
+        self.assertEqual(converted[0]["paid_eth_month"], 8)
+        self.assertIsNone(converted[1]["paid_eth_year"])
+        self.assertIsNone(converted[1]["paid_event"])
+
+    def test_convert_parquet_by_row_group(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "in.parquet")
+            destination = os.path.join(directory, "out.parquet")
+            pyarrow.parquet.write_table(self.table, source, row_group_size=100)
+            rows = convert_parquet(source, destination, ["paid"])
+            self.assertEqual(rows, self.table.num_rows)
+            converted = pyarrow.parquet.ParquetFile(destination)
+            self.assertEqual(converted.num_row_groups, 4)
+            self.assertEqual(
+                converted.read().column("paid_eth_year").to_pylist()[-1], 2017
+            )
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestBulk(unittest.TestCase):
+    def test_gregorian_to_ethiopian_bulk(self):
+        result = gregorian_to_ethiopian_bulk(
+            [2024, 2023, 2024, 0, 2024], [7, 2, 2, 1, 13], [31, 29, 29, 1, 1]
+        )
+        self.assertEqual(result.errors.tolist(), [VALID, BAD_DAY, VALID, BAD_YEAR, BAD_MONTH])
+        self.assertEqual(result.valid.tolist(), [True, False, True, False, False])
+        self.assertEqual(result.years.tolist(), [2016, 0, 2016, 0, 0])
+        self.assertEqual(result.months.tolist(), [11, 0, 6, 0, 0])
+        self.assertEqual(result.days.tolist(), [24, 0, 21, 0, 0])
+        self.assertEqual(
+            result.summary(),
+            {"valid": 2, "out_of_range": 1, "bad_month": 1, "bad_day": 1, "bad_pagumen_day": 0},
+        )
+
+    def test_out_of_range_target(self):
+        # Dates before Meskerem 1 of the year 1 (0008-08-27) have no Ethiopian year
+        result = gregorian_to_ethiopian_bulk([5, 8, 8], [1, 8, 8], [1, 26, 27])
+        self.assertEqual(result.errors.tolist(), [BAD_YEAR, BAD_YEAR, VALID])
+        self.assertEqual(result.years.tolist(), [0, 0, 1])
+        self.assertEqual(result.summary()["out_of_range"], 2)
+        # Ethiopian 9999 ends in the Gregorian year 10007
+        result = ethiopian_to_gregorian_bulk([9999, 9991], [13, 13], [5, 5])
+        self.assertEqual(result.errors.tolist(), [BAD_YEAR, VALID])
+
+    def test_ethiopian_to_gregorian_bulk(self):
+        result = ethiopian_to_gregorian_bulk([2016, 2015, 2016, 2016], [11, 13, 13, 5], [24, 6, 6, 31])
+        self.assertEqual(result.errors.tolist(), [VALID, VALID, BAD_PAGUMEN_DAY, BAD_DAY])
+        self.assertEqual(result.years.tolist(), [2024, 2023, 0, 0])
+        self.assertEqual(result.months.tolist(), [7, 9, 0, 0])
+        self.assertEqual(result.days.tolist(), [31, 11, 0, 0])
+
+    def test_bulk_matches_scalar(self):
+        days = numpy.arange("1990-01-01", "2030-01-01", dtype="datetime64[D]")
+        years = days.astype("datetime64[Y]")
+        months = days.astype("datetime64[M]")
+        gregorian = (
+            years.astype(int) + 1970,
+            (months - years).astype(int) + 1,
+            (days - months).astype(int) + 1,
+        )
+        ethiopian = gregorian_to_ethiopian_bulk(*gregorian)
+        self.assertTrue(ethiopian.valid.all())
+        for index in range(0, len(days), 97):
+            self.assertEqual(
+                (ethiopian.years[index], ethiopian.months[index], ethiopian.days[index]),
+                calculate_gregorian_to_ethiopian(*(column[index] for column in gregorian)),
+            )
+        back = ethiopian_to_gregorian_bulk(ethiopian.years, ethiopian.months, ethiopian.days)
+        for expected, column in zip(gregorian, (back.years, back.months, back.days)):
+            numpy.testing.assert_array_equal(column, expected)
+
+
+class TestCalendars(unittest.TestCase):
+    def test_gregorian_matches_datetime(self):
+        for ordinal in list(range(1, 200000, 7)) + list(range(3500000, 3652060, 3)):
+            day = date.fromordinal(ordinal)
+            self.assertEqual(GREGORIAN.from_ordinal(ordinal), (day.year, day.month, day.day))
+            self.assertEqual(GREGORIAN.to_ordinal(day.year, day.month, day.day), ordinal)
+
+    def test_abstract_base(self):
+        with self.assertRaises(TypeError):
+            Calendar()
+
+    def test_round_trips(self):
+        for calendar in (ETHIOPIAN, COPTIC, JULIAN):
+            for ordinal in range(1, 3652060, 101):
+                self.assertEqual(calendar.to_ordinal(*calendar.from_ordinal(ordinal)), ordinal)
+
+    def test_convert(self):
+        self.assertEqual(convert(2016, 1, 1, "ethiopian", "coptic"), (1740, 1, 1))
+        self.assertEqual(convert(2024, 1, 7, "gregorian", "julian"), (2023, 12, 25))
+        self.assertEqual(convert(2023, 12, 25, JULIAN, ETHIOPIAN), (2016, 4, 28))
+        self.assertEqual(convert(1739, 13, 6, "coptic", "gregorian"), (2023, 9, 11))
+        with self.assertRaises(ValueError):
+            convert(1900, 2, 29, "gregorian", "ethiopian")
+        self.assertEqual(convert(1900, 2, 29, "julian", "gregorian"), (1900, 3, 13))
+        with self.assertRaises(ValueError):
+            convert(2016, 1, 1, "ethiopian", "hebrew")
+
+    def test_month_days(self):
+        self.assertEqual([GREGORIAN.month_days(2024, month) for month in range(1, 13)],
+                         [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+        self.assertEqual(JULIAN.month_days(1900, 2), 29)
+        self.assertEqual(ETHIOPIAN.month_days(2015, 13), 6)
+        self.assertEqual(ETHIOPIAN.month_days(2016, 13), 5)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_convert_many(self):
+        years, months, days = convert_many([2016, 2017], [1, 13], [1, 5], "ethiopian", "gregorian")
+        self.assertEqual(list(zip(years, months, days)), [(2023, 9, 12), (2025, 9, 10)])
+        result = convert_bulk([1740, 1740], [13, 13], [5, 6], "coptic", "julian")
+        self.assertEqual(result.errors.tolist(), [VALID, BAD_PAGUMEN_DAY])
+        self.assertEqual((result.years[0], result.months[0], result.days[0]), (2024, 8, 28))
+
+
+class TestEngines(unittest.TestCase):
+    def test_cross_check_full_range(self):
+        self.assertEqual(cross_check_engines(1, 10000), [])
+
+    def test_computus_engine(self):
+        for year in (1962, 1967, 1972, 1975, 2016):
+            nenewe = BaherHasab(given_year=year)
+            computus = BaherHasab(given_year=year, engine="computus")
+            self.assertEqual(str(computus), str(nenewe))
+            self.assertEqual(computus.get_dehenet(), nenewe.get_dehenet())
+            self.assertEqual(
+                computus.get_event_gregorian_date("tensae"),
+                nenewe.get_event_gregorian_date("tensae"),
+            )
+        self.assertEqual(
+            get_feast_table(1900, 2000, engine="computus"), get_feast_table(1900, 2000)
+        )
+        with self.assertRaises(ValueError):
+            BaherHasab(given_year=2016, engine="gregorian")
+
+    def test_computus_anchor_tensae(self):
+        # Tensae 2016 is Miyazia 27, the 237th day of the year
+        self.assertEqual(get_computus_event_anchor(7516) + 69, 237)
+        self.assertEqual(get_computus_event_anchor(7516), get_event_anchor(7516))
+
+
+
+class TestBusinessDays(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.calendar = BusinessCalendar(2010, 2030)
+
+    def test_public_holidays(self):
+        holidays = get_public_holidays(2016)
+        self.assertEqual(holidays["seklet"], (8, 25))
+        self.assertEqual(holidays["tensae"], (8, 27))
+        self.assertEqual(holidays["genna"], (4, 28))  # 2024-01-07
+        self.assertEqual(get_public_holidays(2017)["genna"], (4, 29))
+        self.assertEqual(get_public_holidays(2016)["labour_day"], (8, 23))  # 2024-05-01
+
+    def test_offset_and_count(self):
+        self.assertFalse(self.calendar.is_busday(2016, 8, 25))  # Seklet
+        self.assertTrue(self.calendar.is_busday(2016, 8, 24))
+        self.assertFalse(self.calendar.is_busday(2016, 8, 23))  # Labour Day
+        self.assertEqual(self.calendar.busday_offset(2016, 8, 24, 1), (2016, 8, 28))
+        self.assertEqual(self.calendar.busday_offset(2016, 8, 28, -1), (2016, 8, 24))
+        self.assertEqual(
+            self.calendar.busday_offset(2016, 8, 25, 0, roll="backward"), (2016, 8, 24)
+        )
+        with self.assertRaises(ValueError):
+            self.calendar.busday_offset(2016, 8, 25, 1)
+        with self.assertRaises(ValueError):
+            self.calendar.busday_offset(2040, 1, 2, 1)
+        self.assertEqual(self.calendar.busday_count((2016, 1, 1), (2017, 1, 1)), 256)
+        self.assertEqual(self.calendar.busday_count((2017, 1, 1), (2016, 1, 1)), -256)
+
+    def test_extra_holidays_and_weekmask(self):
+        calendar = BusinessCalendar(2016, 2017, weekmask="1111110", holidays=[(2016, 8, 24)])
+        self.assertFalse(calendar.is_busday(2016, 8, 24))
+        self.assertTrue(calendar.is_busday(2016, 8, 26))  # Saturday
+        with self.assertRaises(ValueError):
+            BusinessCalendar(weekmask="1111")
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_matches_numpy(self):
+        holidays = [
+            numpy.datetime64(date.fromordinal(ethiopian_to_ordinal(year, *day)))
+            for year in range(2010, 2030)
+            for day in get_public_holidays(year).values()
+        ]
+        start = numpy.datetime64(date.fromordinal(ethiopian_to_ordinal(2016, 3, 7)))
+        offsets = numpy.arange(-300, 300)
+        expected = numpy.busday_offset(start, offsets, roll="forward", holidays=holidays)
+        years, months, days = self.calendar.busday_offset_many(
+            numpy.full(600, 2016), 3, 7, offsets, roll="forward"
+        )
+        for ordinal, year, month, day in zip(expected.astype(object), years, months, days):
+            self.assertEqual(ethiopian_to_ordinal(year, month, day), ordinal.toordinal())
+        counts = self.calendar.busday_count_many(
+            ([2016, 2016], [1, 8], [1, 1]), ([2017, 2016], [1, 9], [1, 1])
+        )
+        self.assertEqual(counts.tolist(), [256, 20])
+        self.assertEqual(
+            self.calendar.is_busday_many([2016] * 3, [8] * 3, [24, 25, 26]).tolist(),
+            [True, False, False],
+        )
+
+
+
+class TestMonthGrid(unittest.TestCase):
+    def test_month_grid(self):
+        grid = get_month_grid(2016, 8)
+        self.assertEqual(grid.name, "Miyazia")
+        self.assertEqual(len(grid.weeks), 5)
+        self.assertTrue(all(len(week) == 7 for week in grid.weeks))
+        self.assertIsNone(grid.weeks[0][0])
+        first = grid.weeks[0][1]
+        self.assertEqual((first.day, first.weekday), (1, 1))
+        self.assertEqual(first.gregorian, date(2024, 4, 9))
+        self.assertEqual(grid.days[24].events, ("seklet",))
+        self.assertEqual(grid.days[26].events, ("tensae", "arbegnoch"))
+        self.assertIs(get_month_grid(2016, 8), grid)
+
+    def test_pagumen_and_first_weekday(self):
+        self.assertEqual(len(get_month_grid(2015, 13).days), 6)
+        self.assertEqual(len(get_month_grid(2016, 13).days), 5)
+        grid = get_month_grid(2016, 1, first_weekday=6)
+        self.assertEqual(grid.weeks[0].index(grid.days[0]), 2)  # Tuesday
+        with self.assertRaises(ValueError):
+            get_month_grid(2016, 14)
+        with self.assertRaises(ValueError):
+            get_month_grid(2016, 1, first_weekday=7)
+        self.assertEqual(get_month_grid(9991, 13).days[-1].gregorian, date(9999, 11, 10))
+        with self.assertRaises(ValueError):
+            get_month_grid(9999, 13)
+
+    def test_year_markers_are_read_only(self):
+        markers = get_year_markers(2016)
+        with self.assertRaises(AttributeError):
+            markers.clear()
+        with self.assertRaises(TypeError):
+            markers[(1, 1)] = ()
+        self.assertEqual(get_month_grid(2016, 8).days[24].events, ("seklet",))
+
+    def test_days_match_conversion(self):
+        for month in range(1, 14):
+            for cell in get_month_grid(2012, month).days:
+                self.assertEqual(
+                    calculate_ethiopian_to_gregorian(2012, month, cell.day),
+                    (cell.gregorian.year, cell.gregorian.month, cell.gregorian.day),
+                )
+                self.assertEqual(cell.gregorian.weekday(), cell.weekday)
+
+
+
+class TestEventIndex(unittest.TestCase):
+    def test_find_years(self):
+        self.assertEqual(find_years("hudade", 6, 30, 1900, 2100), [1951, 1956, 2035, 2046])
+        self.assertEqual(BaherHasab(given_year=1951).get_event_date("hudade"), "Yekatit 30")
+        self.assertEqual(find_years("tensae", 8, 1, 1931, 1932), [1931])
+        self.assertEqual(find_years("tensae", 6, 1), [])
+        self.assertIn(2016, find_years("nenewe", 6, 18))
+        with self.assertRaises(ValueError):
+            find_years("genna", 4, 29)
+
+    def test_index_matches_feast_table(self):
+        index = get_event_index()
+        self.assertEqual(sum(map(len, index.values())), 9999 * (len(EVENT_NAMES) + 1))
+        for feast in get_feast_table(1, 9992)[::7]:
+            self.assertIn(feast.year, index[(feast.event, feast.month, feast.day)])
+        with self.assertRaises(TypeError):
+            index[("tensae", 8, 1)] = ()
+
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestEthiopianTime(unittest.TestCase):
+    def test_day_starts_at_dawn(self):
+        values = numpy.array(
+            ["2024-05-05T00:30:00", "2024-05-05T03:00:00", "2024-05-05T09:15:07"],
+            dtype="datetime64[s]",
+        )
+        years, months, days, hours, minutes, seconds = datetime64_to_ethiopian_time(values)
+        # 03:30 local is still the night of Miyazia 26; Tensae starts at 06:00 local
+        self.assertEqual(days.tolist(), [26, 27, 27])
+        self.assertEqual(hours.tolist(), [21, 0, 6])
+        self.assertEqual(minutes.tolist(), [30, 0, 15])
+        self.assertEqual(seconds.tolist(), [0, 0, 7])
+        self.assertEqual((years[0], months[0]), (2016, 8))
+
+    def test_round_trip(self):
+        values = numpy.arange(-10**10, 10**10, 987654321, dtype=numpy.int64)
+        for utc_offset in (0, 3 * 3600, numpy.full(len(values), -5 * 3600)):
+            result = datetime64_to_ethiopian_time(values, utc_offset=utc_offset)
+            back = ethiopian_time_to_datetime64(*result, utc_offset=utc_offset)
+            self.assertEqual(back.astype(numpy.int64).tolist(), values.tolist())
+
+    def test_nat(self):
+        values = numpy.array(["2024-05-05T09:15:07", "NaT"], dtype="datetime64[s]")
+        result = datetime64_to_ethiopian_time(values)
+        self.assertEqual([column[0] for column in result], [2016, 8, 27, 6, 15, 7])
+        self.assertEqual([column[1] for column in result], [0] * 6)
+
+
+
+class TestRecurrence(unittest.TestCase):
+    def test_monthly(self):
+        rule = Recurrence.monthly(MonthlyCommemorations.mariam)
+        self.assertEqual(
+            list(rule.occurrences((2016, 11, 1), (2017, 3, 1))),
+            [(2016, 11, 21), (2016, 12, 21), (2017, 1, 21), (2017, 2, 21)],
+        )
+        # Pagumen 6 only exists in 2015
+        sixth = list(Recurrence.monthly(6).occurrences((2015, 12, 1), (2016, 2, 1)))
+        self.assertEqual(sixth, [(2015, 12, 6), (2015, 13, 6), (2016, 1, 6)])
+        with self.assertRaises(ValueError):
+            Recurrence.monthly(31)
+
+    def test_annually_and_relative(self):
+        self.assertEqual(
+            list(Recurrence.annually(13, 6).occurrences((2004, 1, 1), (2016, 1, 1))),
+            [(2007, 13, 6), (2011, 13, 6), (2015, 13, 6)],
+        )
+        self.assertEqual(
+            list(Recurrence.relative("tensae", -1).occurrences((2016, 1, 1), (2017, 1, 1))),
+            [(2016, 8, 26)],
+        )
+        rule = Recurrence.relative("hudade", -400)
+        self.assertEqual(list(rule.occurrences((2014, 5, 1), (2014, 6, 1))), [(2014, 5, 8)])
+        with self.assertRaises(ValueError):
+            Recurrence.relative("genna")
+        with self.assertRaises(ValueError):
+            Recurrence.annually(13, 7)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_expand_matches_occurrences(self):
+        rules = [
+            Recurrence.monthly(6),
+            Recurrence.annually(13, 6),
+            Recurrence.relative("erget", 50),
+            Recurrence.relative("nenewe", -400),
+        ]
+        for rule in rules:
+            years, months, days = rule.expand((1, 1, 1), (9999, 13, 5))
+            self.assertEqual(
+                list(zip(years.tolist(), months.tolist(), days.tolist())),
+                list(rule.occurrences((1, 1, 1), (9999, 13, 5))),
+            )
+
+
+
+class TestAllEvents(unittest.TestCase):
+    def test_get_all_events(self):
+        for year in list(range(1, 10000, 61)) + [2016]:
+            bh = BaherHasab(given_year=year)
+            events = bh.get_all_events()
+            self.assertEqual(list(events), list(EVENT_NAMES))
+            self.assertEqual(events, {event: bh.get_event_date(event) for event in EVENT_NAMES})
+        self.assertEqual(BaherHasab.for_year(2016).get_all_events()["tensae"], "Miyazia 27")
+        self.assertEqual(
+            BaherHasab(given_year=2016, engine="computus").get_all_events(),
+            BaherHasab(given_year=2016).get_all_events(),
+        )
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_get_all_events_array(self):
+        table = get_all_events_array([2016, 1975, 2100])
+        self.assertEqual(table["year"].tolist(), [2016, 1975, 2100])
+        self.assertEqual(table["hudade"][0].tolist(), (7, 2))
+        for record in table:
+            events = BaherHasab(given_year=int(record["year"])).get_all_events()
+            for event in EVENT_NAMES:
+                month, day = record[event].tolist()
+                self.assertEqual(events[event], format_ethiopian_date(None, month, day))
+        with self.assertRaises(ValueError):
+            get_all_events_array([0])
+
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestFiscalPeriods(unittest.TestCase):
+    def test_government_fiscal_year(self):
+        # Hamle 1 2015, Sene 30 2015, Pagumen 6 2015
+        periods = get_fiscal_periods([date(2023, 7, 8), date(2023, 7, 7), date(2023, 9, 11)])
+        self.assertEqual(periods.years.tolist(), [2016, 2015, 2016])
+        self.assertEqual(periods.quarters.tolist(), [1, 4, 1])
+        self.assertEqual(periods.months.tolist(), [1, 12, 2])
+        self.assertEqual(periods.weeks.tolist(), [1, 53, 11])
+        self.assertEqual(periods.key("quarter").tolist(), [20161, 20154, 20161])
+        with self.assertRaises(ValueError):
+            periods.key("day")
+
+    def test_rules(self):
+        rules = FiscalRules(start_month=1, pagumen="own", week_start=6)
+        periods = get_fiscal_periods_ethiopian([2016, 2016, 2016], [1, 12, 13], [1, 30, 5], rules)
+        self.assertEqual(periods.years.tolist(), [2016, 2016, 2016])
+        self.assertEqual(periods.months.tolist(), [1, 12, 13])
+        self.assertEqual(periods.quarters.tolist(), [1, 4, 4])
+        # Meskerem 1 2016 is a Tuesday, so the first week has five days
+        self.assertEqual(periods.weeks.tolist()[0], 1)
+        self.assertEqual(get_fiscal_periods_ethiopian([2016], [1], [6], rules).weeks[0], 2)
+        label = get_fiscal_periods_ethiopian([2016], [11], [1], FiscalRules(label="start"))
+        self.assertEqual(label.years[0], 2016)
+        with self.assertRaises(ValueError):
+            FiscalRules(start_month=13)
+
+    def test_week_54(self):
+        # Fiscal 2016 runs from Saturday 2023-07-08 to Sunday 2024-07-07 (366 days), so
+        # with Sunday weeks its first week is one day long and its last day is week 54
+        rules = FiscalRules(week_start=6)
+        periods = get_fiscal_periods([date(2023, 7, 8), date(2023, 7, 9), date(2024, 7, 7)], rules)
+        self.assertEqual(periods.years.tolist(), [2016, 2016, 2016])
+        self.assertEqual(periods.weeks.tolist(), [1, 2, 54])
+        self.assertEqual(periods.key("week")[-1], 201654)
+
+    def test_matches_conversion(self):
+        values = numpy.arange("2000-01-01", "2030-01-01", dtype="datetime64[D]")
+        periods = get_fiscal_periods(values, FiscalRules(start_month=1))
+        years, months, _ = datetime64_to_ethiopian(values)
+        self.assertEqual(periods.years.tolist(), years.tolist())
+        self.assertEqual(periods.months.tolist(), numpy.minimum(months, 12).tolist())
+
+
+
+class TestProgress(unittest.TestCase):
+    def test_iter_chunks(self):
+        seen = []
+        chunks = list(iter_chunks(10, 4, progress=seen.append))
+        self.assertEqual(chunks, [(0, 4), (4, 8), (8, 10)])
+        self.assertEqual([progress.rows for progress in seen], [4, 8, 10])
+        self.assertEqual(seen[-1].fraction, 1.0)
+        self.assertEqual(list(iter_chunks(0)), [])
+        with self.assertRaises(ValueError):
+            list(iter_chunks(10, 0))
+
+    def test_cancel_between_chunks(self):
+        token = CancellationToken()
+        done = []
+        with self.assertRaises(JobCancelled):
+            for start, stop in iter_chunks(100, 10, cancel=token):
+                done.append(start)
+                if start == 20:
+                    token.cancel()
+        self.assertEqual(done, [0, 10, 20])
+
+    def test_export_jsonl_progress(self):
+        seen = []
+        count = export_jsonl(io.StringIO(), 1, 2001, chunk_size=500, progress=seen.append)
+        self.assertEqual(count, 2000)
+        self.assertEqual([progress.rows for progress in seen], [500, 1000, 1500, 2000])
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_bulk_chunks(self):
+        years = numpy.arange(1, 10001)
+        months = years % 14
+        days = years % 32
+        whole = ethiopian_to_gregorian_bulk(years, months, days)
+        seen = []
+        chunked = ethiopian_to_gregorian_bulk(
+            years, months, days, chunk_size=3000, progress=seen.append
+        )
+        for name in ("years", "months", "days", "errors"):
+            self.assertEqual(getattr(whole, name).tolist(), getattr(chunked, name).tolist())
+        self.assertEqual([progress.rows for progress in seen], [3000, 6000, 9000, 10000])
+
+        token = CancellationToken()
+        token.cancel()
+        with self.assertRaises(JobCancelled):
+            gregorian_to_ethiopian_bulk(years, 1, 1, chunk_size=100, cancel=token)
+
+    @unittest.skipIf(pyarrow is None or numpy is None, "pyarrow is not installed")
+    def test_parquet_progress(self):
+        days = numpy.arange("2023-09-01", "2024-09-30", dtype="datetime64[D]")
+        table = pyarrow.table({"paid": pyarrow.array(days).cast(pyarrow.date32())})
+        token = CancellationToken()
+        seen = []
+
+        def progress(progress):
+            seen.append(progress.rows)
+            if progress.rows >= 200:
+                token.cancel()
+
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "in.parquet")
+            pyarrow.parquet.write_table(table, source, row_group_size=100)
+            with self.assertRaises(JobCancelled):
+                convert_parquet(
+                    source, os.path.join(directory, "out.parquet"), ["paid"],
+                    progress=progress, cancel=token,
+                )
+        self.assertEqual(seen, [100, 200])
+
+    def test_feast_table_chunks(self):
+        seen = []
+        chunked = get_feast_table(2000, 2025, chunk_size=10, progress=seen.append)
+        self.assertEqual(chunked, get_feast_table(2000, 2025))
+        self.assertEqual([progress.rows for progress in seen], [10, 20, 25])
+
+        token = CancellationToken()
+        token.cancel()
+        with self.assertRaises(JobCancelled):
+            get_feast_table(1, 9992, chunk_size=100, cancel=token)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_array_chunks(self):
+        seen = []
+        chunked = get_feast_array(1, 1001, chunk_size=300, progress=seen.append)
+        self.assertEqual(chunked.tolist(), get_feast_array(1, 1001).tolist())
+        self.assertEqual([progress.rows for progress in seen], [300, 600, 900, 1000])
+
+        years = numpy.arange(1, 1001).reshape(10, 100)
+        self.assertEqual(
+            get_all_events_array(years, chunk_size=333).tolist(),
+            get_all_events_array(years).tolist(),
+        )
+
+        days = numpy.arange("2000-01-01", "2030-01-01", dtype="datetime64[D]")
+        whole = datetime64_to_ethiopian(days)
+        chunked = datetime64_to_ethiopian(days, chunk_size=1000)
+        for expected, got in zip(whole, chunked):
+            self.assertEqual(expected.tolist(), got.tolist())
+        self.assertEqual(
+            datetime64_to_ethiopian(numpy.datetime64("2023-09-12")), (2016, 1, 1)
+        )
+
+        whole = get_fiscal_periods(days)
+        chunked = get_fiscal_periods(days, chunk_size=1000)
+        self.assertEqual(whole.key("week").tolist(), chunked.key("week").tolist())
+
+        stamps = numpy.arange(0, 10**9, 7919 * 101, dtype=numpy.int64).astype("datetime64[s]")
+        whole = datetime64_to_ethiopian_time(stamps)
+        chunked = datetime64_to_ethiopian_time(stamps, chunk_size=100)
+        for expected, got in zip(whole, chunked):
+            self.assertEqual(expected.tolist(), got.tolist())
+        self.assertEqual(
+            ethiopian_time_to_datetime64(*whole, chunk_size=100).tolist(), stamps.tolist()
+        )
+        years, months, days_of_month = datetime64_to_ethiopian(days)
+        self.assertEqual(
+            ethiopian_to_datetime64(years, months, days_of_month, chunk_size=1000).tolist(),
+            days.tolist(),
+        )
+        julian = convert_many(years, months, days_of_month, "ethiopian", "julian", chunk_size=1000)
+        for expected, got in zip(convert_many(years, months, days_of_month, "ethiopian", "julian"), julian):
+            self.assertEqual(expected.tolist(), got.tolist())
+
+        rule = Recurrence.monthly(21)
+        seen = []
+        chunked = rule.expand((1, 1, 1), (2000, 1, 1), chunk_size=300, progress=seen.append)
+        for expected, got in zip(rule.expand((1, 1, 1), (2000, 1, 1)), chunked):
+            self.assertEqual(expected.tolist(), got.tolist())
+        self.assertEqual(seen[-1].rows, seen[-1].total)
+
+        token = CancellationToken()
+        token.cancel()
+        for job in (
+            lambda: get_feast_array(1, 9992, chunk_size=100, cancel=token),
+            lambda: datetime64_to_ethiopian_time(stamps, chunk_size=100, cancel=token),
+            lambda: ethiopian_to_datetime64(years, months, days_of_month, chunk_size=100, cancel=token),
+            lambda: convert_many(years, 1, 1, "ethiopian", "coptic", chunk_size=100, cancel=token),
+            lambda: rule.expand((1, 1, 1), (2000, 1, 1), chunk_size=100, cancel=token),
+            lambda: get_all_events_array(years, chunk_size=100, cancel=token),
+            lambda: datetime64_to_ethiopian(days, chunk_size=100, cancel=token),
+            lambda: get_fiscal_periods(days, chunk_size=100, cancel=token),
+        ):
+            with self.assertRaises(JobCancelled):
+                job()
+
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestVerification(unittest.TestCase):
+    def test_reference_days(self):
+        ordinals, years, months, days, *gregorian = get_reference_days(2015, 2017)
+        self.assertEqual(len(ordinals), 366 + 365)
+        self.assertEqual(date.fromordinal(int(ordinals[0])), date(2022, 9, 11))
+        self.assertEqual((years[365], months[365], days[365]), (2015, 13, 6))
+        self.assertEqual([column[-1] for column in gregorian], [2024, 9, 10])
+
+    def test_every_engine_matches(self):
+        report = verify_conversions(1, 30, workers=1)
+        self.assertTrue(report.ok, report.format())
+        self.assertEqual(report.days, 29 * 365 + 7)
+        self.assertEqual(set(report.engines), set(ENGINES))
+        self.assertIn("scalar", report.format())
+        report = verify_conversions(9900, 9992, engines=["table", "vectorized"], workers=2, chunk_years=40)
+        self.assertTrue(report.ok, report.format())
+
+    def test_mismatches_are_reported(self):
+        to_ethiopian, to_ordinals = ENGINES["kernel"]
+        ENGINES["broken"] = (
+            to_ethiopian,
+            lambda ethiopian: [ordinal + (ordinal % 100 == 0) for ordinal in to_ordinals(ethiopian)],
+        )
+        try:
+            report = verify_conversions(2000, 2010, engines=["broken"], workers=1)
+        finally:
+            del ENGINES["broken"]
+        result = report.engines["broken"]
+        self.assertFalse(report.ok)
+        self.assertEqual(result.to_ethiopian_mismatches, 0)
+        self.assertGreater(result.to_gregorian_mismatches, 30)
+        self.assertEqual(len(result.examples), 5)
+        with self.assertRaises(ValueError):
+            verify_conversions(engines=["missing"])
+
+    def test_progress_and_cancel(self):
+        seen = []
+        verify_conversions(1, 21, engines=["table"], workers=1, chunk_years=5, progress=seen.append)
+        self.assertEqual([progress.rows for progress in seen], [5, 10, 15, 20])
+        token = CancellationToken()
+        token.cancel()
+        for workers in (1, 2):
+            with self.assertRaises(JobCancelled):
+                verify_conversions(1, 21, workers=workers, chunk_years=5, cancel=token)
+
+
 if __name__ == "__main__":
     unittest.main()